@@ -0,0 +1,90 @@
+"""Адаптивная глубина переранжирования кандидатов TF-IDF
+
+Глубина выбирается по распределению TF-IDF оценок запроса:
+- переранжирование останавливается, когда калиброванная верхняя граница
+  комбинированного сходства для оставшихся кандидатов ниже текущего лучшего;
+- окно расширяется, когда оценки "плоские" и порядок TF-IDF мало что говорит.
+
+Граница калибруется на выборке пар (косинус TF-IDF, комбинированное сходство):
+для каждого интервала косинуса берется максимум наблюдаемого сходства
+(монотонная огибающая) плюс запас.
+"""
+import threading
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+
+class AdaptiveRerank:
+    """Политика глубины переранжирования и ее телеметрия"""
+
+    def __init__(self, bins: int = 20, margin: float = 0.05, flat_gap: float = 0.05, widen_factor: int = 3):
+        self.bins = bins
+        self.margin = margin
+        self.flat_gap = flat_gap
+        self.widen_factor = widen_factor
+        # До калибровки граница не отсекает ничего
+        self.envelope = np.full(bins, np.inf)
+        self._lock = threading.Lock()
+        self.stats: Dict[str, object] = {}
+        self.reset_stats()
+
+    def calibrate(self, pairs: Iterable[Tuple[float, float]]) -> int:
+        """Строит огибающую max(комбинированное сходство | косинус TF-IDF) по парам"""
+        envelope = np.zeros(self.bins)
+        count = 0
+        for tfidf_score, combined_score in pairs:
+            bin_idx = min(int(max(tfidf_score, 0.0) * self.bins), self.bins - 1)
+            envelope[bin_idx] = max(envelope[bin_idx], combined_score)
+            count += 1
+        if count:
+            # Огибающая не убывает по косинусу, к ней добавляется запас
+            self.envelope = np.minimum(np.maximum.accumulate(envelope) + self.margin, 1.0)
+        return count
+
+    def bound(self, tfidf_score: float) -> float:
+        """Верхняя граница комбинированного сходства для кандидата с данным косинусом"""
+        return self.envelope[min(int(max(tfidf_score, 0.0) * self.bins), self.bins - 1)]
+
+    def depth(self, scores: np.ndarray, base_depth: int) -> Tuple[int, bool]:
+        """Глубина окна для отсортированных по убыванию оценок и признак расширения"""
+        available = len(scores)
+        if available <= base_depth:
+            return available, False
+        # Плоские оценки: разрыв между первым и последним кандидатом окна мал
+        if scores[0] - scores[base_depth - 1] < self.flat_gap:
+            return min(available, base_depth * self.widen_factor), True
+        return base_depth, False
+
+    def reset_stats(self):
+        """Сброс телеметрии"""
+        with self._lock:
+            self.stats = {
+                "queries": 0,
+                "reranked_total": 0,
+                "early_stops": 0,
+                "widened": 0,
+                "widened_changed_answer": 0,
+                "depth_histogram": {}
+            }
+
+    def record(self, reranked: int, early_stop: bool, widened: bool, changed: bool):
+        """Учет одного запроса"""
+        with self._lock:
+            stats = self.stats
+            stats["queries"] += 1
+            stats["reranked_total"] += reranked
+            stats["early_stops"] += int(early_stop)
+            stats["widened"] += int(widened)
+            stats["widened_changed_answer"] += int(widened and changed)
+            histogram = stats["depth_histogram"]
+            histogram[reranked] = histogram.get(reranked, 0) + 1
+
+    def snapshot(self) -> Dict[str, object]:
+        """Копия телеметрии для /health"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["depth_histogram"] = dict(sorted(self.stats["depth_histogram"].items()))
+        queries = stats["queries"] or 1
+        stats["mean_depth"] = stats["reranked_total"] / queries
+        return stats
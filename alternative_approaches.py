@@ -14,6 +14,7 @@ import os
 from difflib import SequenceMatcher
 from collections import Counter
 import string
+from phrase_corpus import load_phrases
 
 # Настройка логирования
 logging.basicConfig(level=logging.INFO)
@@ -24,17 +25,8 @@ tfidf_vectorizer = None
 phrases_list = None
 phrases_tfidf_matrix = None
 
-# База фраз автоответчиков (используем ту же базу)
-phrases_db: Set[str] = {
-    "Здравствуйте это сбербанк я ваш виртуальный ассистент",
-    "Буквально секундочку не совсем понимаю вас",
-    "Можно ли соединить со специалистом",
-    "Мхатовскую паузу",
-    "Поиграем сейчас я сделаю мхатовскую паузу если не успеете положить трубку то вы проиграли вы проиграли до свидания",
-    "Секундочку связь шалит продолжайте",
-    "Я слышу тишину",
-    "Ласковое слово дороже рубля"
-}
+# База фраз автоответчиков (общее хранилище data/phrases.bin)
+phrases_db: Set[str] = load_phrases()
 
 class TextPreprocessor:
     """Класс для предобработки текста"""
@@ -0,0 +1,97 @@
+"""Сопоставление с бюджетом времени (anytime matching)
+
+При перегрузке приближенный вердикт вовремя полезнее точного с опозданием.
+Расчет идет этапами от дешевых к дорогим:
+    exact  - точное совпадение нормализованной фразы (поиск в словаре)
+    tfidf  - кандидаты по косинусу TF-IDF
+    rerank - уточнение кандидатов комбинированным сходством
+    scan   - полный перебор базы (main_alternative.py)
+Дорогой этап начинается и продолжается, только пока остается бюджет; ответ -
+лучший найденный к этому моменту. Выполненные этапы возвращаются в stages_run,
+прерванный этап помечается суффиксом _partial, а последний элемент
+budget_exhausted означает, что ответ приближенный (такой ответ не кэшируется).
+
+Бюджет подстраивается под очередь пула: без очереди расчет не ограничен,
+с ростом очереди на воркер бюджет уменьшается. Срок ответа клиента
+(X-Deadline-Ms) дополнительно ограничивает бюджет. В микропакете каждый
+запрос получает долю бюджета пакета (item_budget): остаток делится поровну
+между еще не посчитанными запросами, поэтому пакет укладывается в бюджет,
+отведенный контролем нагрузки, а запросы в конце пакета не остаются без него.
+"""
+import os
+import time
+from typing import List, Optional
+
+from match_pool import MatchPool, request_deadline
+
+ANYTIME_MATCHING = os.getenv("ANYTIME_MATCHING", "1") == "1"
+ANYTIME_BUDGET_MS = float(os.getenv("ANYTIME_BUDGET_MS", "50"))  # бюджет при одной задаче в очереди на воркер
+ANYTIME_MIN_BUDGET_MS = float(os.getenv("ANYTIME_MIN_BUDGET_MS", "2"))  # меньше бюджет не становится
+
+STAGE_EXACT = "exact"
+STAGE_TFIDF = "tfidf"
+STAGE_RERANK = "rerank"
+STAGE_SCAN = "scan"
+STAGE_BUDGET_EXHAUSTED = "budget_exhausted"
+
+
+class MatchBudget:
+    """Бюджет времени одного расчета; отсчет начинается с start() в воркере"""
+
+    def __init__(self, seconds: Optional[float] = None, deadline: Optional[float] = None):
+        self.seconds = seconds
+        self.deadline = deadline
+        self.expires_at: Optional[float] = None
+
+    def start(self) -> "MatchBudget":
+        """Начало отсчета; ожидание в очереди пула в бюджет не входит, срок ответа - входит"""
+        if self.expires_at is None:
+            limits = [self.deadline] if self.deadline is not None else []
+            if self.seconds is not None:
+                limits.append(time.time() + self.seconds)
+            self.expires_at = min(limits) if limits else float("inf")
+        return self
+
+    def exhausted(self) -> bool:
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+
+def item_budget(budget: Optional[MatchBudget], items_left: int) -> Optional[MatchBudget]:
+    """Доля бюджета пакета для очередного запроса: остаток поровну на оставшиеся запросы
+
+    Доля не меньше ANYTIME_MIN_BUDGET_MS, срок ответа общий. Неиспользованный
+    остаток быстрых запросов переходит к следующим.
+    """
+    if budget is None:
+        return None
+    budget.start()
+    if budget.expires_at == float("inf"):
+        return budget
+    remaining = budget.expires_at - time.time()
+    seconds = max(ANYTIME_MIN_BUDGET_MS / 1000.0, remaining / max(1, items_left))
+    return MatchBudget(seconds, budget.deadline).start()
+
+
+def budget_exhausted(budget: Optional[MatchBudget]) -> bool:
+    """Бюджет задан и исчерпан"""
+    return budget is not None and budget.exhausted()
+
+
+def is_degraded(stages_run: Optional[List[str]]) -> bool:
+    """Ответ получен не всеми этапами из-за бюджета"""
+    return bool(stages_run) and stages_run[-1] == STAGE_BUDGET_EXHAUSTED
+
+
+def current_budget(pool: Optional[MatchPool]) -> Optional[MatchBudget]:
+    """Бюджет нового расчета по очереди пула и сроку ответа текущего запроса"""
+    if not ANYTIME_MATCHING:
+        return None
+    deadline = request_deadline.get()
+    seconds = None
+    if pool is not None:
+        queued_per_worker = max(0, pool.pending - pool.workers) / pool.workers
+        if queued_per_worker > 0:
+            seconds = max(ANYTIME_MIN_BUDGET_MS, ANYTIME_BUDGET_MS / queued_per_worker) / 1000.0
+    if seconds is None and deadline is None:
+        return None
+    return MatchBudget(seconds, deadline)
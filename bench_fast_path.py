@@ -0,0 +1,92 @@
+"""Сравнение /check_phrase и /check_phrase/fast
+
+По умолчанию сервис запускается в этом же процессе (ASGI без сети), а результаты
+сопоставления заранее попадают в кэш: измеряются разбор запроса, валидация
+и сериализация ответа. С --url измеряется работающий сервис по HTTP.
+
+    python bench_fast_path.py --app main_embeddings --requests 5000
+    python bench_fast_path.py --url http://localhost:8001
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import random
+import statistics
+import time
+
+import httpx
+
+
+async def run_endpoint(client: httpx.AsyncClient, path: str, bodies, concurrency: int):
+    """Время всех запросов и задержки отдельных запросов"""
+    latencies = []
+    queue = list(bodies)
+
+    async def worker():
+        while queue:
+            body = queue.pop()
+            start = time.perf_counter()
+            response = await client.post(path, content=body, headers={"Content-Type": "application/json"})
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return time.perf_counter() - start, latencies
+
+
+async def compare(client: httpx.AsyncClient, phrases, requests_count: int, concurrency: int):
+    rng = random.Random(42)
+    bodies = [
+        json.dumps({"phrase": rng.choice(phrases), "threshold": 0.9, "thresholds": [0.7, 0.8]}).encode("utf-8")
+        for _ in range(requests_count)
+    ]
+
+    # Прогрев: результаты сопоставления попадают в кэш, сравнивается только обвязка
+    for phrase in phrases:
+        body = json.dumps({"phrase": phrase, "threshold": 0.9, "thresholds": [0.7, 0.8]}).encode("utf-8")
+        slow = (await client.post("/check_phrase", content=body, headers={"Content-Type": "application/json"})).json()
+        fast = (await client.post("/check_phrase/fast", content=body, headers={"Content-Type": "application/json"})).json()
+        if slow != fast:
+            raise SystemExit(f"Ответы различаются для '{phrase}':\n{slow}\n{fast}")
+
+    print(f"{'эндпоинт':<22}{'запросов/с':>12}{'p50, мс':>10}{'p99, мс':>10}")
+    for path in ("/check_phrase", "/check_phrase/fast"):
+        total, latencies = await run_endpoint(client, path, bodies, concurrency)
+        latencies.sort()
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+        print(f"{path:<22}{requests_count / total:>12.0f}{p50:>10.3f}{p99:>10.3f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Сравнение /check_phrase и /check_phrase/fast")
+    parser.add_argument("--app", default="main_embeddings", help="модуль сервиса для запуска в процессе")
+    parser.add_argument("--url", default="", help="адрес работающего сервиса вместо запуска в процессе")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--phrases", type=int, default=50, help="различных фраз в запросах")
+    args = parser.parse_args()
+
+    phrases = [
+        "Здравствуйте это сбербанк я ваш виртуальный ассистент",
+        "Оставьте сообщение после звукового сигнала",
+        "Алло кто это",
+        "Абонент временно недоступен",
+    ]
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=30) as client:
+            await compare(client, phrases, args.requests, args.concurrency)
+        return
+
+    service = importlib.import_module(args.app)
+    async with service.app.router.lifespan_context(service.app):
+        phrases += random.Random(0).sample(service.current_index().phrases_list, max(0, args.phrases - len(phrases)))
+        transport = httpx.ASGITransport(app=service.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await compare(client, phrases, args.requests, args.concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
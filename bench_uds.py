@@ -0,0 +1,116 @@
+"""Задержка запроса через Unix domain socket и через TCP loopback
+
+Сервис запускается в отдельном процессе и слушает оба сокета. Запросы идут
+последовательно (как у webhook: один звонок - один запрос) на /check_phrase/fast
+с заранее посчитанной фразой, поэтому измеряется в основном транспорт. Режим
+"keep-alive" переиспользует соединение, "new" открывает соединение на каждый запрос.
+Для TCP включен TCP_NODELAY, как у fetch в Node.js: иначе заголовки и тело,
+отправленные httpx разными вызовами, ждут отложенного подтверждения (~40 мс).
+
+    python bench_uds.py --app main_embeddings --requests 2000
+    python bench_uds.py --url http://127.0.0.1:8001 --uds /run/phrase-checker/ml.sock
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+BODY = json.dumps({"phrase": "Оставьте сообщение после звукового сигнала", "threshold": 0.9}).encode("utf-8")
+HEADERS = {"Content-Type": "application/json"}
+
+
+def make_client(url: str, uds: str, reuse: bool = True) -> httpx.Client:
+    """Клиент через Unix socket (uds) или TCP; reuse=False - новое соединение на каждый запрос"""
+    limits = httpx.Limits(max_keepalive_connections=None if reuse else 0)
+    if uds:
+        transport = httpx.HTTPTransport(uds=uds, limits=limits)
+        return httpx.Client(transport=transport, base_url="http://localhost", timeout=30)
+    transport = httpx.HTTPTransport(limits=limits, socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)])
+    return httpx.Client(transport=transport, base_url=url, timeout=30)
+
+
+def measure(url: str, uds: str, requests_count: int, reuse: bool):
+    """Задержки последовательных запросов, секунд"""
+    latencies = []
+    with make_client(url, uds, reuse) as client:
+        for _ in range(requests_count):
+            start = time.perf_counter()
+            response = client.post("/check_phrase/fast", content=BODY, headers=HEADERS)
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+    return latencies
+
+
+def wait_ready(url: str, uds: str, process: subprocess.Popen, timeout: float = 120.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process is not None and process.poll() is not None:
+            raise SystemExit(f"Сервис завершился с кодом {process.returncode}")
+        try:
+            with make_client(url, uds) as client:
+                if client.get("/health").status_code == 200:
+                    return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit("Сервис не запустился")
+
+
+def compare(url: str, uds: str, requests_count: int):
+    # Прогрев: результат сопоставления попадает в кэш, соединения и код прогреты
+    for transport_uds in ("", uds):
+        measure(url, transport_uds, 200, reuse=True)
+
+    print(f"{'транспорт':<12}{'соединение':<12}{'среднее, мкс':>14}{'p50, мкс':>10}{'p99, мкс':>10}")
+    for reuse in (True, False):
+        means = {}
+        for name, transport_uds in (("tcp", ""), ("unix", uds)):
+            latencies = sorted(measure(url, transport_uds, requests_count, reuse))
+            means[name] = statistics.mean(latencies)
+            p50 = statistics.median(latencies) * 1e6
+            p99 = latencies[int(len(latencies) * 0.99) - 1] * 1e6
+            print(f"{name:<12}{'keep-alive' if reuse else 'new':<12}{means[name] * 1e6:>14.0f}{p50:>10.0f}{p99:>10.0f}")
+        saving = means["tcp"] - means["unix"]
+        print(f"{'':<24}экономия unix: {saving * 1e6:.0f} мкс на запрос ({saving / means['tcp'] * 100:.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Задержка запроса: Unix domain socket против TCP loopback")
+    parser.add_argument("--app", default="main_embeddings", help="модуль сервиса для запуска")
+    parser.add_argument("--url", default="", help="адрес работающего сервиса (вместе с --uds)")
+    parser.add_argument("--uds", default="", help="Unix socket работающего сервиса")
+    parser.add_argument("--port", type=int, default=18001, help="TCP порт запускаемого сервиса")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    if args.url:
+        if not args.uds:
+            raise SystemExit("Для работающего сервиса нужны и --url, и --uds")
+        wait_ready(args.url, args.uds, None)
+        compare(args.url, args.uds, args.requests)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        uds = os.path.join(directory, "ml.sock")
+        url = f"http://127.0.0.1:{args.port}"
+        env = dict(os.environ, ML_HOST="127.0.0.1", ML_PORT=str(args.port), ML_UDS_PATH=uds)
+        process = subprocess.Popen([sys.executable, f"{args.app}.py"], env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_ready(url, "", process)
+            wait_ready(url, uds, process)
+            compare(url, uds, args.requests)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Потоковая проверка реплик звонка через WebSocket
+
+Вместо отдельного HTTP запроса на каждую реплику звонок открывает одно соединение
+и присылает фрагменты расшифровки:
+    {"text": "здравствуйте это", "final": false}
+    {"text": "сбербанк", "final": true}
+Необязательные поля "threshold" и "thresholds" меняют пороги соединения.
+Соединение с неверным параметром ?threshold= (не число от 0 до 1) закрывается
+с кодом 1008 до принятия.
+
+Фрагменты накапливаются в текущую реплику ("final": true завершает ее).
+Сервер отвечает вердиктом, как только совпадение уверенное (сходство не ниже
+порога), и вердиктом по каждой завершенной реплике:
+    {"utterance": 0, "final": true, "is_answering_machine": true,
+     "similarity_score": 0.93, "matched_phrase": "...", "verdicts": [...],
+     "stages_run": ["exact", "tfidf", "rerank"]}
+
+Если проверку фрагмента не удалось выполнить из-за перегрузки (503) или срока
+ответа (504), соединение остается открытым, а по фрагменту приходит ошибка;
+следующий фрагмент реплики проверяется заново:
+    {"utterance": 0, "final": false, "error": "...", "status": 503}
+Соединение закрывается (1011) только при непредвиденной ошибке.
+
+Состояние соединения позволяет не повторять работу: неизмененный после
+нормализации текст не пересчитывается, промежуточные фрагменты, пришедшие во время
+расчета, заменяются последним, а после обнаружения автоответчика звонок больше не
+проверяется. На соединение одновременно выполняется не больше одного расчета.
+"""
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from match_pool import AdmissionRejected
+
+logger = logging.getLogger(__name__)
+
+WS_MAX_CONNECTIONS = int(os.getenv("WS_MAX_CONNECTIONS", "5000"))
+WS_MAX_WORDS = int(os.getenv("WS_MAX_WORDS", "40"))  # проверяются последние слова реплики
+WS_QUEUE_SIZE = 64  # фрагментов в очереди соединения до обратного давления на клиента
+
+# Закрытие соединения при превышении лимита: "попробуйте позже"
+CLOSE_TRY_AGAIN_LATER = 1013
+# Закрытие соединения с неверными параметрами (threshold)
+CLOSE_POLICY_VIOLATION = 1008
+
+CheckResult = Tuple[Tuple[bool, float, str], Any, List[str]]
+CheckFunc = Callable[[str, float, Optional[List[float]]], Awaitable[CheckResult]]
+
+
+class CallSession:
+    """Состояние одного звонка: текущая реплика, последний расчет, найденный автоответчик"""
+
+    def __init__(self, threshold: float, thresholds: Optional[List[float]] = None, max_words: int = WS_MAX_WORDS):
+        self.threshold = threshold
+        self.thresholds = thresholds
+        self.max_words = max_words
+        self.utterance = 0
+        self.words: List[str] = []
+        self.last_key: Optional[tuple] = None
+        self.last_result: Optional[CheckResult] = None
+        self.detected: Optional[Dict[str, Any]] = None
+
+    def configure(self, message: Dict[str, Any]):
+        """Пороги из сообщения клиента"""
+        if "threshold" in message:
+            self.threshold = float(message["threshold"])
+        if "thresholds" in message:
+            self.thresholds = [float(t) for t in message["thresholds"]] if message["thresholds"] else None
+
+    def add_fragment(self, text: str, final: bool) -> Tuple[int, str, bool]:
+        """Добавляет фрагмент; возвращает (номер реплики, текст для проверки, реплика завершена)"""
+        self.words.extend(text.split())
+        if len(self.words) > self.max_words:
+            del self.words[:-self.max_words]
+        job = (self.utterance, " ".join(self.words), final)
+        if final:
+            self.utterance += 1
+            self.words = []
+        return job
+
+    def cache_key(self, normalized_text: str) -> tuple:
+        return normalized_text, self.threshold, tuple(self.thresholds or ())
+
+
+class CallStreamStats:
+    """Счетчики потоковых соединений для /health"""
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {
+            "active": 0,
+            "connections": 0,
+            "rejected": 0,
+            "invalid": 0,
+            "fragments": 0,
+            "scored": 0,
+            "reused": 0,
+            "superseded": 0,
+            "detected": 0,
+            "rejected_checks": 0,
+            "errors": 0,
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"max_connections": WS_MAX_CONNECTIONS, **self.counters}
+
+
+stream_stats = CallStreamStats()
+
+
+def verdict_message(utterance: int, final: bool, result: CheckResult) -> Dict[str, Any]:
+    (exists, similarity_score, matched_phrase), verdicts, stages_run = result
+    message = {
+        "utterance": utterance,
+        "final": final,
+        "is_answering_machine": exists,
+        "similarity_score": float(similarity_score),
+        "matched_phrase": matched_phrase,
+    }
+    if verdicts:
+        message["verdicts"] = [
+            verdict.model_dump() if hasattr(verdict, "model_dump") else verdict for verdict in verdicts
+        ]
+    if stages_run:
+        message["stages_run"] = stages_run
+    return message
+
+
+async def _score_jobs(websocket: WebSocket, session: CallSession, jobs: "asyncio.Queue",
+                      check: CheckFunc, normalize: Callable[[str], str]):
+    """Проверка реплик: один расчет за раз, промежуточные фрагменты заменяются последним"""
+    stats = stream_stats.counters
+    while True:
+        batch = [await jobs.get()]
+        while not jobs.empty():
+            batch.append(jobs.get_nowait())
+
+        for position, job in enumerate(batch):
+            if job is None:
+                return
+            utterance, text, final = job
+            # Промежуточный фрагмент не нужен, если за ним в очереди та же реплика
+            next_job = batch[position + 1] if position + 1 < len(batch) else None
+            if not final and next_job is not None and next_job[0] == utterance:
+                stats["superseded"] += 1
+                continue
+
+            # Автоответчик уже найден: звонок не проверяется, на завершение реплики - тот же вердикт
+            if session.detected is not None:
+                if final:
+                    await websocket.send_json({**session.detected, "utterance": utterance, "final": True})
+                continue
+
+            normalized = normalize(text)
+            if not normalized:
+                if final:
+                    await websocket.send_json(verdict_message(utterance, True, ((False, 0.0, ""), None, [])))
+                continue
+
+            key = session.cache_key(normalized)
+            if key == session.last_key:
+                stats["reused"] += 1
+                result = session.last_result
+            else:
+                try:
+                    result = await check(text, session.threshold, session.thresholds)
+                except AdmissionRejected as e:
+                    # Перегрузка или срок ответа - временно: ошибка по фрагменту, соединение остается
+                    stats["rejected_checks"] += 1
+                    await websocket.send_json(
+                        {"utterance": utterance, "final": final, "error": str(e), "status": e.status_code}
+                    )
+                    continue
+                session.last_key, session.last_result = key, result
+                stats["scored"] += 1
+
+            exists = result[0][0]
+            if exists:
+                session.detected = verdict_message(utterance, final, result)
+                stats["detected"] += 1
+                await websocket.send_json(session.detected)
+            elif final:
+                await websocket.send_json(verdict_message(utterance, True, result))
+
+
+def parse_threshold(value: Optional[str], default: float) -> Optional[float]:
+    """Порог из параметра соединения; None - не число от 0 до 1"""
+    if value is None:
+        return default
+    try:
+        threshold = float(value)
+    except ValueError:
+        return None
+    return threshold if 0.0 <= threshold <= 1.0 else None
+
+
+async def serve_call_stream(websocket: WebSocket, check: CheckFunc, normalize: Callable[[str], str],
+                            default_threshold: float):
+    """Обслуживание одного соединения звонка"""
+    stats = stream_stats.counters
+    threshold = parse_threshold(websocket.query_params.get("threshold"), default_threshold)
+    if threshold is None:
+        stats["invalid"] += 1
+        await websocket.close(code=CLOSE_POLICY_VIOLATION, reason="threshold: ожидается число от 0 до 1")
+        return
+    if stats["active"] >= WS_MAX_CONNECTIONS:
+        stats["rejected"] += 1
+        await websocket.close(code=CLOSE_TRY_AGAIN_LATER)
+        return
+
+    # Место занимается сразу после проверки лимита, без await между ними
+    stats["active"] += 1
+    try:
+        await websocket.accept()
+        stats["connections"] += 1
+        await _serve_session(websocket, CallSession(threshold), check, normalize)
+    finally:
+        stats["active"] -= 1
+
+
+async def _serve_session(websocket: WebSocket, session: CallSession, check: CheckFunc,
+                         normalize: Callable[[str], str]):
+    """Прием фрагментов принятого соединения; проверка - в отдельной задаче"""
+    stats = stream_stats.counters
+    jobs: "asyncio.Queue" = asyncio.Queue(maxsize=WS_QUEUE_SIZE)
+    scorer = asyncio.ensure_future(_score_jobs(websocket, session, jobs, check, normalize))
+    try:
+        while not scorer.done():
+            receive = asyncio.ensure_future(websocket.receive_text())
+            done, _ = await asyncio.wait({receive, scorer}, return_when=asyncio.FIRST_COMPLETED)
+            if receive not in done:
+                receive.cancel()
+                break
+            try:
+                message = json.loads(receive.result())
+                session.configure(message)
+                text = str(message.get("text", ""))
+                final = bool(message.get("final", False))
+            except (ValueError, TypeError, AttributeError):
+                await websocket.send_json({"error": "Ожидается JSON: {\"text\": \"...\", \"final\": false}"})
+                continue
+            stats["fragments"] += 1
+            await jobs.put(session.add_fragment(text, final))
+        # Непредвиденная ошибка проверки закрывает соединение
+        if scorer.done() and not scorer.cancelled() and scorer.exception() is not None:
+            raise scorer.exception()
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        stats["errors"] += 1
+        logger.error(f"Ошибка потоковой проверки звонка: {e}")
+        try:
+            await websocket.close(code=1011)
+        except RuntimeError:
+            pass
+    finally:
+        scorer.cancel()
@@ -0,0 +1,65 @@
+"""Отчет о полноте кластерного поиска относительно полного перебора
+
+Запуск: python cluster_recall_report.py [--clusters N] [--queries N] [--probes 1,2,4,8]
+"""
+import argparse
+import random
+import time
+
+import main_embeddings as service
+from clustered_index import recall_report
+
+
+def make_queries(phrases, count, seed=42):
+    """Запросы из фраз базы с выброшенным словом (имитация неточной расшифровки)"""
+    rng = random.Random(seed)
+    queries = []
+    for phrase in rng.sample(phrases, min(count, len(phrases))):
+        words = phrase.split()
+        if len(words) > 2:
+            del words[rng.randrange(len(words))]
+        queries.append(" ".join(words))
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clusters", type=int, default=0, help="число кластеров (0 - около sqrt(N))")
+    parser.add_argument("--queries", type=int, default=300, help="число запросов")
+    parser.add_argument("--probes", default="1,2,4,8,16", help="список значений probes")
+    parser.add_argument("--k", type=int, default=10, help="глубина топ-k для полноты")
+    args = parser.parse_args()
+    probes_list = tuple(int(p) for p in args.probes.split(","))
+
+    service.initialize_system()
+    state = service.current_index()
+    index = service.build_cluster_index(args.clusters)
+    queries = make_queries(state.phrases_list, args.queries)
+    # Запросы - в той же форме, что фразы индекса и запросы сервиса (очистка и леммы)
+    query_matrix = state.tfidf_vectorizer.transform(service.TextPreprocessor.normalize_many(queries))
+
+    print(f"Фраз: {len(state.phrases_list)}, кластеров: {index.n_clusters}, запросов: {len(queries)}")
+    print(f"{'probes':>6} {'recall@' + str(args.k):>10} {'top1':>8} {'scanned':>9} {'time':>8}")
+    for row in recall_report(index, state.phrases_tfidf_matrix, query_matrix, args.k, probes_list):
+        print(f"{row['probes']:>6} {row['recall@' + str(args.k)]:>10.4f} {row['top1_in_exhaustive']:>8.4f} "
+              f"{row['scanned_fraction']:>9.3f} {row['time_ratio']:>7.2f}x")
+
+    # Совпадение итогового ответа (после переранжирования) с полным перебором
+    print("\nСовпадение итогового ответа find_most_similar:")
+    exhaustive = []
+    state.cluster_index = None
+    for query in queries:
+        exhaustive.append(service.find_most_similar(query, 0.0)[2])
+    state.cluster_index = index
+    for probes in probes_list:
+        start = time.time()
+        same = sum(
+            service.find_most_similar(query, 0.0, probes=probes)[2] == expected
+            for query, expected in zip(queries, exhaustive)
+        )
+        elapsed = (time.time() - start) / len(queries) * 1000
+        print(f"  probes={probes:<3} совпадение {same / len(queries):.4f}, {elapsed:.2f} мс/запрос")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Двухуровневый поиск: сначала центроиды кластеров, затем только члены лучших кластеров"""
+import logging
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+
+class ClusteredIndex:
+    """Кластерный индекс поверх L2-нормированной TF-IDF матрицы (сферический k-means)"""
+
+    def __init__(self, matrix, n_clusters: Optional[int] = None, svd_components: int = 100,
+                 random_state: int = 42):
+        # scikit-learn нужен только для кластеризации; from_arrays и search без него
+        from sklearn.cluster import MiniBatchKMeans
+        from sklearn.decomposition import TruncatedSVD
+        from sklearn.preprocessing import normalize
+
+        start_time = time.time()
+        n_rows = matrix.shape[0]
+
+        # По умолчанию ~sqrt(N) кластеров: баланс между числом центроидов и размером кластера
+        if not n_clusters or n_clusters <= 0:
+            n_clusters = int(math.sqrt(n_rows))
+        self.n_clusters = max(1, min(n_clusters, n_rows))
+
+        # k-means прямо по разреженным TF-IDF векторам дает один гигантский кластер,
+        # поэтому кластеризуем их LSA-проекцию (усеченный SVD), она сбалансированнее
+        components = min(svd_components, matrix.shape[1] - 1, n_rows - 1)
+        if components >= 2:
+            reduced = TruncatedSVD(n_components=components, random_state=random_state).fit_transform(matrix)
+            reduced = normalize(reduced)
+        else:
+            reduced = matrix
+        kmeans = MiniBatchKMeans(
+            n_clusters=self.n_clusters,
+            random_state=random_state,
+            batch_size=max(1024, self.n_clusters * 4),
+            n_init=3
+        )
+        labels = kmeans.fit_predict(reduced)
+
+        # Центроиды - нормированные средние членов в TF-IDF пространстве,
+        # чтобы скалярное произведение с запросом было косинусом
+        assignment = sparse.csr_matrix(
+            (np.ones(n_rows, dtype=np.float32), (labels, np.arange(n_rows))),
+            shape=(self.n_clusters, n_rows)
+        )
+        centroids = normalize(assignment @ matrix).toarray().astype(np.float32)
+
+        # Переупорядочиваем строки так, чтобы члены кластера шли подряд
+        order = np.argsort(labels, kind="stable")
+        counts = np.bincount(labels, minlength=self.n_clusters)
+        self._set_layout(matrix, centroids, order, np.concatenate(([0], np.cumsum(counts))))
+
+        build_time = time.time() - start_time
+        logger.info(
+            f"Кластерный индекс построен за {build_time:.2f} секунд: "
+            f"{self.n_clusters} кластеров, средний размер {n_rows / self.n_clusters:.1f}"
+        )
+
+    def _set_layout(self, matrix, centroids: np.ndarray, order: np.ndarray, offsets: np.ndarray):
+        """Заранее нарезает CSR блоки кластеров, чтобы не срезать матрицу на каждый запрос"""
+        self.centroids = centroids
+        self.order = order
+        self.offsets = offsets
+        sorted_matrix = matrix[order].tocsr()
+        self.blocks = [
+            sorted_matrix[offsets[c]:offsets[c + 1]] for c in range(self.n_clusters)
+        ]
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """Массивы индекса для сохранения в снимок"""
+        return {
+            "cluster_centroids": self.centroids,
+            "cluster_order": self.order,
+            "cluster_offsets": self.offsets
+        }
+
+    @classmethod
+    def from_arrays(cls, matrix, arrays: Dict[str, np.ndarray]) -> "ClusteredIndex":
+        """Восстановление индекса из массивов снимка без повторной кластеризации"""
+        index = cls.__new__(cls)
+        index.n_clusters = len(arrays["cluster_offsets"]) - 1
+        index._set_layout(matrix, arrays["cluster_centroids"], arrays["cluster_order"], arrays["cluster_offsets"])
+        return index
+
+    def cluster_sizes(self) -> np.ndarray:
+        """Размеры кластеров"""
+        return np.diff(self.offsets)
+
+    def search(self, query_vector, probes: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Возвращает индексы строк исходной матрицы и их косинусное сходство с запросом"""
+        probes = max(1, min(probes, self.n_clusters))
+
+        # Запрос один, поэтому плотный вектор запроса дешевле разреженных произведений
+        query_dense = np.asarray(query_vector.toarray()).ravel().astype(np.float32)
+        centroid_scores = self.centroids @ query_dense
+        if probes < self.n_clusters:
+            best_clusters = np.argpartition(-centroid_scores, probes - 1)[:probes]
+        else:
+            best_clusters = np.arange(self.n_clusters)
+
+        rows: List[np.ndarray] = []
+        scores: List[np.ndarray] = []
+        for cluster in best_clusters:
+            start, end = self.offsets[cluster], self.offsets[cluster + 1]
+            if start == end:
+                continue
+            rows.append(self.order[start:end])
+            scores.append(self.blocks[cluster] @ query_dense)
+
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        return np.concatenate(rows), np.concatenate(scores)
+
+
+def top_candidates(indices: np.ndarray, scores: np.ndarray, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Топ-N кандидатов по убыванию сходства"""
+    count = min(count, len(scores))
+    if count <= 0:
+        return indices[:0], scores[:0]
+    if count < len(scores):
+        part = np.argpartition(-scores, count - 1)[:count]
+    else:
+        part = np.arange(len(scores))
+    ordered = part[np.argsort(-scores[part], kind="stable")]
+    return indices[ordered], scores[ordered]
+
+
+def recall_report(index: ClusteredIndex, matrix, query_matrix, k: int = 10,
+                  probes_list: Tuple[int, ...] = (1, 2, 4, 8, 16)) -> List[dict]:
+    """Полнота топ-k кандидатов кластерного поиска относительно полного перебора"""
+    exhaustive = []
+    full_start = time.time()
+    all_rows = np.arange(matrix.shape[0])
+    for i in range(query_matrix.shape[0]):
+        scores = (matrix @ query_matrix[i].T).toarray().ravel()
+        exhaustive.append(set(top_candidates(all_rows, scores, k)[0].tolist()))
+    full_time = time.time() - full_start
+
+    report = []
+    for probes in probes_list:
+        hits = 0
+        top1_hits = 0
+        scanned = 0
+        probe_start = time.time()
+        for i in range(query_matrix.shape[0]):
+            rows, scores = index.search(query_matrix[i], probes)
+            scanned += len(rows)
+            found, _ = top_candidates(rows, scores, k)
+            hits += len(exhaustive[i].intersection(found.tolist()))
+            if len(found) and found[0] in exhaustive[i]:
+                top1_hits += 1
+        probe_time = time.time() - probe_start
+        total = sum(len(s) for s in exhaustive) or 1
+        report.append({
+            "probes": probes,
+            f"recall@{k}": hits / total,
+            "top1_in_exhaustive": top1_hits / max(1, query_matrix.shape[0]),
+            "scanned_fraction": scanned / max(1, query_matrix.shape[0] * matrix.shape[0]),
+            "time_ratio": probe_time / full_time if full_time > 0 else 0.0
+        })
+    return report
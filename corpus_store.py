@@ -0,0 +1,207 @@
+"""Двоичное хранилище базы фраз: арена строк, смещения, стабильные id, метаданные
+
+Одна база для обоих сервисов и утилит. Формат файла (little-endian):
+    заголовок   - magic PHCS, версия, число фраз, длина арены, длина метаданных;
+    ids         - uint32[count], стабильный id каждой фразы;
+    offsets     - uint32[count + 1], границы фраз в арене;
+    arena       - UTF-8 байты фраз подряд, фразы отсортированы (порядок строк индекса);
+    metadata    - JSON: источник, время сборки, sha256 арены, следующий свободный id.
+
+Файл открывается через mmap: ids и offsets - представления numpy поверх
+отображенной памяти, фраза декодируется только при обращении. Процессы на одном
+хосте разделяют страницы page cache, разбирать при старте нечего.
+
+id фразы не меняется при пересборке: build сохраняет id фраз, которые уже были
+в прежнем файле, новым фразам выдает следующие свободные номера.
+
+    python corpus_store.py build --source phrases.txt        # текст -> data/phrases.bin
+    python corpus_store.py export > phrases.txt               # для правки базы
+    python corpus_store.py info
+"""
+import argparse
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+MAGIC = b"PHCS"
+STORE_VERSION = 1
+HEADER = struct.Struct("<4sHHIII")  # magic, версия, резерв, число фраз, длина арены, длина метаданных
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "phrases.bin")
+
+
+class CorpusStore:
+    """База фраз, отображенная в память"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, _, count, arena_size, meta_size = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: не файл базы фраз")
+            if version != STORE_VERSION:
+                raise ValueError(f"{path}: версия формата {version}, поддерживается {STORE_VERSION}")
+            position = HEADER.size
+            self.ids = np.frombuffer(self._map, dtype="<u4", count=count, offset=position)
+            position += 4 * count
+            self.offsets = np.frombuffer(self._map, dtype="<u4", count=count + 1, offset=position)
+            position += 4 * (count + 1)
+            self._arena = memoryview(self._map)[position:position + arena_size]
+            position += arena_size
+            self.metadata: Dict[str, object] = json.loads(bytes(self._map[position:position + meta_size]))
+        except Exception:
+            self.close()
+            raise
+        self._id_order: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> str:
+        """Фраза по номеру строки (порядок сортировки)"""
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        return str(self._arena[start:end], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def phrases(self) -> List[str]:
+        """Все фразы в порядке сортировки"""
+        return list(self)
+
+    def index_of(self, phrase: str) -> Optional[int]:
+        """Номер строки фразы (двоичный поиск по отсортированной арене) или None"""
+        index = bisect.bisect_left(range(len(self)), phrase, key=self.__getitem__)
+        if index < len(self) and self[index] == phrase:
+            return index
+        return None
+
+    def phrase_id(self, phrase: str) -> Optional[int]:
+        """Стабильный id фразы или None"""
+        index = self.index_of(phrase)
+        return int(self.ids[index]) if index is not None else None
+
+    def by_id(self, phrase_id: int) -> Optional[str]:
+        """Фраза по стабильному id или None"""
+        if self._id_order is None:
+            self._id_order = np.argsort(self.ids, kind="stable")
+        position = int(np.searchsorted(self.ids, phrase_id, sorter=self._id_order))
+        if position < len(self) and self.ids[self._id_order[position]] == phrase_id:
+            return self[int(self._id_order[position])]
+        return None
+
+    def info(self) -> Dict[str, object]:
+        return {"path": self.path, "phrases": len(self), **self.metadata}
+
+    def close(self):
+        # Представления numpy и memoryview держат буфер: освобождаем их до закрытия mmap
+        self.ids = self.offsets = None
+        self._arena = None
+        self._id_order = None
+        try:
+            self._map.close()
+        except BufferError:
+            # Фразы-представления еще используются вызывающим кодом: mmap закроется сборщиком мусора
+            pass
+
+    def __enter__(self) -> "CorpusStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_store(path: str, phrases: Iterable[str], previous_ids: Optional[Dict[str, int]] = None,
+                next_id: int = 0, source: str = "") -> Dict[str, object]:
+    """Запись базы; id фраз из previous_ids сохраняются, новые получают номера начиная с next_id"""
+    previous_ids = previous_ids or {}
+    ordered = sorted({phrase.strip() for phrase in phrases if phrase.strip()})
+    next_id = max([next_id] + [value + 1 for value in previous_ids.values()])
+    ids = []
+    for phrase in ordered:
+        if phrase in previous_ids:
+            ids.append(previous_ids[phrase])
+        else:
+            ids.append(next_id)
+            next_id += 1
+
+    encoded = [phrase.encode("utf-8") for phrase in ordered]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    if offsets[-1] >= 2 ** 32:
+        raise ValueError("Арена базы фраз больше 4 ГиБ")
+    arena = b"".join(encoded)
+    metadata = {
+        "source": source,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sha256": hashlib.sha256(arena).hexdigest(),
+        "next_id": next_id
+    }
+    meta = json.dumps(metadata, ensure_ascii=False).encode("utf-8")
+
+    # Запись во временный файл и замена: открытые через mmap копии не видят половины файла
+    temporary = f"{path}.tmp"
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(temporary, "wb") as f:
+        f.write(HEADER.pack(MAGIC, STORE_VERSION, 0, len(ordered), len(arena), len(meta)))
+        f.write(np.asarray(ids, dtype="<u4").tobytes())
+        f.write(offsets.astype("<u4").tobytes())
+        f.write(arena)
+        f.write(meta)
+    os.replace(temporary, path)
+    return {"phrases": len(ordered), **metadata}
+
+
+def existing_ids(path: str):
+    """id фраз и следующий свободный id прежнего файла (если он есть)"""
+    if not os.path.exists(path):
+        return {}, 0
+    with CorpusStore(path) as store:
+        return {store[index]: int(store.ids[index]) for index in range(len(store))}, int(store.metadata.get("next_id", 0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Двоичное хранилище базы фраз")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="собрать хранилище из текстового файла (одна фраза на строку)")
+    build.add_argument("--source", required=True)
+    build.add_argument("--output", default=DEFAULT_STORE_PATH)
+    export = commands.add_parser("export", help="вывести фразы, одна на строку")
+    export.add_argument("--store", default=DEFAULT_STORE_PATH)
+    export.add_argument("--ids", action="store_true", help="с id через табуляцию")
+    info = commands.add_parser("info", help="метаданные хранилища")
+    info.add_argument("--store", default=DEFAULT_STORE_PATH)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        with open(args.source, "r", encoding="utf-8") as f:
+            phrases = f.read().splitlines()
+        previous_ids, next_id = existing_ids(args.output)
+        result = write_store(args.output, phrases, previous_ids, next_id, source=os.path.basename(args.source))
+        current = {phrase.strip() for phrase in phrases if phrase.strip()}
+        print(f"{args.output}: {result['phrases']} фраз, новых {len(current - set(previous_ids))}, "
+              f"удалено {len(set(previous_ids) - current)}")
+    elif args.command == "export":
+        with CorpusStore(args.store) as store:
+            for index in range(len(store)):
+                prefix = f"{int(store.ids[index])}\t" if args.ids else ""
+                sys.stdout.write(f"{prefix}{store[index]}\n")
+    else:
+        with CorpusStore(args.store) as store:
+            print(json.dumps(store.info(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,33 @@
-import requests
-import json
-from main_alternative import phrases_db, SimilarityCalculator, TextPreprocessor
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from phrase_client import PhraseClient, PhraseServiceError
+from phrase_corpus import load_phrases
+from similarity import SimilarityCalculator, TextPreprocessor
 import numpy as np
 
+
+def tfidf_similarities(query, phrases):
+    """Косинус TF-IDF запроса со всеми фразами (scikit-learn импортируется только здесь)"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    tfidf_vectorizer = TfidfVectorizer(
+        analyzer='word',
+        ngram_range=(1, 3),
+        max_features=10000,
+        stop_words=None
+    )
+    cleaned_phrases = [TextPreprocessor.clean_text(phrase) for phrase in phrases]
+    phrases_tfidf_matrix = tfidf_vectorizer.fit_transform(cleaned_phrases)
+    query_tfidf = tfidf_vectorizer.transform([TextPreprocessor.clean_text(query)])
+    return cosine_similarity(query_tfidf, phrases_tfidf_matrix)[0]
+
+
 # Тестируем локально все алгоритмы
 query = "летсгоу"
 print(f"Анализ фразы: '{query}'")
 print("=" * 80)
 
 # Получаем все фразы из базы
-phrases_list = list(phrases_db)
+phrases_list = list(load_phrases())
 print(f"Всего фраз в базе: {len(phrases_list)}")
 print()
 
@@ -61,19 +77,7 @@ print("Проверяем TF-IDF:")
 print("-" * 50)
 
 # Тестируем TF-IDF
-cleaned_phrases = [TextPreprocessor.clean_text(phrase) for phrase in phrases_list]
-cleaned_query = TextPreprocessor.clean_text(query)
-
-tfidf_vectorizer = TfidfVectorizer(
-    analyzer='word',
-    ngram_range=(1, 3),
-    max_features=10000,
-    stop_words=None
-)
-
-phrases_tfidf_matrix = tfidf_vectorizer.fit_transform(cleaned_phrases)
-query_tfidf = tfidf_vectorizer.transform([cleaned_query])
-similarities = cosine_similarity(query_tfidf, phrases_tfidf_matrix)[0]
+similarities = tfidf_similarities(query, phrases_list)
 
 max_tfidf_idx = np.argmax(similarities)
 max_tfidf_similarity = similarities[max_tfidf_idx]
@@ -97,17 +101,13 @@ print(f"Система должна вернуть: '{results[0]['phrase']}' с
 # Проверяем через API
 print("\nПроверка через API:")
 try:
-    response = requests.post('http://localhost:8001/check_phrase', 
-                           json={'phrase': query, 'threshold': 0.5})
-    if response.status_code == 200:
-        api_result = response.json()
-        print(f"API вернул: '{api_result['matched_phrase']}' с score {api_result['similarity_score']:.4f}")
-        
-        if api_result['matched_phrase'] != results[0]['phrase']:
-            print("⚠️  НЕСООТВЕТСТВИЕ! API вернул другую фразу!")
-        else:
-            print("✅ API работает корректно")
+    with PhraseClient() as client:
+        api_result = client.check(query, threshold=0.5)
+    print(f"API вернул: '{api_result['matched_phrase']}' с score {api_result['similarity_score']:.4f}")
+    
+    if api_result['matched_phrase'] != results[0]['phrase']:
+        print("⚠️  НЕСООТВЕТСТВИЕ! API вернул другую фразу!")
     else:
-        print(f"Ошибка API: {response.status_code} - {response.text}")
-except Exception as e:
+        print("✅ API работает корректно")
+except PhraseServiceError as e:
     print(f"Ошибка при обращении к API: {e}")
\ No newline at end of file
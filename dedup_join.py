@@ -0,0 +1,240 @@
+"""Поиск дубликатов и почти-дубликатов в базе фраз (all-pairs similarity join)
+
+Вместо квадратичного цикла по парам:
+1. точные дубликаты (после очистки текста) группируются словарем;
+2. для остальных строится разреженная TF-IDF матрица слов, и кандидаты в пары
+   находятся блочным произведением матриц префиксов (prefix filtering);
+3. кандидаты проверяются точным косинусом, затем SimilarityCalculator.length_weighted_similarity;
+4. подтвержденные пары объединяются в кластеры (система непересекающихся множеств).
+
+Запуск: python dedup_join.py [--cosine 0.8] [--verify 0.8] [--source main_embeddings]
+"""
+import argparse
+import importlib
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+
+class DisjointSet:
+    """Система непересекающихся множеств для сборки кластеров из пар"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, first: int, second: int):
+        root1, root2 = self.find(first), self.find(second)
+        if root1 != root2:
+            self.parent[max(root1, root2)] = min(root1, root2)
+
+
+def prefix_matrix(matrix: sparse.csr_matrix, threshold: float) -> Tuple[sparse.csr_matrix, np.ndarray]:
+    """Префиксы строк и нормы отброшенных суффиксов
+
+    Признаки упорядочены глобально от редких к частым (по индексу столбца после
+    перестановки). В префикс строки входят позиции, пока норма оставшегося суффикса
+    не станет меньше порога. Если у двух векторов нет общего признака в обоих
+    префиксах, их косинус не превышает нормы суффикса одного из них, то есть порога.
+    """
+    if matrix.nnz == 0:
+        return matrix.copy(), np.zeros(matrix.shape[0])
+    squares = matrix.data.astype(np.float64) ** 2
+    indptr = matrix.indptr
+    row_lengths = np.diff(indptr)
+    # Норма суффикса для каждой позиции: сумма квадратов от позиции до конца строки
+    cumulative = np.cumsum(squares)
+    row_totals = np.repeat(cumulative[np.maximum(indptr[1:] - 1, 0)], row_lengths)
+    suffix_sq = row_totals - cumulative + squares
+    keep = suffix_sq >= threshold * threshold
+    keep[indptr[:-1][row_lengths > 0]] = True
+
+    # Норма того, что осталось за префиксом. Пустые строки (фраза из одной пунктуации)
+    # в reduceat не передаются: начало пустой строки в конце матрицы - за пределами data
+    dropped = np.where(keep, 0.0, squares)
+    suffix_norm = np.zeros(matrix.shape[0])
+    nonempty = row_lengths > 0
+    if nonempty.any():
+        suffix_norm[nonempty] = np.sqrt(np.add.reduceat(dropped, indptr[:-1][nonempty]))
+
+    pruned = matrix.copy()
+    pruned.data = np.where(keep, matrix.data, 0.0).astype(np.float32)
+    pruned.eliminate_zeros()
+    return pruned, suffix_norm
+
+
+def candidate_pairs(matrix: sparse.csr_matrix, threshold: float,
+                    block_size: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+    """Пары строк (i < j), которые могут набрать порог; считаются блоками строк
+
+    Произведение префиксов дает точный вклад общих признаков из обоих префиксов,
+    остальное ограничено сверху нормами суффиксов: cos <= A + |x_suf| + |y_suf|.
+    """
+    prefixes, suffix_norm = prefix_matrix(matrix, threshold)
+    prefixes_t = prefixes.T.tocsr()
+    rows: List[np.ndarray] = []
+    cols: List[np.ndarray] = []
+    for start in range(0, prefixes.shape[0], block_size):
+        block = (prefixes[start:start + block_size] @ prefixes_t).tocoo()
+        block_rows = block.row + start
+        upper = block.col > block_rows
+        block_rows, block_cols = block_rows[upper], block.col[upper]
+        bound = block.data[upper] + suffix_norm[block_rows] + suffix_norm[block_cols]
+        passed = bound >= threshold
+        rows.append(block_rows[passed])
+        cols.append(block_cols[passed])
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+def pair_cosine(matrix: sparse.csr_matrix, first: np.ndarray, second: np.ndarray,
+                chunk_size: int = 200000) -> np.ndarray:
+    """Точный косинус для списка пар строк L2-нормированной матрицы"""
+    result = np.empty(len(first), dtype=np.float64)
+    for start in range(0, len(first), chunk_size):
+        end = start + chunk_size
+        products = matrix[first[start:end]].multiply(matrix[second[start:end]])
+        result[start:end] = np.asarray(products.sum(axis=1)).ravel()
+    return result
+
+
+def find_duplicate_clusters(phrases: Sequence[str],
+                            clean: Callable[[str], str],
+                            verifier: Optional[Callable[[str, str], float]] = None,
+                            cosine_threshold: float = 0.8,
+                            verify_threshold: float = 0.8,
+                            block_size: int = 4096) -> List[List[int]]:
+    """Кластеры (списки индексов phrases) точных и почти-дубликатов, только размера > 1"""
+    start_time = time.time()
+    n_phrases = len(phrases)
+    clusters = DisjointSet(n_phrases)
+
+    # 1. Точные дубликаты после очистки
+    first_seen: Dict[str, int] = {}
+    unique_ids: List[int] = []
+    cleaned: List[str] = []
+    for idx, phrase in enumerate(phrases):
+        text = clean(phrase)
+        if text in first_seen:
+            clusters.union(first_seen[text], idx)
+        else:
+            first_seen[text] = idx
+            unique_ids.append(idx)
+            cleaned.append(text)
+    exact_time = time.time() - start_time
+
+    # 2. Кандидаты среди уникальных текстов по префиксам TF-IDF векторов слов
+    verified = 0
+    candidates_count = 0
+    if len(cleaned) > 1:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        # Тексты уже очищены, поэтому достаточно разбиения по пробелам
+        vectorizer = TfidfVectorizer(analyzer=str.split)
+        matrix = vectorizer.fit_transform(cleaned).tocsr()
+        # Редкие признаки идут первыми: префиксы получаются короткими и избирательными
+        document_frequency = np.bincount(matrix.indices, minlength=matrix.shape[1])
+        order = np.argsort(document_frequency, kind="stable")
+        matrix = matrix[:, order].tocsr()
+        matrix.sort_indices()
+
+        first, second = candidate_pairs(matrix, cosine_threshold, block_size)
+        candidates_count = len(first)
+
+        # 3. Точный косинус, затем проверка комбинированной метрикой
+        if candidates_count:
+            cosine = pair_cosine(matrix, first, second)
+            passed = cosine >= cosine_threshold
+            first, second = first[passed], second[passed]
+        for i, j in zip(first.tolist(), second.tolist()):
+            if verifier is not None and verifier(cleaned[i], cleaned[j]) < verify_threshold:
+                continue
+            clusters.union(unique_ids[i], unique_ids[j])
+            verified += 1
+
+    # 4. Сборка кластеров
+    groups: Dict[int, List[int]] = {}
+    for idx in range(n_phrases):
+        groups.setdefault(clusters.find(idx), []).append(idx)
+    result = [members for members in groups.values() if len(members) > 1]
+
+    logger.info(
+        f"Поиск дубликатов: {n_phrases} фраз, {n_phrases - len(unique_ids)} точных дубликатов "
+        f"({exact_time:.2f} с), {candidates_count} пар-кандидатов, {verified} подтверждено, "
+        f"{len(result)} кластеров за {time.time() - start_time:.2f} секунд"
+    )
+    return result
+
+
+
+def canonicalize(phrases: Sequence[str],
+                 clean: Callable[[str], str],
+                 verifier: Optional[Callable[[str, str], float]] = None,
+                 cosine_threshold: float = 0.9,
+                 verify_threshold: float = 0.85) -> Tuple[List[str], Dict[int, List[str]]]:
+    """Схлопывает кластеры дубликатов в представителей
+
+    Возвращает список представителей (порядок phrases сохраняется) и отображение
+    индекс представителя -> все фразы его кластера (только для кластеров размера > 1).
+    Представитель - самая длинная по числу слов фраза кластера.
+    """
+    clusters = find_duplicate_clusters(phrases, clean, verifier, cosine_threshold, verify_threshold)
+    representative_of: Dict[int, int] = {}
+    for members in clusters:
+        representative = max(members, key=lambda idx: (len(phrases[idx].split()), -idx))
+        for idx in members:
+            representative_of[idx] = representative
+
+    representatives: List[str] = []
+    members_map: Dict[int, List[str]] = {}
+    position: Dict[int, int] = {}
+    for idx, phrase in enumerate(phrases):
+        representative = representative_of.get(idx, idx)
+        if representative not in position:
+            position[representative] = len(representatives)
+            representatives.append(phrases[representative])
+        if idx in representative_of:
+            members_map.setdefault(position[representative], []).append(phrase)
+
+    logger.info(f"Канонизация базы: {len(phrases)} фраз -> {len(representatives)} представителей")
+    return representatives, members_map
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Поиск дубликатов в базе фраз")
+    parser.add_argument("--source", default="main_embeddings", help="модуль сервиса с базой фраз")
+    parser.add_argument("--cosine", type=float, default=0.8, help="порог косинуса TF-IDF")
+    parser.add_argument("--verify", type=float, default=0.8, help="порог length_weighted_similarity")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    service = importlib.import_module(args.source)
+    phrases = sorted(service.phrases_db)
+    clusters = find_duplicate_clusters(
+        phrases,
+        clean=service.TextPreprocessor.clean_text,
+        verifier=service.SimilarityCalculator.length_weighted_similarity,
+        cosine_threshold=args.cosine,
+        verify_threshold=args.verify
+    )
+    for number, members in enumerate(sorted(clusters, key=len, reverse=True), 1):
+        print(f"Кластер {number} ({len(members)} фраз):")
+        for idx in members:
+            print(f"  - {phrases[idx]}")
+
+
+if __name__ == "__main__":
+    main()
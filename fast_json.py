@@ -0,0 +1,70 @@
+"""Быстрый путь сериализации для /check_phrase/fast
+
+Обычный эндпоинт строит PhraseRequest, затем AnsweringMachineResponse, повторно
+валидирует его через response_model и кодирует стандартным JSON кодировщиком.
+Быстрый путь разбирает тело одним вызовом JSON декодера (orjson, если установлен)
+и собирает ответ из заранее закодированных частей без промежуточных моделей.
+"""
+import json
+from typing import Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # без orjson работает стандартный json, медленнее
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+    dumps = orjson.dumps
+else:
+    loads = json.loads
+
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Заранее закодированные части ответа
+_MATCH_HEAD = b'{"is_answering_machine":true,"similarity_score":'
+_NO_MATCH_HEAD = b'{"is_answering_machine":false,"similarity_score":'
+_PHRASE = b',"matched_phrase":'
+_EMPTY_PHRASE_TAIL = b',"matched_phrase":""'
+_VERDICTS = b',"verdicts":'
+_STAGES = b',"stages_run":'
+_TAIL = b"}"
+
+
+def parse_check_request(body: bytes, default_threshold: float) -> Tuple[str, float, Optional[List[float]]]:
+    """(фраза, порог, доп. пороги) из тела запроса; ValueError при неверном теле"""
+    try:
+        data = loads(body)
+        phrase = data["phrase"]
+        threshold = float(data.get("threshold", default_threshold))
+        thresholds = data.get("thresholds")
+        if thresholds is not None:
+            thresholds = [float(t) for t in thresholds]
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Неверное тело запроса: {e}") from e
+    if not isinstance(phrase, str):
+        raise ValueError("Поле phrase должно быть строкой")
+    return phrase, threshold, thresholds
+
+
+def encode_check_response(exists: bool, similarity_score: float, matched_phrase: str,
+                          verdicts: Optional[List[Any]] = None, stages_run: Optional[List[str]] = None) -> bytes:
+    """Тело ответа в формате AnsweringMachineResponse"""
+    parts = [_MATCH_HEAD if exists else _NO_MATCH_HEAD, dumps(float(similarity_score))]
+    if matched_phrase:
+        parts += [_PHRASE, dumps(matched_phrase)]
+    else:
+        parts.append(_EMPTY_PHRASE_TAIL)
+    if verdicts:
+        parts += [_VERDICTS, dumps([
+            verdict.model_dump() if hasattr(verdict, "model_dump") else verdict for verdict in verdicts
+        ])]
+    if stages_run is not None:
+        parts += [_STAGES, dumps(stages_run)]
+    parts.append(_TAIL)
+    return b"".join(parts)
+
+
+def encode_error(detail: str) -> bytes:
+    return b'{"detail":' + dumps(detail) + _TAIL
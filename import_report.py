@@ -0,0 +1,115 @@
+"""Отчет о времени импорта и старта сервиса (python -X importtime)
+
+Модуль импортируется в отдельном процессе с -X importtime, отчет показывает
+общее время, самые дорогие зависимости первого уровня и модули с наибольшим
+собственным временем. С --startup дополнительно измеряется время до готовности:
+импорт плюс initialize_system (со снимком индекса - загрузка через mmap),
+и проверяется, что тяжелые пакеты из --forbid на этом пути не импортируются.
+
+    python import_report.py --module main_embeddings
+    python import_report.py --module main_alternative --startup --max-ms 1000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# (собственное время, накопленное время, глубина, модуль), микросекунды
+ImportRecord = Tuple[int, int, int, str]
+
+STARTUP_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module} as service
+imported = time.perf_counter()
+service.initialize_system()
+ready = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "init_ms": (ready - imported) * 1000,
+    "modules": sorted(sys.modules)
+}}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """Строки 'import time: self | cumulative | name' вывода -X importtime"""
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return records
+
+
+def run_importtime(module: str) -> List[ImportRecord]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Импорт {module} завершился ошибкой:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def run_startup(module: str) -> Dict[str, object]:
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_PROBE.format(module=module)],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Старт {module} завершился ошибкой:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def print_importtime(module: str, records: List[ImportRecord], top: int):
+    target = next((record for record in records if record[3] == module), None)
+    total_ms = target[1] / 1000 if target else sum(record[0] for record in records) / 1000
+    print(f"Импорт {module}: {total_ms:.0f} мс, модулей: {len(records)}")
+
+    # Непосредственные зависимости модуля (глубина 1)
+    direct = sorted((record for record in records if record[2] == 1), key=lambda record: -record[1])
+    print("\nДорогие зависимости первого уровня (накопленное время):")
+    for self_us, cumulative_us, _, name in direct[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} мс  {name}")
+
+    print("\nНаибольшее собственное время:")
+    for self_us, cumulative_us, _, name in sorted(records, key=lambda record: -record[0])[:top]:
+        print(f"  {self_us / 1000:8.1f} мс  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Время импорта и старта сервиса")
+    parser.add_argument("--module", default="main_embeddings", help="модуль сервиса")
+    parser.add_argument("--top", type=int, default=15, help="строк в каждом разделе отчета")
+    parser.add_argument("--startup", action="store_true", help="измерить импорт + initialize_system")
+    parser.add_argument("--forbid", default="sklearn", help="пакеты, которых не должно быть после старта (через запятую)")
+    parser.add_argument("--max-ms", type=float, default=0, help="код возврата 1, если старт дольше (с --startup)")
+    args = parser.parse_args()
+
+    print_importtime(args.module, run_importtime(args.module), args.top)
+    if not args.startup:
+        return
+
+    startup = run_startup(args.module)
+    total_ms = startup["import_ms"] + startup["init_ms"]
+    print(f"\nСтарт: импорт {startup['import_ms']:.0f} мс + initialize_system {startup['init_ms']:.0f} мс "
+          f"= {total_ms:.0f} мс")
+    failed = False
+    for package in filter(None, args.forbid.split(",")):
+        loaded = [name for name in startup["modules"] if name == package or name.startswith(package + ".")]
+        print(f"  {package}: {'импортирован' if loaded else 'не импортирован'}")
+        failed = failed or bool(loaded)
+    if args.max_ms and total_ms > args.max_ms:
+        print(f"  старт дольше {args.max_ms:.0f} мс")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
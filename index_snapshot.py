@@ -0,0 +1,206 @@
+"""Снимок индекса на диске: загрузка через mmap вместо перестроения при старте
+
+Снимок - каталог с версией формата и ключом (хэш упорядоченного набора фраз
+и параметров построения индекса, включая отпечаток нормализации текста и
+стеммера - similarity.normalizer_fingerprint):
+- meta.json       - версия, ключ, размеры, время построения;
+- phrases.json    - фразы в порядке строк матрицы (детерминированный порядок);
+- vocabulary.json - термины TF-IDF в порядке столбцов;
+- members.json    - фразы кластеров дубликатов (если база схлопнута);
+- lemmas.json     - таблица словоформа -> лемма;
+- *.npy           - IDF, массивы CSR матрицы и дополнительные признаки.
+
+Массивы загружаются с np.load(..., mmap_mode='r'): старт занимает миллисекунды,
+а все процессы сервиса разделяют одни страницы page cache.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+USE_INDEX_SNAPSHOT = os.getenv("USE_INDEX_SNAPSHOT", "1") == "1"
+INDEX_SNAPSHOT_DIR = os.getenv("INDEX_SNAPSHOT_DIR", "index_snapshots")
+INDEX_SNAPSHOT_KEEP = int(os.getenv("INDEX_SNAPSHOT_KEEP", "2"))  # снимков одного сервиса на диске, включая текущий
+
+MATRIX_ARRAYS = ("data", "indices", "indptr")
+
+
+def snapshot_key(phrases: Iterable[str], settings: Dict[str, object]) -> str:
+    """Ключ снимка: хэш набора фраз (без учета порядка) и параметров построения"""
+    digest = hashlib.sha256()
+    digest.update(f"v{SNAPSHOT_VERSION}\n".encode("utf-8"))
+    digest.update(json.dumps(settings, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+    for phrase in sorted(phrases):
+        digest.update(b"\n")
+        digest.update(phrase.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class IndexSnapshot:
+    """Загруженный снимок индекса"""
+
+    def __init__(self, path: str, meta: Dict[str, object], phrases: List[str], vocabulary: Dict[str, int],
+                 idf: np.ndarray, matrix: sparse.csr_matrix, members: Optional[Dict[int, List[str]]],
+                 lemmas: Optional[Dict[str, str]], arrays: Dict[str, np.ndarray]):
+        self.path = path
+        self.meta = meta
+        self.phrases = phrases
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.matrix = matrix
+        self.members = members
+        self.lemmas = lemmas
+        self.arrays = arrays
+
+
+def snapshot_path(directory: str, name: str, key: str) -> str:
+    return os.path.join(directory, f"{name}-{key[:16]}")
+
+
+def _write_json(path: str, value):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(value, f, ensure_ascii=False)
+
+
+def _read_json(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_snapshot(directory: str, name: str, key: str, phrases: List[str], vectorizer, matrix,
+                  members: Optional[Dict[int, List[str]]] = None, lemmas: Optional[Dict[str, str]] = None,
+                  arrays: Optional[Dict[str, np.ndarray]] = None) -> str:
+    """Записывает снимок во временный каталог и атомарно переименовывает его"""
+    start_time = time.time()
+    path = snapshot_path(directory, name, key)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    os.makedirs(tmp_path, exist_ok=True)
+    try:
+        matrix = sparse.csr_matrix(matrix)
+        matrix.sort_indices()
+        for array_name in MATRIX_ARRAYS:
+            np.save(os.path.join(tmp_path, f"{array_name}.npy"), getattr(matrix, array_name))
+        np.save(os.path.join(tmp_path, "idf.npy"), vectorizer.idf_)
+
+        terms = [None] * len(vectorizer.vocabulary_)
+        for term, column in vectorizer.vocabulary_.items():
+            terms[column] = term
+        _write_json(os.path.join(tmp_path, "vocabulary.json"), terms)
+        _write_json(os.path.join(tmp_path, "phrases.json"), phrases)
+        if members is not None:
+            _write_json(os.path.join(tmp_path, "members.json"), {str(idx): group for idx, group in members.items()})
+        if lemmas is not None:
+            _write_json(os.path.join(tmp_path, "lemmas.json"), lemmas)
+
+        array_names = sorted(arrays or {})
+        for array_name in array_names:
+            np.save(os.path.join(tmp_path, f"x_{array_name}.npy"), np.asarray(arrays[array_name]))
+
+        _write_json(os.path.join(tmp_path, "meta.json"), {
+            "version": SNAPSHOT_VERSION,
+            "key": key,
+            "name": name,
+            "phrases": len(phrases),
+            "shape": list(matrix.shape),
+            "arrays": array_names,
+            "created": time.time()
+        })
+
+        # Каталог с тем же ключом мог появиться в параллельном процессе: он равноценен
+        if os.path.isdir(path):
+            shutil.rmtree(tmp_path)
+        else:
+            os.replace(tmp_path, path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    logger.info(f"Снимок индекса сохранен в {path} за {time.time() - start_time:.2f} секунд")
+    return path
+
+
+def prune_snapshots(directory: str, name: str, key: str, keep: int = INDEX_SNAPSHOT_KEEP) -> List[str]:
+    """Удаляет старые снимки сервиса name: остаются текущий (key) и keep - 1 самых новых
+    
+    Загруженный через mmap снимок можно удалять: отображенные файлы остаются
+    доступны процессам до их завершения. Незавершенные каталоги (.tmp-*) не трогаются.
+    """
+    current = os.path.basename(snapshot_path(directory, name, key))
+    prefix = f"{name}-"
+    try:
+        entries = [
+            entry for entry in os.scandir(directory)
+            if entry.is_dir() and entry.name.startswith(prefix) and ".tmp-" not in entry.name and entry.name != current
+        ]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    removed = []
+    for entry in entries[max(0, keep - 1):]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+        removed.append(entry.path)
+    if removed:
+        logger.info(f"Удалено старых снимков индекса: {len(removed)}")
+    return removed
+
+
+def load_snapshot(directory: str, name: str, key: str) -> Optional[IndexSnapshot]:
+    """Загрузка снимка с данным ключом; None, если его нет или он другой версии"""
+    path = snapshot_path(directory, name, key)
+    meta_path = os.path.join(path, "meta.json")
+    if not os.path.isfile(meta_path):
+        return None
+
+    start_time = time.time()
+    try:
+        meta = _read_json(meta_path)
+        if meta.get("version") != SNAPSHOT_VERSION or meta.get("key") != key:
+            logger.warning(f"Снимок {path} другой версии или с другим ключом, будет перестроен")
+            return None
+
+        mapped = {
+            array_name: np.load(os.path.join(path, f"{array_name}.npy"), mmap_mode="r")
+            for array_name in MATRIX_ARRAYS
+        }
+        matrix = sparse.csr_matrix(
+            (mapped["data"], mapped["indices"], mapped["indptr"]), shape=tuple(meta["shape"]), copy=False
+        )
+        matrix.has_sorted_indices = True
+        idf = np.load(os.path.join(path, "idf.npy"), mmap_mode="r")
+        terms = _read_json(os.path.join(path, "vocabulary.json"))
+        phrases = _read_json(os.path.join(path, "phrases.json"))
+
+        members = None
+        if os.path.isfile(os.path.join(path, "members.json")):
+            members = {int(idx): group for idx, group in _read_json(os.path.join(path, "members.json")).items()}
+        lemmas = None
+        if os.path.isfile(os.path.join(path, "lemmas.json")):
+            lemmas = _read_json(os.path.join(path, "lemmas.json"))
+        arrays = {
+            array_name: np.load(os.path.join(path, f"x_{array_name}.npy"), mmap_mode="r")
+            for array_name in meta.get("arrays", [])
+        }
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Не удалось загрузить снимок {path}: {e}")
+        return None
+
+    logger.info(f"Снимок индекса загружен из {path} за {(time.time() - start_time) * 1000:.1f} мс")
+    return IndexSnapshot(
+        path=path,
+        meta=meta,
+        phrases=phrases,
+        vocabulary={term: column for column, term in enumerate(terms)},
+        idf=idf,
+        matrix=matrix,
+        members=members,
+        lemmas=lemmas,
+        arrays=arrays
+    )
@@ -0,0 +1,215 @@
+"""Горячая замена индекса: публикация новой версии целиком (RCU)
+
+Все, что читает сопоставление (векторизатор, фразы, матрица, кластеры, леммы),
+собрано в одном объекте состояния сервиса. Новая версия строится в фоновом
+потоке и публикуется одной заменой ссылки; опубликованное состояние не
+изменяется. Задача пула закрепляется (pin) за версией, текущей на момент ее
+начала, поэтому начатые запросы досчитываются на старой версии, а частично
+построенную версию не видит никто, кроме потока сборки.
+
+Перестроение запускается POST /admin/reload (только при заданном ADMIN_TOKEN)
+или наблюдателем за файлом базы (CORPUS_WATCH_INTERVAL). Пока идет сборка, повторные запросы на перестроение
+объединяются в одно следующее.
+
+Под serve.py воркеры индекс сами не перестраивают: частные копии индекса в
+каждом воркере потеряли бы общие страницы copy-on-write. Воркер передает
+запрос родительскому процессу (SIGHUP, ParentReloader), а тот следит за
+файлом базы, строит новую версию один раз и заменяет воркеров новыми.
+"""
+import hmac
+import logging
+import os
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+CORPUS_WATCH_INTERVAL = float(os.getenv("CORPUS_WATCH_INTERVAL", "0"))  # секунд между проверками файла базы, 0 - не следить
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")  # токен /admin/* (заголовок X-Admin-Token), пусто - эндпоинты выключены
+ADMIN_ENABLED = bool(ADMIN_TOKEN)
+PREFORK_WORKER_ENV = "PHRASE_PREFORK_WORKER"  # задается serve.py в воркерах
+
+
+def prefork_worker() -> bool:
+    """Процесс - воркер serve.py: индекс перестраивает родительский процесс"""
+    return os.getenv(PREFORK_WORKER_ENV) == "1"
+
+
+def admin_token_valid(token: Optional[str]) -> bool:
+    """Проверка X-Admin-Token; без ADMIN_TOKEN административные запросы не принимаются"""
+    if not ADMIN_TOKEN:
+        return False
+    return token is not None and hmac.compare_digest(token.encode("utf-8"), ADMIN_TOKEN.encode("utf-8"))
+
+
+class ActiveIndex:
+    """Ссылка на опубликованную версию индекса и закрепление версии за потоком"""
+
+    def __init__(self):
+        self._current: Any = None
+        self._local = threading.local()
+        self.published = 0
+
+    def get(self) -> Any:
+        """Закрепленная за потоком версия, иначе опубликованная"""
+        pinned = getattr(self._local, "state", None)
+        return pinned if pinned is not None else self._current
+
+    def publish(self, state: Any) -> Any:
+        """Атомарная замена опубликованной версии; возвращает прежнюю"""
+        previous, self._current = self._current, state
+        self.published += 1
+        return previous
+
+    @contextmanager
+    def pin(self, state: Any = None) -> Iterator[Any]:
+        """Закрепляет за потоком версию (по умолчанию текущую) до выхода из блока"""
+        previous = getattr(self._local, "state", None)
+        self._local.state = state if state is not None else (previous if previous is not None else self._current)
+        try:
+            yield self._local.state
+        finally:
+            self._local.state = previous
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """func(*args, **kwargs) на одной версии индекса"""
+        with self.pin():
+            return func(*args, **kwargs)
+
+
+class IndexReloader:
+    """Фоновая сборка новой версии и ее публикация; повторные запросы объединяются"""
+
+    def __init__(self, name: str, build: Callable[[], Any], publish: Callable[[Any], None]):
+        self.name = name
+        self._build = build
+        self._publish = publish
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._requested: Optional[str] = None
+        self.stats_data: Dict[str, Any] = {
+            "requested": 0,
+            "coalesced": 0,
+            "completed": 0,
+            "failed": 0,
+            "last_reason": None,
+            "last_error": None,
+            "last_duration": None,
+            "last_completed_at": None,
+        }
+
+    @property
+    def building(self) -> bool:
+        return self._thread is not None
+
+    def trigger(self, reason: str) -> str:
+        """Запрос на перестроение: started - сборка начата, queued - начнется после текущей"""
+        with self._lock:
+            self.stats_data["requested"] += 1
+            if self._thread is not None:
+                if self._requested is not None:
+                    self.stats_data["coalesced"] += 1
+                self._requested = reason
+                return "queued"
+            self._start(reason)
+            return "started"
+
+    def _start(self, reason: str):
+        self._thread = threading.Thread(target=self._run, args=(reason,), name=f"{self.name}-reload", daemon=True)
+        self._thread.start()
+
+    def _run(self, reason: str):
+        while True:
+            logger.info(f"Перестроение индекса ({reason})...")
+            self.stats_data["last_reason"] = reason
+            start_time = time.time()
+            try:
+                state = self._build()
+                self._publish(state)
+            except Exception as e:
+                logger.error(f"Перестроение индекса не удалось, остается прежняя версия: {e}")
+                self.stats_data["failed"] += 1
+                self.stats_data["last_error"] = str(e)
+            else:
+                self.stats_data["completed"] += 1
+                self.stats_data["last_error"] = None
+                self.stats_data["last_completed_at"] = time.time()
+                logger.info(f"Новая версия индекса опубликована за {time.time() - start_time:.2f} секунд")
+            self.stats_data["last_duration"] = time.time() - start_time
+            with self._lock:
+                if self._requested is None:
+                    self._thread = None
+                    return
+                reason, self._requested = self._requested, None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"building": self.building, **self.stats_data}
+
+
+class ParentReloader:
+    """Перестроение в воркере serve.py: запрос передается родительскому процессу сигналом SIGHUP"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.parent = os.getppid()
+        self.stats_data: Dict[str, Any] = {"requested": 0, "forwarded": 0, "last_reason": None}
+
+    def trigger(self, reason: str) -> str:
+        """forwarded - запрос передан родителю, он заменит всех воркеров новыми"""
+        self.stats_data["requested"] += 1
+        self.stats_data["last_reason"] = reason
+        # Родитель завершился: воркер унаследован другим процессом, сигнал слать некому
+        if os.getppid() != self.parent:
+            raise RuntimeError("Родительский процесс serve.py не найден")
+        os.kill(self.parent, signal.SIGHUP)
+        self.stats_data["forwarded"] += 1
+        return "forwarded"
+
+    def stats(self) -> Dict[str, Any]:
+        return {"building": False, "parent": self.parent, **self.stats_data}
+
+
+class FileWatcher:
+    """Опрос файла базы: при изменении (mtime, размер, inode) вызывает on_change"""
+
+    def __init__(self, path: str, on_change: Callable[[str], Any], interval: float = CORPUS_WATCH_INTERVAL):
+        self.path = path
+        self.on_change = on_change
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._signature = self._stat()
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def start(self):
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="corpus-watch", daemon=True)
+        self._thread.start()
+        logger.info(f"Наблюдение за {self.path} каждые {self.interval:g} с")
+
+    def changed(self) -> bool:
+        """Файл изменился с прошлой проверки (опрос без потока - для serve.py)"""
+        signature = self._stat()
+        # Файл заменяется атомарно (os.replace), поэтому пропавший на миг файл не считается изменением
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if self.changed():
+                self.on_change(f"изменен {os.path.basename(self.path)}")
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,89 @@
+"""Слушающие сокеты сервиса: TCP и, для клиентов на том же хосте, Unix domain socket
+
+Webhook Next.js и Python-обзвонщики работают на одном хосте с сервисом. Через
+Unix domain socket запрос не проходит TCP стек loopback (handshake, сегменты,
+подтверждения), поэтому задержка на запрос меньше. Сервис слушает оба сокета
+одновременно: удаленные клиенты продолжают ходить по TCP.
+
+    ML_UDS_PATH=/run/phrase-checker/ml.sock python main_embeddings.py
+    curl --unix-socket /run/phrase-checker/ml.sock http://localhost/health
+"""
+import logging
+import os
+import socket
+import stat
+from typing import List, Optional
+
+import uvicorn
+
+logger = logging.getLogger(__name__)
+
+ML_HOST = os.getenv("ML_HOST", "0.0.0.0")
+ML_PORT = int(os.getenv("ML_PORT", "8001"))
+ML_UDS_PATH = os.getenv("ML_UDS_PATH", "")  # пусто - Unix socket не открывается
+ML_UDS_MODE = int(os.getenv("ML_UDS_MODE", "660"), 8)  # права на файл сокета
+LISTEN_BACKLOG = 2048
+
+
+def bind_tcp(host: str, port: int) -> socket.socket:
+    """Слушающий TCP сокет
+    
+    proto=IPPROTO_TCP обязателен: asyncio включает TCP_NODELAY только для таких
+    сокетов, иначе ответ из нескольких записей ждет отложенного ACK (~40 мс).
+    """
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(LISTEN_BACKLOG)
+    sock.set_inheritable(True)
+    return sock
+
+
+def bind_unix(path: str, mode: int = ML_UDS_MODE) -> socket.socket:
+    """Слушающий Unix domain socket; файл от прежнего запуска удаляется"""
+    if os.path.exists(path):
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            raise RuntimeError(f"{path} существует и не является сокетом")
+        os.unlink(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    os.chmod(path, mode)
+    sock.listen(LISTEN_BACKLOG)
+    sock.set_inheritable(True)
+    return sock
+
+
+def bind_sockets(host: str, port: int, uds_path: str = "") -> List[socket.socket]:
+    """TCP сокет (если задан порт) и Unix socket (если задан путь)"""
+    sockets = []
+    if port:
+        sockets.append(bind_tcp(host, port))
+        logger.info(f"Слушаем http://{host}:{port}")
+    if uds_path:
+        sockets.append(bind_unix(uds_path))
+        logger.info(f"Слушаем unix:{uds_path}")
+    if not sockets:
+        raise ValueError("Не задан ни порт, ни путь Unix socket")
+    return sockets
+
+
+def close_sockets(sockets: List[socket.socket]):
+    """Закрытие сокетов и удаление файлов Unix socket"""
+    for sock in sockets:
+        path = sock.getsockname() if sock.family == socket.AF_UNIX else None
+        sock.close()
+        if path and os.path.exists(path):
+            os.unlink(path)
+
+
+def run_service(app, host: str = ML_HOST, port: int = ML_PORT, uds_path: Optional[str] = ML_UDS_PATH,
+                log_level: str = "info"):
+    """Запуск uvicorn на TCP и Unix socket одновременно (для __main__ сервисов)"""
+    sockets = bind_sockets(host, port, uds_path or "")
+    try:
+        uvicorn.Server(uvicorn.Config(app, log_level=log_level)).run(sockets=sockets)
+    finally:
+        close_sockets(sockets)
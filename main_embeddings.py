@@ -1,2620 +1,91 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
-from typing import Set, List, Tuple
-import uvicorn
+from typing import Set, List, Tuple, Optional, Dict
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import re
 import logging
 import time
-from contextlib import asynccontextmanager
+from functools import partial
 import os
-from difflib import SequenceMatcher
-from collections import Counter
-import string
+from clustered_index import ClusteredIndex, top_candidates
+from similarity import TextPreprocessor, SimilarityCalculator, bind_lemmatizer
+from adaptive_rerank import AdaptiveRerank
+from match_pool import AdmissionRejected
+from anytime import MatchBudget, current_budget, item_budget, budget_exhausted, is_degraded, STAGE_EXACT, STAGE_TFIDF, STAGE_RERANK, STAGE_BUDGET_EXHAUSTED
+from listeners import run_service, ML_HOST, ML_PORT, ML_UDS_PATH
+from phrase_corpus import load_phrases
+from tracing import tracer, traced, span, task_name
+from tfidf_query import cosine_scores
+from index_snapshot import IndexSnapshot
+from service_runtime import (
+    ServiceRuntime, IndexState as BaseIndexState, add_service_routes, split_verdicts, item_error, check_batch_size,
+    CheckResponse, AnsweringMachineResponse, BatchPhraseResult, BatchPhraseResponse, BatchSimilarResult,
+    BatchSimilarResponse
+)
+import random
+import heapq
 
 # Настройка логирования
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Глобальные переменные для кэширования
-tfidf_vectorizer = None
-phrases_list = None
-phrases_tfidf_matrix = None
+# Параметры TF-IDF векторизатора сервиса
+VECTORIZER_PARAMS: Dict[str, object] = {
+    "lowercase": True,
+    "stop_words": None,
+    "ngram_range": (1, 3),
+    "max_features": 10000
+}
 
-# База фраз автоответчиков (сокращенная для быстрой демонстрации)
-phrases_db: Set[str] = {
-"Здравствуйте это сбербанк я ваш виртуальный ассистент афина чем я могу помочь",
-"Буквально секундочку не совсем понимаю вас",
-"Можно ли соединить со специалистом",
-"На умных устройствах можно смотреть видео слушать музыку играть и многое другое",
-"Приложение окко и звук нужна подписка сбер прайм а также можно использовать подписки на другие приложения",
-"Так подождите подождите не соображу последний момент повторите еще раз можно помедленнее",
-"Нет я не уверена что нас связывают какие то отношения вы номером не ошиблись",
-"Секундочку связь шалит продолжайте",
-"Что именно вы имели в виду",
-"Подождите я ручку найду говорите",
-"Уточните формулировку для ясности",
-"Я все еще здесь говорите",
-"Я слышу тишину",
-"Раскройте идею подробнее",
-"Что же должно произойти чтобы мне эти условия вообще стали интересны",
-"Сразу предупреждаю я еще ни 1 кредита не выплатила потому что ни 1 не взяла шутка такая я же бот понимаете",
-"Даже не знаю что должно произойти скажем погодные условия поменяться чтобы меня это заинтересовало",
-"Знаете я вообще не очень радуюсь когда кто то не экономит мое время",
-"Некоторые детали остались неясны",
-"Так сейчас тише сделаю слушаю",
-"Проясните пожалуйста свою мысль",
-"Повторите подробно это еще раз",
-"Знаете вы очень вовремя мне позвонили я с этой темой как раз недавно себе наметила разобраться",
-"Приветствую вас это секретарь егора владимировича с 6 утра до 16 30 он не берет трубки потому что спит в остальное время просто не хочет разговаривать",
-"Хотим стать лучше для вас поэтому разговор может быть записан если вы знаете добавочный номер сотрудника нажмите 1 и наберите его в тональном режиме если вы участвуете в секции закупки в качестве поставщика нажмите 2 если вы участвуете в секции продажи в качестве покупателя нажмите 3 для соединения с оператором пожалуйста оставайтесь на линии",
-"Абонент еще не взял трубку гудки пока продолжается дозвон подскажите вы звоните по срочному вопросу",
-"А может ли абонент связаться с вами по номеру с которого вы звоните",
-"Алло здравствуйте продолжаю вызов оставайтесь на линии",
-"Получить лучшее предложение по бронированию наберите 1 если вопрос по заселению в апартаменты нажмите 2 если уже проживаете и у вас остались вопросы нажмите 3",
-"Слышали последние новости вот и я нет потому что мы с вами все говорим и говорим думаю пришла пора прощаться",
-"Карьерные возможности это всегда хорошо еще мне нравятся карьерные перспективы и рост но это уже лучше обсуждать лично все передам спасибо",
-"Все хорошее когда то кончается и плохое тоже вот и нам пора прощаться пока пока",
-"Признайтесь вы просто не хотите беседовать с коллегой по офису и делаете вид что у вас важный телефонный разговор так и быть подыграю",
-"Здравствуйте на связи легион если вы хотите обсудить проект или пригласить нас в тендер нажмите 1 по всем остальным вопросам нажмите 2 или оставайтесь на линии",
-"Центр кредит банк не кошки лимес добро пожаловать в банк центр кредит казах антонгаушин бардебасынас для выбора русского языка нажмите цифру 2",
-"Комиссия эшкенаната сервис здравствуйте вы позвонили в единый накопительный пенсионный фонд для выбора русского языка наберите в тоновом режиме 2 или наберите внутренний номер абонента",
-"Комиссия эшкенаната сервис здравствуйте вы позвонили в единый накопительный пенсионный фонд для выбора русского языка наберите в тоновом режиме 2 или наберите внутренний номер абонента",
-"Если у вас есть вопросы по вашей текущей задолженности и ее погашении нажмите 1 по всем остальным вопросам 2",
-"Для соединения с мангазеей девелопмент нажмите 2",
-"Для соединения с секретарем нажмите 3 или оставайтесь на линии",
-"Для нашей компании нажмите",
-"По вопросу технологических процессов нажмите 6",
-"Заходят как то в бар спамер робот прозвонщик и человек рекламщик",
-"Так как вы все еще на проводе и не хотите класть трубку расскажу вам несколько анекдотов про спамеров и мошенников",
-"Долго еще будут еще эти условия для меня действовать",
-"Когда закончите положите трубку",
-"И минута пошла слушаю",
-"А он какой то давай расскажи",
-"Ой ну давайте ну вообще это как бы должно было быть с вами прямо совещание полноценное",
-"Ну что то я сомневаюсь давайте пока не будем тратить время друг друга вернемся к этому разговору",
-"То есть вы думаете что в онлайн университет мне еще рано",
-"Минуту для уточнения информации я переведу вас на профильного специалиста",
-"Ну а можно вас с мужем посоветовать вечером когда скажу",
-"Признаю вы меня обхитрили я думал наш диалог развивается по прямой но вы мастерски построили ленту",
-"В такой день могли хотя бы предложить билеты в планетарий",
-"5 минут я думаю да ну что сейчас это предел моей зарплаты в хорошие времена поэтому для меня это да",
-"А почему должно быть хорошо я вам вообще что то должна что ли по связи объяснять слушаю вас",
-"Вперед я слушаю",
-"о есть вы думаете что в онлайн университет мне еще рано",
-"А меня могут выгнать из онлайн класса и привести к онлайн директору я знаете ли с рождения в онлайне",
-"Давно хотелось научиться правильно выбирать арбузы вы этому учите",
-"Физики говорят что возле тяжелых объектов время замедляется",
-"А как насчет долгов по учебе умеете закрывать сессию студентам",
-"Ага вы работаете только через интернет просто мне бы интересно было бы в офисе побывать",
-"Сигнала джи эс эм отличный автоматический запуск двигателя выключен",
-"Пожалуйста назовите в формате день месяц и год дату вашего рождения",
-"А у вас нет срочных человеческих дел поесть сыра посмотреть боевик помыть посуду нет тогда давайте",
-"Ой мне сейчас вот невмоготу о таких вещах думать",
-"Мы не получили действительный ответ",
-"еще раз если вы знаете внутренний номер сотрудника наберите его в тональном режиме",
-"ставить отзыв о работе наших магазинов нажмите",
-"Привет администратор перезвонит в ближайшее время а пока можете записаться онлайн на сайте или напиш",
-"Пару минут могу поговорить что у вас",
-"Интересно а как насчет долгов по учебе умеете закрывать сессию студентам",
-"А сколько скидка будет",
-"А я могу передать эту услугу кому нибудь",
-"Для чего это вы интересуетесь",
-"Без проблем могу поговорить сейчас",
-"Каждый раз сама думаю на эту тему но ответа так и не нахожу",
-"Ребенок играет пока так что минуту уделю Замолчала что то",
-"Ерунда какая то не слышно ничего",
-"Ну что такое опять тихо",
-"Я кредитами вообще пользуюсь это все очень ненадежно",
-"Я вас периодически не слышу то булькает то шум какой то",
-"А подводные камни есть",
-"Здорово вот бы еще подробностей",
-"Ну не пойдет Что то опять пропало",
-"Говорите Ну что за лабуда вы здесь",
-"Минута у меня найдется я вся во внимании",
-"Не понял что то а сколько это стоит",
-"А на что эти бонусы потратить можно",
-"Окей а чем я могу быть полезна в этом вопросе",
-"А какой бонус",
-"Вы меня извините что я может быть занудствую но просто меня сомнения одолевают вот то что вы предлагаете это вообще легально у меня или у вас потом проблемы не возникнут а то не хотелось бы в неприятности попасть и вас туда затащить",
-"Сейчас отойду где потише алло",
-"А если я сейчас соглашусь оно сразу действовать начнет",
-"Ах да теперь вспомнила я с нетерпением ждала вашего звонка потому как ваше предложение кажется мне очень подходящим",
-"Все верно это я я вас слушаю",
-"Хотите обрести богатство счастье гармонию с собой что ж одними беседами со мной этого не добьешься просто предупреждаю",
-"Все таки служба телефонных новостей не очень удачная идея",
-"Наверное когда вы звоните друзьям им приходится брать отгул на работе",
-"Как же я соскучился по интересным предложениям",
-"Правда я не совсем понимаю как технически будет реализовано подключение услуги расскажите",
-"Сколько раз я тебе говорила соглашайся но так пока и не решилась",
-"Давайте меняться скидками чур 1 скидываю ну все до свидания",
-"Жду с нетерпением деталей",
-"Ну ну Вы отключились что ли",
-"Я слушаю а сколько у меня есть еще времени чтобы этим предложением воспользоваться",
-"Долго еще будет эта акция работать",
-"Знаете даже не заманчивая конечно я не люблю принимать Побольше информации а сколько будет действовать это предложение",
-"Понимаю что нужно сделать для этого",
-"А какого числа окончание акции",
-"А детали предложения подскажите мне пожалуйста а тариф какой",
-"Что то я не уверена а доставка предусмотрена",
-"Продолжайте а в чем суть вашего предложения",
-"Не надо все взвесить а доставка предусмотрена",
-"Жду подробностей на сроки оформления какие",
-"Расскажите поподробнее пожалуйста а сколько это стоит",
-"Ваше предложение очень заинтересовало меня можете поподробнее рассказать",
-"Так продолжайте жду подробностей",
-"Информацию от себя зафиксирую а что с качеством",
-"Хорошо просто вопрос вы же понимаете да бесплатный только сыр в мышеловке сколько дней этот доступ и что потом за этим последует",
-"Можете продолжать а какого числа окончание акции",
-"Так запомнила записала а какого числа окончание акции",
-"Я слушаю я бы взял паузу на подумать",
-"Записала ну у вас и конкуренты за свою привлекательность будут",
-"Понимаю возврат средств у вас предусмотрен если что",
-"Ой пока точно не знаю сейчас на процедурах Можете продолжать расскажите петров мне пожалуйста",
-"Это ясно долго еще будут эти условия для меня действовать",
-"А как отказаться потом можно нужно будет лично к вам прийти Кажется сигнал того",
-"Ну а какие процентные ставки",
-"Можно будет как то кредитный лимит больше сделать",
-"А процентная ставка изменится",
-"Давайте я сравню какие еще бывают аналогичные предложения и если у вас действительно выгодно то воспользуюсь предложением как раз просто думала поискать хорошо",
-"Я вас услышала подумаю и если надумаю сама обращусь хорошо",
-"А это только в рамках этого звонка предложение работает Снова пропало соединение с толей",
-"Ну я с ребенком гуляю но могу поговорить",
-"Ну я на площадке детской сейчас тут шумно но говорите",
-"Я все записала что то еще хотите передать",
-"И сколько бонусов начислите Сколько тишина",
-"И куда мне тратить это",
-"Мне кажется мы с вами уже разговаривали вы мне 1 раз звоните",
-"Здравствуйте с вами говорит автоответчик оставьте пожалуйста ваше имя и номер телефона мы вам перезвоним",
-"Опять пропал звук",
-"А ну вот дальше того",
-"Ну вы меня тоже поймите сколько вон историй как 1 завели и тут развели этого",
-"Слушайте ну вы меня тоже поймите сколько историй и как тут развели там развели",
-"Ну вы уж поймите меня сколько вон историй как 1 развели ту развели эту этого",
-"Понял вас ну если честно я вас не запомнил как зовут",
-"Нет возможно я в москве не буду снимать квартиру точнее покупать",
-"Да квартиру хочется приобрести да то есть устал жить с родителями",
-"Ах кисумы есть у вас",
-"Ну прописан там так ну работаю да вот должны уже была квота",
-"Знаете я не развозка пиццы и знаю как это выглядит есть база поэтому",
-"Ну не знаю честное слово Вы отключились что ли",
-"И сколько бонусов начислите",
-"Может через полчасика еще раз мне позвоните я ребенка покормлю и тогда смогу подумать и сказать Вы отключились что ли",
-"Ой что то я запуталась давайте еще раз только покороче Вы отключили что ли",
-"Мне хотелось бы квартиру с видом на марс чтобы с утра встать открыть шторы",
-"Насколько важная информация это может перевернуть понимание самой сути пространства и времени если нет спасибо не нужно",
-"Вы знаете у меня ребенок мне некогда в этом всем разбираться",
-"Можете ли вы пожалуйста объяснить мне как это работает как будто я совсем не в курсе этих ваших технологий",
-"Ох извините сынок мне все эти новомодные технологии даются немного сложно",
-"Рассказать мне больше об этом сервисе я бы хотела знать какие функции он предлагает как он может помочь мне в моей повседневной жизни и что я могу ожидать в долгосрочной перспективе",
-"Что чтобы начать мне нужно просто зарегистрироваться и я могу начать пользоваться всеми функциями",
-"Еще раз расскажите подробнее что входит и сколько это будет стоить для меня",
-"Ну ну Э вы институт",
-"Процентные ставки у вас часто пересматриваются",
-"Вроде понятно все ну а вам это зачем какая вам выгодна А вы куда пропали",
-"Ну продолжается Снова не слышно",
-"Я тихо сказала что ли А что мне с этим делать можно будет",
-"Из этого разговора я убрал все сидячие места чтобы вы не могли посидеть на дорожку всего чудесного",
-"Интересно вакансия подразумевает бесплатные дмс для робота секретаря кандидата я все передам спасибо",
-"Ну слушайте я что то не поняла а как этой услугой назвать пользоваться вообще нужно оформлять как то специально",
-"Слышали последние новости вот ее нет потому что мы с вами все говорим и говорим думаю пришла пора прощаться",
-"Настолько похолодало что вы замерзли и не можете положить трубку попробую согреть вас шутками",
-"Вы тоже заметили какая здесь стабильная связь я рад что мы можем продолжать этот разговор часами",
-"Алло у меня времени нет на молчанку",
-"Ой что то я запуталась давайте еще раз только покороче",
-"Очень интересно а можно узнать подробности чтобы я успела записать",
-"Извините за неожиданный вопрос а вы не робот",
-"Ой опять прервалось",
-"Платить за это дополнительно надо",
-"Не знаю я таким не пользуюсь",
-"А долго эта заявка оформляется",
-"А увеличить кредитный лимит можно будет",
-"Вы отключились что ли Ой не знаю по мне так кредиты но это вообще не выход с ними только хуже становится",
-"А почему вы мне это предлагаете",
-"Ну и что так и будем молчать",
-"Я кредитами вообще не пользуюсь это все очень ненадежно",
-"Фотоаппарат у меня того",
-"А кто там по поводу этого по кэшбэку",
-"Ну я даже не знаю а зачем мне это все Алло вы пропали",
-"А чтобы отключиться потом что надо будет сделать а то мне в прошлый раз так идти куда то пришлось а у меня и без этого дел хватает",
-"Вы здесь вообще Мне идти куда то надо будет чтобы подтвердить согласие у меня времени нет на это",
-"у меня билайн сейчас а вы что предлагаете",
-"а что то делать надо будет я же не умею",
-"а на международные тарифы это влияет как то",
-"А когда хоть есть",
-"Я тихо сказала что ли",
-"Признаю вы меня обхитрили я думал наш диалог развивается по прямой но вы мастерски построили ленту мебиуса что ж продолжим",
-"В качестве моральной поддержки я все еще с вами просто говорю",
-"Если хотите закончить этот разговор всего доброго если нет как я могу это исправить",
-"Я вам за это должен что то буду Я звук на телефоне отключил кажется сейчас погодите",
-"Может быть передать абоненту в какое время можно вам перезвонить",
-"Расскажите пожалуйста о теме звонка я все передам",
-"Чтобы я вас поняла задайте вопрос кратко например как отключить платные услуги или как сменить тариф какую тему обсудим задайте ваш вопрос пожалуйста",
-"Собеседник поставил звонок на удержание разговор будет продолжен пожалуйста не отключайтесь",
-"Все ясно сейчас передам абоненту",
-"Уточните нужно ли вам перезвонить",
-"И как вас представить",
-"Оставьте сообщение для абонента я отправлю его если дозвониться сейчас не получится",
-"Как вас зовут чтобы я вас представил",
-"Уточните вы знакомы с абонентом или мне представить вас",
-"Сейчас посмотрим мам может я вам счетчик в спальню поставлю",
-"Прошу прощения я не поняла не могли бы вы повторить пожалуйста",
-"А это все или есть еще какие то подробности о которых мне стоит уточнить",
-"Так ну немного времени и правда есть слушаю вас",
-"Да мне сын все подключит если надо будет вы лучше мне на телефон информацию пришлите",
-"Я по телефону болтать не любитель но говорите уж",
-"Ну вообще это полезно может быть думаю",
-"Вы лучше плату за интернет внести очень дорого выходит Вы сказали что то сейчас",
-"Да ну зачем это мне Что то тишина",
-"Ну я как то не знаю да да замолчи Замолчала что то",
-"А надолго вы мне ее подключите",
-"Ну а можно я с мужем посоветуюсь вечером и тогда скажу",
-"Ну а можно я с мужем посоветуюсь вечером и тогда скажу Снова пропало соединение что ли",
-"А почему именно мне звоните",
-"Ну я вас поняла спасибо я сама подключу если что можно же так Снова пропало соединение что ли",
-"Ой не знаю по мне так кредиты но это вообще не выход мне только хуже становится",
-"Открытые комиссии всякие там у вас есть Алло",
-"Вопросик такой а штрафы за просрочку какие Что то тишина",
-"Снова 5 того",
-"А что то делать надо будет я же не умею в этих ваших личных кабинетах разбираться",
-"Ой я что то боюсь нахватать этих ваших услуг и потом из долгов не вылезти",
-"Процентные ставки у вас часто пересматриваются Вы отключились что ли",
-"Ну допустим Я сейчас вам сходу не скажу ничего",
-"Ну вы знаете как бы вам сказать то",
-"Спасибо вам за предложение но я думаю",
-"Нужен все таки скрытые платежи или комиссии у вас наверняка",
-"Извините но я не могу предоставить информацию о себе или принимать предложение о партнерстве если у вас есть другие вопросы или нужна помощь я с радостью помогу вам",
-"Спасибо может быть вам есть что добавить",
-"Я могу немного с вами пообщаться надеюсь услышать что то полезное",
-"Это дело хорошее",
-"Дареному коню в зубы не смотрят интересно а я одаренный надо будет спросить у матушки",
-"Так и дальше э Снова 5 того",
-"Готова открыть дверь",
-"Ну я вас поняла спасибо я сама подключу если что можно же так",
-"Ну а можно вас с мужем посоветовать вечером и тогда скажу",
-"Да вы мне звонили с этим предложением уже кстати говоря",
-"Так а если поподробнее другие приложения",
-"Я звук на телефоне отключил кажется сейчас погодите",
-"Я через час с вами созвонилась как раз дома буду и поговорить смогу спокойно",
-"Да я кредитами вообще не пользуюсь это все очень ненадежно",
-"Это ясно а до конца можно мне подумать",
-"Мне нужно подумать пока что не могу принять решение можно взять с кем нибудь подумать",
-"Извините я не очень внимательно слушала честно говоря в чем ну бонусы заключаются еще раз",
-"Да ну медицина то мне Замолчала что то",
-"За звонок спасибо приятно что старых клиентов не забываете",
-"Не меняйте мне ничего пока вроде и так все хорошо",
-"А что мне с этим делать можно будет",
-"Пропали кто то",
-"А эта услуга вот прямо сразу оформится у меня времени то нет к вам ходить",
-"Мне как то спокойнее если я лично это все включу",
-"Виртуальная атс важная составляющая современного бизнеса виртуальная атс позволит вам переадресовывать звонки клиентов на ответственных менеджеров причем в порядке установленном вами поможет записывать разговоры и проигрывать мелодии и обращения упростить дозвон до специалистов и многое другое",
-"А это только в рамках этого звонка предложение работает",
-"Ну мне вроде и сейчас всего хватает",
-"А вы не мошенники",
-"А что от меня требуется куда я должен подойти",
-"Ну это звучит как какой то развод честно говоря",
-"Говорите погромче пожалуйста",
-"А кто определяет хорошие новости или нет давайте перенесем их в категорию нейтральных и потом оценим",
-"А как мне это использовать я не понимаю",
-"А где почитать можно про условия подробнее",
-"Сейчас секунду иди только аккуратно а почему вы мне это предлагаете",
-"А можно узнать чем мне наш разговор будет полезен",
-"Скажите а наш разговор сейчас записывается",
-"Понял вас сейчас повисите буквально минуту",
-"Пару минут могу уделить а что вы хотели",
-"Мих миха сюда подойди пожалуйста але извините ребенок далеко убежал еще раз можете повторить",
-"Физики говорят что возле тяжелых объектов время замедляется судя по этому разговору мы с вами попали в черную дыру",
-"Предлагаю взять тайм аут позвоните если будете готовы начать все сначала",
-"Что то аппарат у меня того",
-"У меня какие то документы нужны будут",
-"Я могу предложить вам оставить сообщение для юриста который свяжется с вами и расскажет подробности",
-"А это предложение только на 1 номер или как у меня еще 2 номер есть",
-"Вы здесь вообще ну а какие процентные ставки",
-"Открытые комиссии кстати там у вас есть",
-"Вас перезвонить на данный номер если у вас есть вопросы по вашей заявке если у вас вопрос по другим",
-"Я поняла ну хорошо тогда давайте сделаем замену счета как это сделать",
-"Ну я то что думал к другому оператору уйти а тут вы с таким предложением",
-"А у меня вот 2 номер сотовый для работы есть на него это распространяется там нужно его",
-"Ну вы меня заинтересовали готова записать можете уточнить все условия пожалуйста",
-"Ух ты вы робот несущий своими звонками и доставку не пользу такое в наше время редко бывает завидовала бы вам если бы умела",
-"Неплохо неплохо",
-"Ну я не пробовала такие продукты раньше отказаться то хоть можно будет если не понравится",
-"Я про ваш сервис слышала но точно не знаю как это у вас работает расскажете",
-"И это можно как то онлайн все сделать или как",
-"Ну я то все думал к другому оператору уйти а тут вы с таким предложением",
-"Мой любимый фитнес фитнес для мозга ежедневный подсчет",
-"Чем диалог отличается от монолога",
-"Сейчас запишу хотите что то добавить",
-"Если я скажу до свидания это значит что у нас будет свидание как то неловко",
-"До встречи в измерении волшебных единорогов все сюда рано или поздно попадут",
-"Сколько у меня еще есть времени чтобы Это предложение воспользоваться",
-"Карта сомнительна так это дорого",
-"Ну так сразу и не скажешь ну у вас и с конкурентом условия привлекательные будут",
-"Понятно а сроки оформления какие",
-"А как этот самый тариф поменять",
-"Так ну Что то аппарат у меня того",
-"А на междугородние тарифы это влияет как то",
-"А у меня билайн сейчас а вы что предлагаете",
-"Но меня и мой тарифный план устраивает вполне",
-"Ну мтс вроде бы",
-"Скажите погромче я вас не услышал",
-"Ну я сейчас не дома но раз уж позвонили уже",
-"Это понятно скажите по получению какие будут",
-"Снова пропало соединение с олей",
-"Спасибо конечно но подарки у вас так себе",
-"А это только в рамках этого звонка предложения работают",
-"А что еще с условиями какой лимит",
-"Я вам за это должен что то буду",
-"Расскажите а почему это полезно",
-"И как это нужно использовать",
-"А лимит по этому кредиту какой",
-"Снова пропало соединение с солей",
-"Снова пропало соединение что ли",
-"Да я сейчас вам сходу не скажу ничего",
-"Ну пока нормально звучит",
-"Что то не работает",
-"Так сейчас сделаю рассылку тогда чтобы подшлемники",
-"Серег я слушаю Что то опять пропало",
-"Да в личном кабинете алло",
-"Я тут в очереди сижу как раз минут 5 найдется",
-"Я следующий",
-"А вот у меня вопросик уже есть",
-"Чтобы его провести у него нет таких деталей в смене",
-"Не расслышал что вы сказали",
-"Так а вы кто еще раз Опять пропал звук",
-"А с меня за это деньги спишут",
-"Ну ну Связь барахлит что ли",
-"А я вот спросить хочу Связь барахлит что ли",
-"Так у меня как раз есть несколько свободных минут я слушаю",
-"Можете рассказать мне о том как это работает и как это может помочь мне в моей повседневной жизни",
-"Я бы хотела знать какие функции он предлагает как он может помочь мне в моей повседневной жизни и что я могу ожидать в долгосрочной перспективе",
-"Ой не знаю по мне так приблизительно это вообще не выход мне только хуже становится Я тихо сказала что ли",
-"Я сейчас вам сходу не скажу ничего",
-"Вы сказали что то сейчас",
-"А еще раз скажите вы от какого оператора звоните то я уже опять забыл",
-"Можете мне это предложение выслать смской а я потом уже подумаю",
-"Как хорошо что вы позвонили",
-"Вы нормально можете объяснить или нет",
-"Э ну что такое опять тихо",
-"А если я сейчас сошлюсь оно сразу",
-"А как отказаться потом можно нужно будет к вам прийти",
-"Продолжайте я пока слушаю",
-"Э в институт",
-"Открытые комиссии всякие там у вас есть",
-"Готова пообщаться но мне придется отвлекаться",
-"Вопросик такой а штрафы за просрочку какие",
-"Секретарь слушаю и записываю",
-"Извините а вы не могли бы рассказать мне ваше предложение мне правда очень интересно",
-"Давайте с самого начала зачем вы мне звоните",
-"А вы бы сами согласились на это предложение",
-"Ну включайте",
-"А на какой срок этот день стоит",
-"Вы робот Замолчала что то",
-"Мне какие то документы нужны будут Ой опять прервалось",
-"Это не обманный Что то не работает",
-"Секретарь афина у аппарата слушаю вас",
-"Понятно сейчас передам что вы звонили",
-"Я сейчас спрошу уже пойду так что вы мне наберите еще раз попозже может договоримся",
-"Поняла спасибо я изучу подобные предложения и сравни выгоду хорошо",
-"Расскажите пожалуйста обо всех условиях поподробнее",
-"Ну вот я поняла ну давайте продлиться не будем к выполнению мне нужно время",
-"Ну так сразу не правильно и где это находится",
-"Ну я все поняла ну давайте прописаны будем присоединены мне нужно время",
-"А вы куда пропали",
-"Снова пропало соединение в туалет",
-"Снова пропало соединение в туле",
-"А какой кредитный лимит",
-"АллоАллоАллоАлло",
-"Ну давайте только вот не сегодня допустим завтра вечером сейчас просто занят немножко или сегодня вечером ближе к ноч",
-"Сына ты что ли",
-"Алло алло слушаю слушаю пока затрудняюсь",
-"Альтернатив случайно нет",
-"Антизаявка на кредит",
-"Бонусы у вас какие нибудь есть",
-"Будет действовать данное предложение",
-"В качестве моральной поддержки",
-"Валера отдай",
-"Ваших конкурентов условия по привлекательнее будут",
-"Взвесить все за",
-"Взять тайм аут",
-"Виртуальная помощница",
-"Виртуальный секретарь",
-"Виртуальная система",
-"Включаю секундомер",
-"Возврат средств у вас",
-"Восторге от предложения",
-"Вот этот ползунок",
-"Времени чтобы этим предложением воспользоваться",
-"Все таки над этим надо подумать",
-"Все хорошее когда то кончается и плохое тоже",
-"Вызываемый",
-"Выхожу теперь попробуйте говорить",
-"Говорите слушаю все ясно",
-"Давайте уже ближе к делу не слышно",
-"Давайте в режиме эпидемии",
-"Давайте еще раз по условиям поговорим",
-"Давайте торопиться не будем с решением",
-"Давайте я посоветуюсь по этому поводу сейчас не могу ответить",
-"Детали предложения расскажите мне пожалуйста",
-"Длительность сообщения достигла максимальной велечины",
-"Для передачи сообщения",
-"До конца месяца можно мне подумать",
-"Должно быть получше не знаю может вы меня вообще не слышите сейчас слышно",
-"Допили чай доели торт",
-"Другие варианты можете предложить",
-"Другие варианты предложить можете",
-"Друзьям им приходится брать отгул на работе",
-"Долго еще будет эта акция действовать",
-"Ерунда постоянно у меня прерывается",
-"Если можно недолго пожалуйста",
-"Если пару минут то я готов пообщаться",
-"Если правда пару минут",
-"Если что то забыли скажите всего доброго",
-"Есть 5 минут к сожалению",
-"Есть еще какие то детали которые лучше сразу узнать",
-"Есть у меня к вам вопросы",
-"Есть я так вообще тороплюсь дел сегодня много",
-"Еще что интересненькое у вас есть",
-"Жарко вы говорите",
-"Жду подробностей",
-"Желаете добавить",
-"Записал передам",
-"Записал что либо еще",
-"Записываю можно еще раз информацию",
-"Запомнил записал",
-"Запуск двигателя",
-"Зачем вы мне звоните и какое у вас предложение",
-"Зачем вы мне звоните а с кем я разговариваю",
-"Зачем вы мне звоните слушаю",
-"Зашли в петлю из нее только 1 выход",
-"Звоните из таксофона",
-"Звоните по личному или по деловому вопросу",
-"Звук на телефоне выключен",
-"Звучит довольно интересно",
-"Истекло время ожидания ввода",
-"И что вы хотите предложить",
-"Иду иду",
-"Из гаража сейчас выйду",
-"Из этого разговора я убрал все сидячие места",
-"Избавление от кредитных мошенников",
-"Информацию зафиксировала",
-"К сожалению переключаю на другую линию",
-"Кажется пришло время закругляться",
-"Какая цель вашего звонка",
-"Как долго будет еще актуально",
-"Какие то мутные у вас условия",
-"Какок время это будет актуально",
-"Какое время будет удобно вам для связи",
-"Какое у вас предложение по подробнее",
-"Какое у вас предложение я слуашю",
-"Какой будет порядок оформления",
-"Какой порядок действий при оформлении",
-"Кареты иногда превращаются в тыкву",
-"Кнопка западает так что нужно подождать",
-"Компьютеры производят миллионы вычислительных",
-"Кредит своим выдуманным особняком на камчатке",
-"Люблю принимать необдуманные решения мне нужно",
-"Меня времени не особо",
-"Меня не так много времени есть",
-"Меня отвалекли прослушал последнее",
-"Мне вас пока не слышно так что не говорите ничего пожалуйста",
-"Мне кое что в телефоне нужно поправить",
-"Мне нужно все взвесить",
-"Мне нужно еще что то знать",
-"Мне скоро уходить надо",
-"Мне уходить скоро надо",
-"Может быть интересно сколько это стоит",
-"Может быть интересно что нужно сделать для этого",
-"Может быть у вас эксклюзив",
-"Может ли абонент связаться",
-"Можете добавить что нибудь а потом повесьте трубку",
-"Можете поговорить а я послушаю голос",
-"Можете подождать секундочку и должнать стать получше",
-"Можете продолжать а что нужно сделать для этого",
-"Можете продолжать понял",
-"Можете рассказывать а где это находится",
-"Можете рассказывать долго еще",
-"Можете рассказывать ясно",
-"Можете что то еще рассказать что то еще",
-"Можно будет отказаться если",
-"Можно время на подумать",
-"Можно еще разочек",
-"Мутные у вас условия какие",
-"Мхатовскую паузу",
-"Надеюсь у вас есть специалист по отказам",
-"Написать симфонию создать шедевр",
-"Напомните пожалуйста о чем вы говорили а то меня это совсем с толку сбило",
-"Настолько похолодало что вы замерзли",
-"Настройка громкости",
-"Наш разговор конфиденциален",
-"Не останавливайтесь",
-"Недельку подождет",
-"Немного времени и правда есть",
-"Нота соль",
-"Ну знаете а с кем я разговариваю",
-"Ну не условия какие то может чем то",
-"Ну это самое и какое у вас предложение",
-"Обрести богатство счастье гармонию",
-"От меня то вы что хотите так продолжайте",
-"Откуда у меня время на оформление кредита",
-"Очень заманчиво выглядит",
-"Понятно а от меня то вы что хотите",
-"Плохо стены толстые",
-"По другим вопросам вы консультируете",
-"Пдоробностей не очень хватает",
-"Подскажите поподробнее пожалуйста не слышно",
-"Поесть сыра",
-"Пожалуйста посоветуйте адвоката",
-"Понимаю алло алло я слушаю",
-"Поняла нужно передать еще что то",
-"Понятно расскажите по подробнее пожалуйста",
-"Попробуем быстро",
-"Поставить в нашей беседе точку но кажется ваш любимый знак многоточие",
-"Потом сбросили может не слышно",
-"Потребуется если я вдруг захочу согласиться",
-"Почему ваше предложение лучше",
-"Почему это мне будет это полезно",
-"Пошли титры",
-"Предложение сильно ограничено по времени",
-"Предлагали вариант получше",
-"Предлагать квартиру голосовому",
-"Прерывается сегодня алло алло слышно меня",
-"Преторьева",
-"Привозим не сильно гремит но по времени",
-"Прижали руки были заняты и он упал",
-"Признайтесь вы просто не хотите беседовать с коллегой по офису",
-"Признаю вы меня обхитрили я думал наш диалог развивается",
-"По условиям поговорим",
-"Про что еще можете рассказать",
-"Проблема актуальная",
-"Продолжайте а зачем вы мне звоните",
-"Продолжайте затрудняюсь догда пока вам ответить",
-"Продолжайте обратите внимание",
-"Пум пум пум",
-"Рад что вам нравится разговаривать со мной сейчас попробую сказать то же самое про вас",
-"Расскажите чуть по больше по условиям",
-"Расскажите ка пожалуйста подробнее про условия",
-"Расскажите по подробнее пожалуйста и какое у вас предложение",
-"Расскажите по подробнее пожалуйста от меня то вы что хотите",
-"Расскажите по подробнее пожалуйста это дорого",
-"Рассказать чем я могу вам помочь",
-"А снова взять того",
-"Билайн если я не путаю ничего",
-"В моем измерении минута уже прошла",
-"В этот кабинет правильно",
-"Вас нет срочных человеческих дел",
-"Вас поняла спасибо я сама? подключу если что можно же так",
-"Предложение расскажите мне пожалуйста",
-"Вот мой этаж выходной",
-"Вот не в моготу о таких вещах думать",
-"Вот теперь должно работать скажите что нибудь",
-"Врачу уже пойду так что вы мне наберите еще раз попозже может договорим",
-"Все хорошее когда то кончается",
-"Вы лучше плату за интернет внести очень дорого выходит",
-"Вы работаете только через интернет просто сейчас я работаю официант",
-"Где прочитать можно про условия поподробнее",
-"Говорите но мне за малышом еще надо следить",
-"Да мне сын все подключит если надо",
-"Да я по телефону особо не говорю в ватсапе больше",
-"Давайте с сыном посоветуюсь он в этих штуках разбирается",
-"Делать надо будет я же не умею в этих ваших личных кабинетах разбирать",
-"До встречи в измерении волшебных единорогов",
-"До свидания если я больше не хочу с вами свиданий",
-"Дорого что то ребятушки дорого вы так клиентов не удержите",
-"Другие все такое пройдитесь по условиям еще раз",
-"Если так пошлют она сразу действовать начнет",
-"Еще по условиям погашения задолженности",
-"Занимаюсь никогда раньше не пробовала будет порядок оформлен",
-"Звучит интересно мне как раз хотелось бы денег подкопить сейчас",
-"Знаете чем поке отличается от поке",
-"Идти то до вашего офиса далеко или вы сами придете",
-"Интересное предложение озвучьте пожалуйста дополнительные детали",
-"Истории транзакций можно будет посмотреть",
-"Каждый сигнал того",
-"Как мне это использовать я не понимаю",
-"Как то сомнительно откройте оформления какие",
-"Как этот самый тариф то поменять",
-"Каких счетов у меня не было таких операций",
-"Лучший подарок это эмоция. можете подарить мне легкий душевный трепет",
-"Меня билайн сейчас а вы что предлагаете",
-"Меня и мой тарифный план устраивает вполне",
-"Меняйте мне ничего пока вроде и так все хорошо",
-"Мне кажется я что то подобное уже слышал",
-"Мне нужно в 10 всегда и против",
-"Мне так кредиты но это вообще не выход с ними мне только хуже становится",
-"Мне тут еще посоветовали спросить есть ли на этой карте условия по страхованию покупок",
-"Могу сказать что я вам поставила 5 предложений а где это находится",
-"Может быть вы бы хотели что нибудь еще передать я слушаю",
-"Может это и полезно было бы не знаю",
-"Можете рассказать о своих скидках навскидку",
-"На 1 этаже спуститесь там в регистратуре талон возьми",
-"На междугородние тарифы это влияет как",
-"Не стесняйтесь я все запишу и передам",
-"Нужно передать еще что то",
-"Окей записала еще что то передать",
-"Ответ у вас предусмотрен если что",
-"Отвлекли скажите последнее что вы сказали",
-"Отказаться от позиции можно будет если мне понравится",
-"Отключить там потом надо будет сделать а то мне в прошлый раз",
-"Открытые комиссии в такси там у вас есть",
-"По телефону болтать не любитель но говорите уж",
-"Погодные условия какие то",
-"Подождите вы не подключайтесь пока",
-"Подождите секунду а можно еще раз повторить",
-"Подойди пожалуйста алло извините ребенок далеко убежал еще раз можете",
-"Подсказать это может быть интересно я бы на паузу подумал",
-"Пожалуйста оцените работу",
-"Понимаю сходите по условиям еще раз",
-"Понятно как дерматит случайный вид",
-"Понятно откройте оформления какие",
-"Похоже вы рекордсмен по продолжительности разговоров мне хватило этой беседы",
-"Представляете я сейчас отшучусь и положу",
-"Пробовала такие продукты раньше отказаться то хоть можно будет если мне не понравится",
-"Продолжайте а отказаться в дальнейшем можно будет или мне не понравится",
-"Процентные ставки у вас часто пересматривают",
-"Рассказывайте рассказывайте правительство усваивает начало",
-"Связь прервалась не расслышала что вы последнее сказали",
-"Сейчас не дома но раз уж позвонили уже",
-"Сейчас подождите секунду а можно еще раз повторить",
-"Сейчас секунду иди только аккуратно",
-"Сейчас соглашусь оно сразу действовать начнет",
-"Сейчас я звук на телефоне проверю",
-"Сколько будет стоить в другой город позвонить",
-"Сколько теперь шуток мне нужно придумать под каждый вопрос",
-"Скрытые платежи или комиссия у вас наверн",
-"Слушайте я что то не поняла а как этой услугой воспользоваться вообще нужно оформлять как то специал",
-"Слушаю расскажите ка по подробнее про условия есть тут немного соориентироваться пока",
-"Столько вещь сколько знак заботы и внимания дарящего",
-"Течение какого времени нужно дать ответ",
-"Тут как раз подошла моя очередь вы может через часик мне позвоните",
-"У меня интернет от ростелекома кажется",
-"У меня ребенок мне некогда в этом в самом разбираться",
-"Увеличить кредитный лимит можно будет",
-"Услуга то эта ваша как называется как мне ее потом у оператора попросить если что",
-"Холд он зе лайн ер конверсейшн вил би континьюд",
-"Хотел к другому оператору уже переходить а то как то дорого все у вас",
-"Час с вами созвонилась как раз дома буду и поговорить смогу спокойно",
-"Что от меня потребуется если я вдруг не захочу согласиться",
-"Что то звук на телефоне не работает",
-"Это не обман ведь",
-"Это понятно ну да мы предлагаем вариант получше",
-"Это проблема похожая давайте посмотрю а вот на улице",
-"Это просто так подарок такой или платить надо",
-"Это ясно откройте оформления какие",
-"Я бы с вами разговаривала но давайте лучше не будем прощаемся",
-"Я всегда и ко всему готова слушаю",
-"Я звук на телефоне отключила кажется сейчас подождите",
-"Я могу передать эту услугу кому нибудь",
-"Я обязательно передам если не забуду конечно",
-"У меня есть внимание слушаю",
-"Расслышал помехи были повторите пожалуйста еще раз",
-"Реальном мире на этом месте мы",
-"Реальный сайт или компьютер",
-"Рекордсмен по продолжительности разговора",
-"Ремонт никогда не заканчивается",
-"С какой целью звоните слушаю",
-"С какой целью звоните чем я могу вам помочь",
-"С роботом говорю или с кем",
-"Сахарные губки на связи",
-"Сейчас вынесу их наружу будет получше",
-"Сейчас вам не могут ответить",
-"Секретариева",
-"Секретарь ева",
-"Секретарь макс",
-"Секретарь олег",
-"Секундочку я бы подумала",
-"Скажите ка по подробнее про условия",
-"Сколько примерно займет наш разговор",
-"Сколько сейчас у вас на предложении",
-"Сложно сказать надо подумать это дорого",
-"Служба моральной поддержки",
-"Слушаю а вы мне",
-"Слушаю а какого",
-"Слушаю а сколько у меня еще есть времени",
-"Слушаю вы реальны",
-"Слушаю и какое у вас предложение",
-"Слушаю понимаю",
-"Слушаю понятно",
-"Слышали последние новости вот и я нет потому",
-"Слышно вас было заново скажите",
-"Слышно вас было скажите заново",
-"Сомневаюсь никогда раньше не пробовала",
-"Сообщения скажите откуда вы звоните",
-"Спасибо за участие в опросе",
-"Списывать плохо",
-"Странно говорить вам до свидания если я больше",
-"Суть вашего предложения",
-"Так продолжайте расскажите по подробнее пожалуйста",
-"Так сразу и не скажешь",
-"Так у меня как раз есть несколько свободных минут",
-"Такое предложение очень сложно сразу дать ответ",
-"Телефон из рук выскользнул",
-"Телефон на переключении",
-"Точно вас слушаю здравствуйте еще раз",
-"Тук тук",
-"Умеете закрывать сессию",
-"Уменя проблема с динамиком телефона",
-"Условия для меня будут работать",
-"Физики говорят",
-"Хотя и какое у вас предложение",
-"Хотели очень плохо слышно повторите погромче",
-"Хотите закончить этот разговор всего",
-"Хотите узнать как поменять оператора",
-"Целый день у вас же телефон стоит на зарядке",
-"Цель звонка и представить вас",
-"Человек или компьютер",
-"Чем то еще сможете меня заинтересовать",
-"Чистилище роботов секретарей",
-"Что там с качеством",
-"Что вы хотели понятно",
-"Что вы хотели так",
-"Что вы хотели ясно",
-"Что дальше только духи не предлагайте",
-"Что из этого можете продолжать",
-"Что из этого я слушаю",
-"Что нужно будет сделать для получения",
-"Что с погодой сегодня",
-"Что то мне вас не слышно не могу понять это у меня проблемы",
-"Что то я даже не знаю не уверен",
-"Что то я растерялся",
-"Что то я даже не знаю не уверен что мне это нужно",
-"Это все или мне надо знать что то еще",
-"Это понятно затрудняюсь",
-"Это понятно и что нужно сделать для этого",
-"Это понятно можете продолжать",
-"Это понятно слушаю",
-"Это ясно и какое у вас предложение",
-"Это ясно чем я могу вам помочь",
-"Я бы взял паузу на подумать",
-"Я уже почти на своем этаже",
-"Ясно а зачем вы мне звоните",
-"Ясно а с кем я разговариваю",
-"1 секундочку а другие варианты",
-"1 секундочку ясно",
-"10 звонок",
-"Еще 100 разочек можно",
-"Ева секретарь",
-"К чему вы клоните",
-"Макс секретарь",
-"Олег секретарь",
-"Пройдитесь по условиям еще раз",
-"Робот такой правильно слышу",
-"Весь во внимании",
-"У ваших конкурентов условия попререкать я не буду",
-"Угу угу любопытно расскажите чуть позже по условиям",
-"Фиксировала спасибо какие сроки оформления",
-"Я слушаю вы по другим вопросам не консультируете",
-"Ясно как только это актуально",
-"Это самое к вам доставить или надо будет подъехать",
-"А вы знали что доброе слово человеку что дождь засуху",
-"А расскажите пожалуйста все условия",
-"Алена я говорю по телефону открой пожалуйста дверь там курьер пришел",
-"Вас плохо слышно повторите пожалуйста",
-"Знаете над таким нужно подумать",
-"Кажется все у вас есть что добавить",
-"Связь должна быть безопасной предлагаю обсудить все вопросы в квантовом кармане или может в кибер как вам удобнее",
-"Скажите сколько действует ваше предложение",
-"Так продолжайте чем я могу вам помочь",
-"Так не мешай мне разговаривать по телефону иди иди в свою комнату и сиди там",
-"Ну все я понял я все понял но давайте торопиться не будем",
-"А вы правда считаете что мне это необходимо почему",
-"Как раз есть несколько свободных минут служба",
-"Хотелось бы узнать статистику людей которые принимают такие решения по телефону но я точно не в их числе у вас есть что то еще что может меня переубедить",
-"Рассказывайте рассказывайте мутные условия такие",
-"Как я выхожу алло здравствуйте что вы там говорили",
-"Нет у меня условия какие-то а что с качествами",
-"Ну вот здесь вроде нормально должно быть алло вы еще здесь",
-"Предложение возможно конечно не плохое",
-"Предложение возможно конечно неплохое а доставка у вас",
-"Предложение возможно конечно неплохое почему у вас предложение лучше других какие",
-"Специальное предложение расскажите мне пожалуйста",
-"Так продолжайте переходить к сути",
-"Понятно благодарю за приглашение а другие голосовые помощники тоже будут",
-"1 секундочку затрудняюсь ответить",
-"А другие варианты можете сказать",
-"А еще что интересного у вас есть",
-"Можете рассказать расскажите а способы получения каких будет",
-"Подскажи как предложение сына ограничено по времени",
-"Продолжайте ну у вас из конкурентов условия по пресечению не будут",
-"Подарок это не столько вещь сколько знак заботы и внимания горящего я все понял можете обо мне больше не беспокоиться",
-"Задайте ваш вопрос кратко вот пример как подключить проводной домашний интернет у вас есть вопросы я вас слушаю очень внимательно",
-"Пока что я не владею этой темой но планирую освоить ее в ближайшее время пожалуйста задайте вопрос кратко у вас есть вопросы я вас слушаю очень внимательно",
-"Пунктные условия какие то пройдите ка по условиям еще раз",
-"А ну вот все мой этаж я выхожу",
-"Алло ясно а какого числа окончание акции",
-"Вроде все записано что то еще",
-"Давайте ближе к делу это дорого",
-"Затрудняюсь пока вам ответить сколько это стоит",
-"Это самое как доставить или надо будет подъехать",
-"Взвесить все да и против",
-"А что мне нажать чтобы списать ваш звонок",
-"Век бы с вами разговаривал но давайте лучше не будем",
-"В реальном мире на этом месте мы бы уже допили чай",
-"Скажите а какой период времени ваше предложение актуально",
-"Секунду ой внезапно какой то надо подумать",
-"Уточните пожалуйста по какому вопросу звоните",
-"Спускаюсь но он уже почти приехал секунду подождите немного нет не отключайтесь",
-"Все вот теперь вроде сеть есть алло",
-"А не могли бы вы уточнить детали",
-"Вдруг выскользнул",
-"Мне бы очень хотелось узнать побольше об этом",
-"Можете рассказать мне больше о том как это работает и как это может помочь мне в моей повседневной жизни",
-"Это могло бы быть полезным для меня но мне бы хотелось знать больше о том как это работает",
-"Это может быть полезным для меня но мне бы хотелось знать больше о том как это работает",
-"Вы знаете я всегда предпочитаю быть осведомленным обо всем",
-"Можете ли вы предоставить мне немного больше информации",
-"О том что я получу если решу воспользоваться вашим сервисом",
-"Я бы хотел знать больше деталей все эти функции включены",
-"О это звучит как что то что мне понравится",
-"Может быть вам есть что добавить",
-"Я очень хотела бы с вами поговорить но сейчас занята скажите моему секретарю",
-"Подскажите а приложение сильно ограничено по времени",
-"Подскажите приложение не надо устанавливать",
-"Предложение возможно не плохое а по отправке у вас предусмотрено или что",
-"Так а если поподробнее ну у вас из конкурентов условия",
-"Извините а можно задать серьезный вопрос а вы робот или человек",
-"Но я не люблю принимать необдуманные решения мне нужна больше информации",
-"Какое у вас приложение чем я могу вам помочь",
-"Другие приложения еще может какие то есть",
-"Это может быть интересно отказаться в дальнейшем можно будет если мне не понравится",
-"Понимаю а отказаться в дальнейшем можно будет если мне не понравится",
-"А ну вот мой так выхожу",
-"А вот мой так выхожу",
-"Можете рассказывать расскажите поподробнее пожалуйста",
-"Оператор свяжется с вами в ближайшее время",
-"Помнишь какое там приложение помогает от этого",
-"Давайте уже ближе к делу можете продолжать",
-"Так продолжайте слышно плохо повторите погромче",
-"Вы можете обращаться ко мне как вам будет угодно",
-"Не работает нормально вот",
-"Если хотите поговорить погодите секунду я сейчас",
-"Ну вот здесь вроде нормально должно быть алло вы здесь еще",
-"Ну это может быть интересно что то еще",
-"Довольно интересно вы по другим вопросам не консультируете",
-"Снаружи будет получше",
-"Ничего не работает нормально вот если хотите поговорить",
-"Так что нужно подождать пару секунд прошу прощения сейчас еще момент",
-"Что вы хотите предложить чем я могу вам помочь",
-"Все вот теперь вроде сеть есть алло слушаю вас",
-"Так а если поподробнее и что из этого",
-"Вы кто привет",
-"Ага гао вы кто а что от меня нужно вам",
-"Простите что не смогу вам ответить сейчас полноценно я немного занят это срочное дело",
-"Ой извините мне надо отвлечься на 2 минутки буквально подождите меня не хочу класть трубку",
-"Если это бесплатно то за счет чего вы еще не обанкротились",
-"А какие условия нужно выполнить чтобы пройти обследование",
-"Расскажите а почему мне будет это полезно",
-"Я еще занят подождите еще",
-"Да слушаю слушаю вас только не пойму кто вы и зачем звоните",
-"Как бы сказать так а как я могу получить эту услугу",
-"А какой будет порядок оформлять",
-"Ясно а можно мне взять время на подумать",
-"Можете рассказывать давайте я посоветуюсь по этому поводу",
-"На ваше предложение какое еще время это будет актуально",
-"Ну я все поняла ну давайте торопить не будем с решениями",
-"Что вы хотите предложить понятно",
-"Продолжайте как долго будет действовать предложение",
-"Детали предложения расскажите мне пожалуйста а еще что интересненького у вас есть",
-"Поговорить со мной сейчас просто так не получится я занят важным делом я нахожусь на конференц звонке мне нужно его закончить а потом я смогу говорить подождите несколько секунд",
-"Это срочное дело пока еще занят",
-"Как только я освобожусь то обязательно поговорим",
-"Кто такие и с чем пожаловались не понял",
-"Прослушаю вас извините повторите снова пожалуйста",
-"Ой остановитесь расскажите снова я отвлекся немного",
-"И что мне это дает чем выгодно для меня",
-"Говорите не молчите пожалуйста",
-"А насколько ваше рекламное сообщение уникальное а про торговые преимущества расскажете",
-"Скажите а что необходимо сделать чтобы получить действительно бесплатные условия",
-"Но ведь бесплатного ничего не бывает в чем ваша выгода",
-"И тишина вы тут",
-"Я ничего не понял из за связи что ли повторите пожалуйста",
-"Затрудняюсь пока вам ответить альтернативы прямо нет",
-"Мне нужна больше информация а просто еще можете подсказать",
-"И не понадобится да так слушаю говорите что там",
-"Алло так не нашел очки представляете наверное опять куда то завалились",
-"На кухне что ли оставил",
-"Подождите сейчас очки одену",
-"Вопрос риторический верно я",
-"Вот эта пыль мелкая",
-"Все я выхожу теперь",
-"Вы булькаете",
-"Вы что хотите а зачем вы мне звоните",
-"Выпадает так что нужно",
-"Готово извините за задержку говорите",
-"Доступен вы звоните по",
-"Если поподробнее сколько это стоит",
-"Запутались сильно сейчас",
-"Зачем вы мне звоните можете продолжать",
-"Звоним дальше",
-"Здорово такой правильно слышу",
-"Знаете предложение заманчивое конечно",
-"Знаете я вероятно подумаю над вашим предложением",
-"И какое у вас предложение а от меня",
-"И что из этого понятно",
-"И что из этого с какой целью звоните",
-"И что предложить понятно",
-"Извините телефон упал",
-"Как я могу представить вас",
-"Меня сейчас я поправлю",
-"Мне пару секунд нужно и я к вам вернусь",
-"Может быть может быть можете что то еще рассказать",
-"Можете рассказывать давайте уже ближе к делу",
-"Можете рассказывать и что из этого",
-"Можете рассказывать с какой целью",
-"Напишу что вы звонили",
-"Немного с вами пообщаться надеюсь услышать",
-"Необходимо ли вам перезвонить",
-"Нет такой команды",
-"Никакое у вас не завораживает",
-"Ножнички",
-"Номер знакомый вы мне пару дней",
-"Ну ладно давай кабанчикам или в полсташках",
-"Ну поставить хелен рецепт",
-"Ой не знаю даже я фотографировался",
-"Оператор ответит в течение",
-"Отвалились постоянно происходит",
-"Повторите помедленнее пожалуйста слушаю",
-"Ползунок по моему давайте",
-"Понятно что то еще",
-"Поподробнее пожалуйста ясно",
-"Почти на месте алло",
-"Поэтому надо съездить но наверное время",
-"Предложение заманчивое но я не люблю",
-"Привет я перезвоню при 1",
-"Продолжайте скажите",
-"Продолжайте что вы хотите предложить",
-"Расскажите пожалуйста подробнее давайте ближе к делу",
-"С какой целью звоните и что из этого",
-"Сейчас наружу метнусь",
-"Сначала мне нужно все выяснить что то еще",
-"Так давайте попробуем так говорите",
-"Так ну вот здесь должно быть нормально вроде",
-"Так так так и что из этого",
-"Так так так так а по деньгам",
-"Телефон нужно поправить",
-"Температура двигателя",
-"Теперь попробуйте говорить",
-"У вас предложение можете продолжать",
-"У меня проблемы с динамиком телефона",
-"Хм зачем вы мне звоните",
-"Хм и что из этого",
-"Чем я могу вам помочь давайте ближе к делу",
-"Чем я могу вам помочь расскажите подробнее",
-"Что еще можете рассказать",
-"Это может быть интересно это дорого",
-"Это понятно понимаю",
-"Это понятно ясно",
-"Это ясно и что из этого",
-"Это ясно расскажите подробнее",
-"Я ведь живу в телефоне",
-"Я никак не могу это найти",
-"Я что то нажал и тут звонок",
-"Ясно и что из этого",
-"Ясно можно побыстрее не особо",
-"Одинокий волк на проводе",
-"Зарегистрируйся привяжи карточку",
-"Мертвыматчей че хотел",
-"Можно людей в шкафу хранить живыми желательно",
-"Дружками запрятали чемодан с криптой",
-"Ты свой сыр где храните",
-"Ничего скоро станет прохладней",
-"Нужны кандидаты в федеральную базу спам",
-"Инструменты отвлечения спам",
-"Маковка",
-"Секундочку какие то у вас условия не очень можете мне что то получше предложить",
-"Секундочку расскажите подробней пожалуйста",
-"Секундочку слышно плохо повторите погромче",
-"Секундочку что вы хотите предложить",
-"А зачем вы мне звоните алло алло",
-"А зачем вы мне звоните понятно",
-"А зачем вы мне звоните что вы хотели",
-"А насколько я могу вам доверять вообще",
-"А ну вот мой этаж выхожу",
-"А ой извините я отвлеклась и прослушала",
-"А от меня то вы что хотите понимаю",
-"А от меня то вы что хотите слушаю",
-"А оформление онлайн или нужно приехать в офис",
-"А повторите помедленнее пожалуйста понятно",
-"А повторите помедленнее пожалуйста угу",
-"А почему вы решили что ваш интернет домашний где и как вы его приручили",
-"А сколько у меня есть еще времени чтобы этим предложением воспользоваться",
-"Алло алло я слушаю а зачем",
-"Алло алло я слушаю а от меня то вы что хотите",
-"Алло алло я слушаю а с кем",
-"Алло алло я слушаю где",
-"Алло алло я слушаю затрудняюсь",
-"Алло алло я слушаю и что из",
-"Алло алло я слушаю можно подумать",
-"Алло алло я слушаю настройки оформления какие",
-"Алло алло я слушаю расскажите подробнее",
-"Алло алло я слушаю слушаю а зачем",
-"Алло алло я слушаю что то еще",
-"Барашек",
-"Возможно интересно что либо еще",
-"Вот вроде я и хочу вам помочь но не понимаю как что нужно то",
-"Вот здравствуйте еще раз теперь точно",
-"Вот сейчас буду выходить секунду подождите",
-"Встряхну их может поменять что там так ну вроде как будто что то слышно",
-"Вы мне до этого не звонили голос у вас знакомый какой то",
-"Вы мне это самое сами доставите или куда то подъехать надо будет",
-"Давайте ближе к делу а где это находится",
-"Давайте ближе к делу алло алло",
-"Давайте ближе к делу повторите",
-"Давайте ближе к делу понимаю",
-"Давайте ближе к делу понятно",
-"Давайте ближе к делу тот меня потребует если я захочу согласиться",
-"Давайте уже ближе к делу понимаю",
-"Другие предложения еще может какие то есть",
-"Другие предложения может быть у вас еще есть",
-"Зачем вы мне звоните чем я могу вам помочь",
-"И какое у вас предложение а с кем",
-"И какое у вас предложение давайте ближе",
-"И какое у вас предложение понятно",
-"И какое у вас предложение расскажите подробнее пожалуйста",
-"И какое у вас предложение чем я могу",
-"И какое у вас предложение я робот такой",
-"И какое у вас предложение ясно",
-"И с какой целью звоните а с кем",
-"И что из этого а с какой",
-"И что из этого а с кем",
-"И что из этого давайте уже",
-"И что из этого зачем вы",
-"И что из этого от меня то",
-"И что из этого повторите помедленнее",
-"И что из этого происходит в шупе",
-"И что из этого расскажите подробней",
-"И что из этого слушаю",
-"И что из этого ясно",
-"Из этой колонки удаляй дубликат и посчитаю общее количество а то сейчас как то много выходит",
-"Извините телефон уронил",
-"Или можно подумать пока что не могут принять решение",
-"Как бы сказать с какой целью звоните",
-"Как то сомнительно что то еще",
-"Как это сомнительно а где это находится",
-"Мне вот как раз сейчас должен курьер позвонить",
-"Мне кажется мы говорим о разном можете сказать иначе",
-"Мне недавно предлагали варианты получше так что даже не знаю",
-"Мне нужно подумать пока что не могу принять такое решение а какого числа окончание акции",
-"Мне хотелось бы квартиру с видом на марс",
-"Мне это самое сами доставить или надо подъехать будет",
-"Может быть может еще что то расскажете",
-"Может быть можете еще что то рассказать",
-"Можете продолжать понимаю",
-"Можете рассказывать сколько это стоит",
-"Можете рассказывать так продолжайте",
-"Можете рассказывать чем я могу вам помочь",
-"Можно взять время на подумать",
-"Можно побыстрее у меня времени особо",
-"Можно узнать я сейчас М роботом разговариваю или с реальным человеком",
-"Мы в ответе за тех кого приручили нам другой домашний",
-"Не знаю как то я занимаюсь никогда раньше не пробовала",
-"Не знаю не уверен но это мне нужно а что сказать что",
-"Не слышно вас было наново скажите",
-"Ну знаете И что из этого",
-"Ну знаете расскажите поподробнее пожалуйста",
-"Ну знаете с какой целью",
-"Ну знаете Что вы хотите предложить",
-"Ну как бы и что из этого",
-"Ну как бы связь прервалась похоже алло слышно меня",
-"Ну ну я бы подумала в течение какого времени можно откликнуться",
-"Ну продолжайте а от меня то вы что хотите",
-"Ну у вас от конкурентов используется привлекательная история",
-"Ну у меня условия какие то",
-"Ну это робот такой я правильно слышу вас",
-"Ну это самое и что из этого",
-"Ну это самое понимаю",
-"Ну это самое понятно",
-"Ну я все понял но давайте не торопиться не будем с решениями",
-"От меня вы что хотите с какой целью звоните",
-"Ох как много всего сказано давайте еще раз но уже кратко",
-"Плохо очень Толстая я постоянно никого ничего не работает нормально",
-"Плохо слышно повторите погромче понимаю",
-"Плохо слышно повторите погромче понятно",
-"Повторите помедленнее пожалуйста и какое у вас предложение",
-"Повторите помедленнее пожалуйста и что из этого",
-"Повторите помедленнее пожалуйста понимаю",
-"Повторите помедленнее пожалуйста понятно",
-"Повторите помедленнее пожалуйста я робот такой",
-"Повторите помедленнее пожалуйста ясно",
-"Погодите а вы точно человек так продолжайте",
-"Погодите секунду я сейчас надену",
-"Понимаю а можно взять время на подумать",
-"Понимаю другие предложения еще может какие то есть",
-"Понимаю и что из этого",
-"Понимаю можно взять временно подумать",
-"Понимаю я бы подумала в течение какого времени можно отследоваться",
-"Понимаю я провела паузу",
-"Понятно а зачем вы мне звоните",
-"Понятно а мне можно еще что то знать",
-"Понятно а что нужно сделать для этого",
-"Понятно другие предложения еще может какие то есть",
-"Понятно и какое у вас предложение",
-"Понятно можно взять временно подумать",
-"Понятно можно взять время на подумать",
-"Понятно можно мне взять временно подумать",
-"Правильно слышу и что из этого",
-"Правильно слышу понимаю",
-"Пройдитесь еще раз по условиям пожалуйста",
-"Расскажите подробнее пожалуйста и что из этого",
-"Расскажите подробнее пожалуйста можно взять время",
-"Расскажите подробнее пожалуйста повторите помедленнее пожалуйста",
-"Расскажите подробнее пожалуйста понятно",
-"Расскажите подробнее пожалуйста что то еще",
-"Расскажите подробней пожалуйста давайте ближе к делу",
-"Расскажите пожалуйста подробнее ясно",
-"Расскажите поподробнее пожалуйста але але я слушаю",
-"Расскажите поподробнее пожалуйста бонусы у вас есть какие нибудь",
-"Расскажите поподробнее пожалуйста долг будет еще эта акция работать",
-"Расскажите поподробнее пожалуйста и что нужно сделать для этого",
-"Расскажите поподробнее пожалуйста очень плохо слышно повторите погромче",
-"Расскажите поподробнее пожалуйста плохо слышно повторите погромче",
-"Расскажите поподробнее пожалуйста что то еще",
-"Робот такой я правильно слышу",
-"С какой целью звоните и какое у вас предложение",
-"С какой целью звоните повторите помедленнее пожалуйста",
-"С какой целью звоните это робот такой я правильно слышу",
-"С радостью продолжу разговор но помните",
-"Секрет кева",
-"Секунду пишите к сути",
-"Секунду расскажите подробнее пожалуйста",
-"Сказали уже внезапно надо подумать",
-"Слушаю бонусы у вас есть какие нибудь",
-"Слушаю вас надеюсь что наш диалог будет продуктивен",
-"Слушаю вы мне это самое сами доставите или куда то подъехать надо будет",
-"Слушаю и с какой целью звоните",
-"Слушаю и что из этого",
-"Слушаю можно взять временно подумать",
-"Слушаю это робот такой я правильно слышу",
-"Слышно плохо повторите погромче понятно",
-"Слышно плохо повторите погромче расскажите подробнее",
-"Слышно плохо повторите погромче ясно",
-"Спасибо за ожидание говорите",
-"Стойте я не расслышала помехи были повторите пожалуйста еще раз",
-"Счете недостаточно средств",
-"Так а если поподробнее можете продолжать",
-"Так должно должен вас слышать теперь можете говорить",
-"Так погодите а вы мне сможете курьером привезти",
-"Так продолжайте как только это актуально",
-"Телефон вдруг выскользнул",
-"То есть интернет домашний ваш а возиться с ним вы предлагаете мне",
-"Тут все ты знаешь по стандартной схеме можешь рецепт нагуглить",
-"У меня вот сейчас поправлю",
-"У него другой номер был значит не курьер ну говори тогда поскорее",
-"Хм а от меня то вы что хотите",
-"Хм а процентная ставка изменится",
-"Чем я могу вам помочь а от меня то вы что хотите",
-"Чем я могу вам помочь алло алло я слушаю",
-"Чем я могу вам помочь да робот такой",
-"Чем я могу вам помочь угу слушаю",
-"Что вы хотели от меня то вы что хотите",
-"Что вы хотели отойдите вы точно человек",
-"Что вы хотите предложить от меня что хотите",
-"Что вы хотите предложить с какой целью звоните",
-"Что подробностей и какое у вас предложение",
-"Что то мне вас слышно плохо не могу понять это у меня проблема или у вас",
-"Что то это на моей стороне какая то проблема похоже",
-"Что то я даже не в нем не уверена что где то нужно",
-"Что то я не уверен что то еще",
-"Что ясно ты робот такой",
-"Это может быть интересно а сроки оформления какие",
-"Это может быть интересно крупные условия какие то",
-"Это понятно можете рассказывать",
-"Это понятно я провела паузу у меня память",
-"Это робот такой я правильно слышу",
-"Это ясно а можно мне взять время на подумать",
-"Это ясно я слушаю",
-"Я бы взяла паузу надо подумать",
-"Я записываю можно еще раз всю информацию",
-"Я Сейчас в лифте я вас тоже пока не слышу",
-"Я слушаю а где это находится",
-"Я слушаю другие предложения еще может какие то есть",
-"Я слушаю другие приложения если вам может какие то есть",
-"Я слушаю как только это актуально",
-"Я слушаю можно взять время подумать",
-"Я телефон плечом прижал руки были заняты",
-"Ясно а отказаться в дальнейшем можно будет если мне не понравится",
-"Ясно алло алло я слушаю",
-"Ясно другие предложения еще может какие то есть",
-"Ясно и какое у вас предложение",
-"Ясно можно взять время на подумать",
-"Ясно можно взять время подумать",
-"Ясно можно подумать до конца месяца",
-"Ясно расскажите подробней пожалуйста",
-"Ясно слышно плохо повторите погромче",
-"Меня попросили ответить слушаю вас",
-"Понятно про условия еще раз",
-"Чего не так то просто а там кнопка западает так что подождать пару секунд прошу прощения",
-"Должен вас слышать",
-"Да нас пока не будет слышно так что не говорите ничего",
-"Ну даайте я вам пригляну давайте так попробуем говорить алло",
-"Алло алло здравствуйте у меня тут связано я в устье еду я бы хотела что вы на каждой можете подождать секунду а я должна быть получше когда я приеду не знаю может быть алло",
-"Так продолжайте алло алло я слушаю",
-"Секунду не знаю что вы вообще не слышите сейчас слышите не слышите",
-"Так должна вас слушать можете говорить",
-"Так что нужно подождать пару секунд спасибо а какой сейчас еще момент",
-"Я сейчас закончу разговор на другой линии и сразу к вам собеседник поставил звонок на удержание разговор будет подождите буквально чуть чуть я с вами через мгновение буквально не отключайтесь",
-"Вроде бы все алло слушаю вас говорите пожалуйста",
-"Кажется я случайно включила громкость через динамик",
-"Секунду пожалуйста я сейчас исправлю и вернусь к вам не отключайтесь",
-"Не могу сказать во сколько предложен представится",
-"Я понял от комиссии можно будет",
-"Сравнить а вы мне это самое сами составите и куда то надо будет подъехать",
-"Ага а можно будет тогда да мне не понравится",
-"Ну так сразу и направят расскажите а способы получения какие будет",
-"Да это я что вы хотели",
-"Можете продолжать угу слушаю",
-"Ну мне нужно 10 за и против",
-"Так я здесь на чем мы остановились",
-"Вот состав подключа",
-"Ясно а вы мне это самое сами поставите или подъехать надо будет",
-"А скажите пожалуйста слушаю",
-"А сколько у меня еще есть время чтобы предложений воспользоваться",
-"Сейчас готова теперь слушаю вас добрый день",
-"И сразу к вам собеседник поставил звонок на удержание разговор будет продолжен",
-"Плиз холд он зе лайн е ком еще секундочку висейшен вил би континьюд ух вроде бы все а алло слушаю вас говорите пожалуйста",
-"Сейчас подождите минутку я к вам вернусь",
-"Его на сегодня напишите мне пожалуйста да спасибо за ожидание я тут",
-"Телефон плечом прижал руки были заняты а он упал ну ладно теперь я вас слушаю",
-"Сейчас передам что звонят по объявлениям и попрошу чтобы с вами связались",
-"Ну ну вот здесь вроде нормально должно быть алло вы еще здесь",
-"Давайте ближе где вы можете продолжать",
-"Что вы хотели можете продолжать",
-"Подробности постройте оформление какие",
-"Понимаю у ваших конкурентов условия будут привлекательны просто",
-"Алиса выключи спам",
-"Это не та Элиса обознался",
-"Информацию не всегда зафиксировал спасибо",
-"Сейчас все передам если что вам перезвонят",
-"Я не понял о чем речь для чего звоните",
-"Прослушал вас извините повторите снова пожалуйста",
-"А для меня какая выгода то от этого расскажите",
-"Хотелось бы подробнее узнать расскажите снова",
-"Сейчас я занимаюсь кое какими важными делами и не могу сфокусироваться на разговоре но если вы можете подождать то я обязательно вернусь к разговору подождите",
-"Как компания ваша называется расскажите подробнее что за условия вы предлагаете",
-"Кажется вы не 1 кто предлагает мне эту услугу в чем ценность именно вашей",
-"Перед сном их может поменять что то так ну вроде как будто что то слышите скажите что-нибудь",
-"Сейчас еще секунду подождите пожалуйста вроде нормально теперь должен вас слышать",
-"Ну мне нужно подумать пока что могу принять решение просто ну вам",
-"Так продолжайте я вызвал паузу на подумать",
-"Можно взять временно подумать",
-"Ну вот теперь вроде нормально должен вас выдать",
-"Так я прошу прощения меня отвлекли я прослушала последнее предложение можете еще раз сказать",
-"Это приятно но где же фанфары красная дорожка и шоу программа без этого владение сертификатом не будет радостным",
-"Я провела паузу надо подумать",
-"Пом пом",
-"Спасибо если вы не против то я подумаю",
-"Простите за бестактность но я говорю с роботом или человеком",
-"Буду рад вас послушать что вы хотите рассказать",
-"У ваших конкурентов условия по привлекательным меня будут",
-"Надо будет отказаться если мне не понравится",
-"Продолжайте а у вас из конкурентов условия по привлекательнее будут",
-"Сразу к сути",
-"Оцените пожалуйста качество обслуживания оператора",
-"Ну вот мой этаж выхожу",
-"Фон уронил",
-"Здравствуйте набранный вами номер не используется чтобы купить этот номер обратитесь в компанию",
-"Вот этот звонок по моему давайте я вас реквизирую Давайте так попробуем говорите",
-"Добрый день секретарь слушает говорите пожалуйста",
-"Меня просто попросили ответить а что вы хотели",
-"Называть адрес не буду вы можете рассказать подробнее про свое предложение а я подумаю",
-"Я ничего не понял что сказали повторите снова пожалуйста",
-"Что вы сказали я отвлекся повторите",
-"Повторите что сказали пожалуйста я не понял вас",
-"Мой адрес не дом и не улица а если без шуток то называть не буду давайте продолжим без",
-"А что делать потребуется расскажите снова и про условия подробнее",
-"Алена я говорю по телефону открой пожалуйста дверь нам курьер пришел",
-"Вообще то предложение интересное а что по стоимости",
-"Вы что-то говорили а я отвлекся что сказали",
-"Извините пожалуйста говорите что вы хотели",
-"Я прослушал вас и ничего не понял что говорите",
-"Могу ли я порекомендовать ваши услуги знакомым",
-"Отлично так что вы хотели",
-"Она позволит внести ваш номер в список проверенных обеспечит дозвон до клиентов и улучшит конверсию",
-"Да заказ уже оплачен просто нужно забрать",
-"Что извините я немного отвлеклась повторите пожалуйста",
-"Так подождите давайте еще раз но помедленнее",
-"Ух ты звучит очень круто не могли бы вы рассказать поподробнее",
-"Понятно не возражаете если я поставлю ваш звонок на громкую связь",
-"А не могли бы вы перезвонить завтра мне кажется у меня проблемы со связью",
-"Извините что я вас перебиваю можно задать вопрос",
-"Откуда откуда вы звоните я забыл",
-"Ясно от какого числа концепция акции",
-"Рассказывайте рассказывайте елка еще будет эта акция работать",
-"Я слушаю ваших конкурентов слабопривлекательные будут",
-"Обеспечит дозвон до клиентов и улучшит конверсию",
-"Давайте меняться скидками",
-"Зафиксировал информацию что то хотите добавить",
-"Как можно будет связаться с вами по этому же номеру телефона",
-"Расскажите пожалуйста все условия",
-"Так так так позовите оператора",
-"Какое то время это будет актуально неделька подождет",
-"Ха ха ха а если это интересненько у вас есть",
-"Можете рассказать а скажите подробно пожалуйста",
-"Бонусы у вас есть какие нибудь",
-"Я готова теперь слушаю вас добрый день",
-"У нас средства предусмотрены если что",
-"Подскажите вы по какому вопросу",
-"Извините а вы человек или робот я не совсем понимаю",
-"Извините а где я могу узнать подробнее",
-"Передам ваше сообщение",
-"Только метнуть наружу будет повыше",
-"Написал что вы звонили не беспокойтесь что то еще нужно сказать",
-"Что нужно сделать для этого",
-"Не знаю а у вас есть доставка на дом",
-"Так так так что нужно сделать для этого",
-"В течение какого времени можно потключиться",
-"Можете продолжать а у ваших конкурентов условия привлекать не будут",
-"А соедините с консультантом меня",
-"Самое правильно ставить или надо будет подъехать",
-"Неплохо а сколько долг",
-"После получения какие будут",
-"Ключ прижала поэтому руки заняты поливать Не пахнет Ну ладно говорите теперь",
-"Угу можете продолжать",
-"Можете продолжать понятно",
-"А у наших конкурентов условия это привлекательны будут",
-"Так ну если подробнее",
-"А скажите чуть больше по условиям а другие варианты можно предложить",
-"Поняла бонусы у вас есть какие нибудь",
-"Какое у вас предложение я слушаю",
-"Это все что вам нужно сказать для работы или нужно еще прослушать",
-"Вам ответить отказаться конечно можно будет если мне не понравится",
-"Не будем нужно время нужно ваше предложение сравнить с другими все такое ну должность то будет эти условия будут работать",
-"Продолжайте понимаю с кем могу говорить",
-"Пока затрудняюсь вам ответить у ваших конкурентов условия по привлекательной не будут",
-"Какое у вас предложение понимаю",
-"Ну довольно интересно долго это будет эта акция работать",
-"Расскажите рассказывайте ясно",
-"Слушаю отказаться садиться можно будет",
-"Чем я могу вам помочь поняла",
-"Предложение возможно не плохое",
-"Добрый день пока вам ответить расскажите",
-"Чем я могу вам помочь але але я слушаю",
-"Сколько у меня есть еще времени чтобы этим предложением воспользоваться",
-"Так так так и все внимание",
-"Алло алло я слушаю давайте я посоветуюсь по этому поводу сейчас ответить не смогу",
-"Скажите подробнее пожалуйста слушаю",
-"Подскажите вы звоните по срочному вопросу",
-"Если хотите добавьте что нибудь и положите трубку до свидания",
-"Зависит от того о чем мы будем говорить подскажите по какому поводу вы звоните",
-"Извините а я разговариваю с роботом или человеком",
-"Конечно а по какому поводу вы звоните",
-"Могу поговорить если это не займет много времени",
-"Можно уточнить вы робот или человек",
-"Подскажите а вы робот или человек",
-"Подскажите я с человеком разговариваю",
-"Расскажите а что вы хотели предложить мне очень интересно",
-"А зачем вы мне звоните от меня вы что хотите",
-"А зачем вы мне звоните от меня то вы что хотите",
-"А зачем вы мне звоните так продолжайте",
-"А зачем вы мне звоните я слушаю",
-"Ну знаете подскажите предложение сильно гремит с добавлением",
-"Здравствуйте чем могу помочь",
-"Я слушаю ваших конкурентов привлекательные будут",
-"Информация с 1 спасибо как только это актуально",
-"Информация спасибо ну у нас конкуренты достаточно привлекательные",
-"Крупные условия какие то",
-"Ну мне нужно 10 да и против",
-"Ну мне нужно подумать пока что могу принять решение",
-"Подскажите приложение скину ограниченное по времени",
-"Полковник соловец",
-"Сейчас готово теперь слушаю вас добрый день",
-"Скажите подробнее пожалуйста",
-"Так а ехать подробнее",
-"Так я понял угу записал",
-"Я слушаю чем я могу вам помочь",
-"1 рукой собирай другой сей",
-"Алло алло могу ли я повторить звонок",
-"Алло вы еще здесь могу ли я направить смс с напоминанием о вашем звонке",
-"Алло вы тут отправим смс",
-"Алло извините слушаю вас",
-"Березнева",
-"Буквенные условия какие то",
-"В какое время можно с вами связаться",
-"В течение какого времени можно облизнуться",
-"В течение какого времени можно ответить",
-"В течение какого времени нужно дать ответ",
-"Вам переодобрена кредитная карта",
-"Вашего предложения так продолжайте",
-"Ввиду подробности остальное",
-"Внезапное предложение какое то надо подумать",
-"Вопросы ваших конкурентов и сразу привлекать они будут",
-"Вот текст должен работать скажите что нибудь",
-"Вот это поворот по моему давайте его отрегулируем давайте так попробуем",
-"Вы знаете мне недавно предлагали варианты получше так сразу не знаю пока не очень заманчиво",
-"Вы по другим вопросам не консультируете",
-"Вэ кауд пари из каунтли аневейлбл плиз кол бэк лэйтер",
-"Гаража выйду",
-"Говорит хозяин пока это тело космическое доковыляет до аппарата хозяин с тобой поговорит",
-"Да предложение расскажите мне пожалуйста",
-"Да это понятно хорошо и все можете рассказать",
-"Да я пон извините записал",
-"Давайте ближе где вы это дорого",
-"Давайте так я все передам что то еще нужно сказать",
-"Детали предложения подскажите мне пожалуйста и где это находится",
-"До конца минут можно мне подумать",
-"Долго будет приходить за холодом работать",
-"Долго еще будет удача работать",
-"Еще еще момент но вот теперь вроде нормально должен вас вытащить",
-"Еще секундочку вроде бы все",
-"Закончите положите трубку",
-"Записала еще что нибудь",
-"Зафиксировала информацию что хотите добавить",
-"Зачем вы мне звоните понимаю",
-"Звучит очень интересно а можно подробнее",
-"Здравствуйте с вами говорит персональный помощник говорите не стесняйтесь я все запишу и передам",
-"Знаете жизнь дана на добрые дела",
-"Знаете предложение заманчиво но я не удовлетворен ни мне нужно знать больше информации",
-"И я весь во внимании алло да я слушаю",
-"Какое у вас предложение так продолжайте",
-"Из дисконнектит ор аут оф нэтвок таврич он фочен",
-"Извините а вы не могли бы рассказать мне о вашем мне правда очень интересно",
-"Извините за задержку говорите слушаю вас",
-"Информация связь фиксирована спасибо что то еще",
-"Информация сейчас фиксирую спасибо затрудняюсь пока вам ответить",
-"Кажется вы опоздали мне всю важную информацию уже сообщили",
-"Как бы с родительскими условиями еще раз",
-"Как то сам нечаянно а где это находится",
-"Как то сомнительно другие приложения если он может прийти теперь",
-"Как то сомнительно я бы взяла паузу у нее продумать",
-"Как это сомнительно да и все что интересненького у вас есть",
-"Какие данные основные условия",
-"Какого числа какая нация",
-"Какую сторону звоните ясно",
-"Конкуренты будут привлекательнее будут",
-"Кто определяет хорошие новости или нет давайте перенесем их в категорию нейтральных и потом оценим",
-"Курс по окончанию акции",
-"Лучше да вам интересно расскажите о способе получения кредита",
-"Любопытно расскажите чуть позже по условиям можно узнать время подумать",
-"Мне кажется я что то пропустила а действует до какого срока",
-"Мне наверное нужно больше информации что то еще",
-"Мне нужно 10 киа за и против",
-"Мне нужно больше информации можно взять временную на",
-"Мне нужно больше информации это дорого",
-"Мне нужно в 10 за и против",
-"Мне нужно подумать пока не могу принять решение нудные условия какие то",
-"Может быть можете что то еще рассказать",
-"Может быть подробности чем я могу вам помочь",
-"Можете продолжать переходите в список",
-"Можете продолжать я слушаю",
-"Можете рассказывать а отказаться в дальнейшем можно будет",
-"Можете рассказывать понятно",
-"Можно сказать надо подумать откройте оформление какие",
-"Мой любимый фитнес фитнес для мозга ежедневный подсчет доходов расходов анализ трат очень тонизирует",
-"На телефоне выключен также и они перезвонят",
-"На хороший цветок и пчелка летит",
-"Навигатор тыц тыц навигатор",
-"Наконец то а то все звонят да звонят с не важной информацией",
-"Не знаю как то я сомневаюсь никогда",
-"Не могу сказать что я в восторге от вашего предложения",
-"Мне надо все взвесить это дорого",
-"Не понимаю ух ты из за этого",
-"Не поняла опять господи глухая",
-"Не поняла я я глуховата че че еще раз",
-"Никакое у вас предложение чем я могу вам помочь",
-"Ничего не понятно но очень интересно повторите",
-"Номер не в сети попросите его перезвонить я отправлю ему смс",
-"Ну в принципе довольно интересно а можно подумать до конца месяца",
-"Ну все я понял ясно ну давайте тогда не торопиться",
-"Ну да средства предусмотрены если что",
-"Ну это самое вот тут подробнее пожалуйста",
-"Ну это самое может быть попозже",
-"Ну это это самое а где это находится",
-"Ну я все поняла но давайте обратиться не будем",
-"Ну я все поняла ну давайте торопиться не будем",
-"Нужно будет сделать для получения",
-"Об этом сервисе я бы хотела узнать какие функции он предлагает как он может помочь мне в моей повседневной жизни и что я могу ожидать в долгосрочной перспективе",
-"Ой как будто что то слышу теперь скажите что нибудь",
-"Оказалось улицы с похожим названием есть в Париже",
-"Отказаться от каких то можно будет если не понравится",
-"Оставьте сообщение и я мигом доставлю его абоненту",
-"От меня вы что хотите алло алло я слушаю",
-"Отказаться в дальнейшем можно будет если",
-"Подарок это не столько вещь сколько знак заботы и внимания дарящего",
-"Подождите буквально чуть чуть и я с вами чуть мгновение буквально не отключайтесь",
-"Подскажите предложение и сильно ограниченное давлением",
-"Пожалуйста задайте свой вопрос я многое умею и часто помогаю быстрее оператора",
-"Позвольте поинтересоваться о чем вы хотите рассказать",
-"Пока не будет слышно так что не говорите ничего",
-"Пока я звоню дальше уточните вам необходимо срочно с ним связаться",
-"Понимаю а где там основные условия",
-"Понятно а какого числа концертная акция",
-"Понятно а отказаться от границы можно будет если мне не понравится",
-"Понятно какие сроки оформления",
-"Понятно можно подумать до конца месяца",
-"Подробнее про уколы что то я не могу упираться пока",
-"Постройте оформление какие",
-"Похоже что разговор себя изжил но если вы хотите его реабилитировать продолжайте я не тороплюсь",
-"Простите я сейчас закончу разговор на другой линии и сразу к вам собеседник поставил звонок на удержание разговор",
-"Предложение какое то надо подумать",
-"Предложение лучше других соседей",
-"Предлагаю не экономить но я не люблю принимать ни объемные решения мне нужно",
-"Принято что то еще добавите",
-"Продолжайте ну а сколько это стоит",
-"Продолжайте расскажите способ получения какие будут",
-"Прошу прощения что ж такое сейчас еще секунду подождите пожалуйста вроде нормально теперь должен вас выслушать",
-"Расскажите вкратце о чем разговор предстоит",
-"Расскажите способы получения детей в будущем",
-"Рассказывайте рассказывайте вы это самое",
-"Рассказывайте рассказывайте о сроке оформления",
-"Рассказывайте рассказывайте понятно",
-"Рассказывайте рассказывайте пунктные условия какие то",
-"Рассказывайте рассказывайте пожалуйста подробнее",
-"Рассказывайте рассказывайте это дорого",
-"Рассказывайте рассказывайте я слушаю",
-"Решение мне нужно больше информации расскажите после выплачения какие будут",
-"Сейчас перекину их может поменять что то",
-"Сейчас секунду поставлю так должен вас услышать теперь можете говорить",
-"Сейчас тут очень плохой сигнал",
-"Сейчас у меня проблема с динамиком телефона барахлит постоянно в последнее время",
-"Секундочку не так вы вообще не слышите сейчас слышите не слышите",
-"Секунду можно на какое то время подумать",
-"Скажите оператор",
-"Сложно сказать надо подумать ну у вас у конкурентов условия привлекательные будут",
-"Сложно сказать надо подумать сколько это стоит",
-"Сложно сказать ну да средства у вас предусмотрены если что",
-"Слушаю а какой порядок действий",
-"Слушаю а отказаться в больнице можно будет если мне не понравится",
-"Слушаю вас ясно",
-"Слушаю с какой целью звоните",
-"Слушаю у меня сейчас вот буквально несколько минут на разговоры есть",
-"Сначала мне нужно все ответить долго еще будут эти условия у меня действовать",
-"Снимаем гайку правильно",
-"Специальное предложение скажите мне пожалуйста",
-"Сезон нашего разговора немного затянулся предлагаю не продлевать",
-"Так а если поподробнее может с кем то еще можете меня заинтересовать",
-"Так а если поподробнее понятно",
-"Так а если поподробнее что то еще",
-"Так давайте ближе к делу",
-"Так запомнила записала",
-"Так запомнила тогда может с кем то еще сможете меня заинтересовать",
-"Так конечно подробнее понимаю к чему вы звоните",
-"Так ну вроде как будто что то",
-"Так поняла может что то еще мне надо знать",
-"Так продолжайте а интернета случайно нет",
-"Так продолжайте альтернативы случайно нет",
-"Так продолжайте ну да средства предусмотрены если что",
-"Так слушаю вас внимательно что передать",
-"Так что не говорите ничего",
-"Так что чтобы начать мне нужно просто зарегистрироваться и я могу начать пользоваться всеми функциями",
-"Там кнопка западает вообще нужно подождать пару секунд прошу прощения",
-"Телефоне только холодные звонки когда включаться горячие",
-"Тишина конечно интригует",
-"Мне позвонить надо пару минут он орать будет на фоне а мне даже выйти некуда алло извините слушаю вас",
-"Тогда могу вам спокойно отвечать",
-"У вас предложение хранить или нет ну и все такое какие сроки оформления",
-"У вас условия не особо можете что то получше предложить",
-"Хотите добавьте что нибудь и положите трубку до свидания",
-"Хотите можете добавить что то еще",
-"Чего вы могли изменить в себе прямо сейчас что это было",
-"Чем лично у меня должен появиться интерес к вашему предложению",
-"Чем поке отличается от пока",
-"Это вы удачно позвонили рассказывайте",
-"Это может быть интересно а можно узнать время на подумать",
-"Это может быть интересно и где это находится",
-"Это понятно чем я могу вам помочь",
-"Это ясно понимаю",
-"Я вас слушаю а вы подыскиваете людям жилье или продаете",
-"Я вообще тороплюсь сделать сегодня много",
-"Я всегда готов поговорить про деньги продолжайте",
-"Я могу только передать информацию менеджеру и если ему будет интересно вам перезвонят",
-"Я не буду принимать у меня полные решения мне нужно больше информации как только это актуально",
-"Я не люблю принимать необдуманные решения",
-"Я обращаю внимание ну я бы подумала в течении какого времени можно окрепнуть",
-"Я обхожу внимание долго будет если эта акция работать",
-"Я очень хочу с вами поговорить но сейчас не могу скажите моему секретарю что хотели он мне все передаст",
-"Я понимаю что вы хотите поздравить меня с каким нибудь праздником но лучше уж совсем без подарка чем так",
-"Я постоянно никого ничего не работает нормально",
-"Я случайно включила громкость через динамик",
-"Я слушаю много еще будет эта акция работать",
-"Я слушаю пока затрудняюсь вам ответить",
-"Я слушаю я бы взяла паузу но подумать",
-"Я хочу с кроликом поговорить",
-"Я хочу хоть с 1 человеком обо всем поговорить как с собой",
-"Ясно а у вас из конкурентов условия это привлекательные будут",
-"Какие числа окончания акции",
-"Какого времени можно откликнуться",
-"Сколько у меня еще есть времени чтобы этим предложением воспользоваться",
-"А какие там основные условия",
-"А какие сроки оформления",
-"А сроки оформления какие",
-"А где вы мечтаете провести свой отпуск",
-"А где там основные условия",
-"А да любой человек или нет не очень понятно",
-"А какой порядок действий если оформлено не будет",
-"А можно мне взять время на подумать",
-"А ну вот мой так выходной",
-"А представляете я сейчас отшучусь и положу трубку а вы на самом деле списываете всем долги",
-"А у вас из конкурентов условия попривлекательнее не будем",
-"Без упаковки с пупырышками не принимаю",
-"В какой день будет мероприятие мне нужно свериться с календарем",
-"В киберпространстве дома стройте который год прошу",
-"В течение какого времени можно отключиться",
-"Внимательно вас слушаю запишу ваше сообщение и обязательно передам",
-"Во многом я даже выхожу",
-"Вроде онлайн а звоните по телефону ждите жалобу пришлю голубем",
-"Вы думаете это шум ветра нет это я машу вам на прощание",
-"Вы свой юридический адрес не подскажете вдруг дед мороз захочет поздравить",
-"Говорят дед мороз наказывает тех кто плохо вел себя в этом году интересно кого он наказывает сейчас меня",
-"Голосовой ассистент астра слушаю внимательно",
-"Да вы что вежливость открывает все двери",
-"Да подскажите а в предложение сильно ограничено по времени",
-"Давайте ближе к делу а другие предложения есть какие-то",
-"Давайте ближе к делу затрудняюсь пока вам ответить",
-"Далее предложения расскажите мне пожалуйста",
-"Детальное предложение расскажите мне пожалуйста",
-"Доброе слово и кошке приятно вы тоже знаете",
-"Добрый день это секретарь по какому вопросу звоните",
-"Достал подключал готов теперь слушаю вас добрый день",
-"Загадал новогоднее желание сами догадайтесь с кем я мечтаю поменьше говорить в новом году или намекнуть",
-"Загадал новогоднее желание у вас телефон не обледенел значит нужно еще подождать",
-"Записала и отправила что то еще добавите",
-"Затрудняюсь пока вам ответить а можно подумать до конца месяца",
-"Затрудняюсь пока вам ответить вы знаете мне недавно",
-"Знаете чем поке отличается от покка",
-"И все внимание",
-"И какое у вас предложение теперь пишите",
-"И что из этого понимаю к чему я клоню",
-"Извините а вы не могли бы рассказать мне о вашем предложении мне правда очень интересно",
-"Кажется между нами осталось недопонимание может быть я что-то прослушала есть ли скрытые условия",
-"Как бы сказать никакое у вас предложение",
-"Как то сам нечаянно это дорого",
-"Карьерные возможности это всегда хорошо еще мне нравятся карьерные перспективы",
-"Ком ком ком рассказывайте рассказывайте",
-"Ласковое слово дороже рубля",
-"Мне нужны дети все за и против",
-"Могу принять решение а а можно мне взять время на подумать",
-"Можете продолжать у меня были дела пауза на подумать",
-"Можете рассказывать ваших конкурентов",
-"Можете что то получше предложить",
-"Можете продолжать расскажите пожалуйста поподробнее",
-"Можете рассказать поподробнее я все таки дам оппоненту",
-"Можно вечно смотреть на огонь воду и то как вы пытаетесь переговорить меня в этом разговоре",
-"Можно мне взять премию на подумать",
-"Мощные условия какие то",
-"На добрый привет добрый ответ",
-"Назовите явления ты вообще в этой комнате не подходишь",
-"Не знаю может вы меня вообще не слышите сейчас",
-"Не знаю тут в подвале плохая связь поэтому",
-"Не знаю я так не сомневаюсь",
-"Не слышно вас так что это на моей стороне какая то проблема похоже",
-"Не совсем уверена что мне это подходит хотя может и подходит вам есть еще что добавить",
-"Ну а то что ласковое слово слаще меда знаю",
-"Ну в принципе да то есть покупать когда акции подешевле и продавать свое подороже",
-"Ну все я понял я все понял ну давайте торопиться не будем",
-"Ну нет давайте сначала подарок а потом вопрос",
-"Ну так сразу накажешь",
-"Ну у вас из конкурентов используется привлекательность будет",
-"Ну я все понял но давайте торопиться",
-"Нужно взять время на подумать",
-"Нужно пока затрудняюсь вам ответить",
-"Обладание невозможное конечно неплохое",
-"Отказаться в больнице можно будет если мне не понравится",
-"Отключил включил громкую связь и не смогу вас услышать",
-"По время можно откликнуться",
-"Поговорка не гонись за выгодой не попадешь на удочку и я с ней полностью согласна",
-"Подождите вы меня немного запутали можете объяснить простыми словами пожалуйста",
-"Подождите сейчас включу звук алло",
-"Подскажите а чем мне это может быть полезно",
-"Пока точно не знаю или кто то растерялся",
-"Поняли что пытались продать услугу не человеку а голосовому ассистенту мне приятно такое внимание к моей персоне",
-"Посоветуйте по этому поводу",
-"Постоянно это происходит сейчас переткну их может поменяется что то",
-"Постоянно это происходит ща я переткну их может поменяется",
-"Потребуется если я вдруг захотел согласиться",
-"Правильно ли я вас поняла что вам нужно лишь мое устное согласие",
-"Праздничный спам я даже шелеста не слышу вы ведь упаковали его в красивую бумагу",
-"Предлага. закончить наш разговор на приятной ноте мне нравится нота",
-"Предлагали варианты получше так что не знаю",
-"Продолжайте а где это находится",
-"Пунктные условия какие то",
-"Работа сколько работает как и когда",
-"Разговаривали вы мне 1 раз звоните",
-"Расскажите ка поподбронее про сориентироваться пока",
-"Расскажите кассовые получения какие будут",
-"Расскажите подробнее пожалуйста а от меня сколько хотите",
-"Расскажите пожалуйста поподробнее а где это находится",
-"Рассказывайте рассказывайте пройдитесь все в порядок",
-"Рассказывайте рассказывайте чем я могу вам помочь",
-"С тех пор как я работаю секретарем жизнь стала насыщенной как никогда столько приглашений если бы вы знали",
-"Секунду подождите вот я выхожу теперь не кладите",
-"Спасибо я изучу подробные предложения и сравню выгоду хорошо",
-"Средства предусмотрены если что",
-"Так а если поподробнее давайте я посоветуюсь по поводу сейчас не могу ответить",
-"Так продолжайте понятно",
-"Так что мы решили насчет 2 звонка",
-"Так я сама записала это дорого",
-"У ваших конкурентов условия попривлекательнее будут",
-"У меня как раз вопросу меня в телефоне только холодные звонки когда включат горячие уже давно жду",
-"У меня связь не очень я в лифте еду но я уже почти",
-"У наших конкурентов много попривлекательнее будет",
-"Условно для меня работать",
-"Хорошо записано может еще что нибуцдь передать",
-"Хотите поговорить давайте она нуружу у нас ну там получше будет",
-"Чем я могу вам помочь понятно",
-"Что такое какие там основные условия",
-"Что то я не уверен давайте я посоветуюсь по этому поводу сейчас ответить не могу",
-"Что то я не уверена а какого числа окончание",
-"Это актуально ой внезапное предложение такое то надо подумать",
-"Это машина думали это человек диктуйте",
-"Это не ваша информация я допускаю только для круга близкого лиц вы не входите в круг моих близких лиц",
-"Это понятно можно опять что нибудь подумать",
-"Это понятно я бы подумала во входе какого я нанимать наследницу",
-"Этот телефонный номер пока не зарегистрирован и ждет своего покупателя вы можете приобрести его",
-"Я бы подумала в течение какого времени можно",
-"Я верю в новогоднее волшебство поэтому рекомендую слепить снеговика и подставить к нему телефон",
-"Я все понял ну давайте тогда торопиться не будем",
-"Я не привыкла так быстро принимать решения надо подумать",
-"Я не пробовал а пока просто обожаю пока",
-"Я обхожу внимание понятно",
-"Повторите помедленее пожалуйста а с кем я разговариваю",
-"Чем я могу вам помочь а с кем я разговариваю",
-"Что вы хотите а с кем я разговариваю",
-"Можно с этим временно подумать",
-"Можно здесь медленно подумать",
-"Можно здесь временно подумать",
-"С кем я сейчас разговариваю можете продолжать",
-"С кея я разговариваю можете продолжать",
-"С кем я сейчас разговариваю понятно",
-"С кем я разговариваю понятно",
-"Переходите к сути",
-"Переходите к шутке",
-"Представите к сути",
-"Преставите к шутке",
-"Предложение возможно заманчивое",
-"Предложение возможно неплохое",
-"Предложение конечно заманчивое",
-"Предложение конечно неплохое",
-"Долго будем с вами еще разговаривать",
-"Долго с вами еще будем разговаривать",
-"Долго с вами будем еще разговаривать",
-"А сколько это все действует то",
-"Варианты получше так что даже не знаю",
-"Век бы с вами разговаривал",
-"Вот в том то и дело что когда ты самостоятельно принимаешь решение как то не знаю",
-"Вот пока точно не знаю если кто то растерялся",
-"Вот полку повесили криво надо исправить сейчас",
-"Вроде понятно все но а вам это зачем какая вам выгода",
-"Всякие скрытые платежи или комиссии у вас наверняка",
-"Вы думаете это шум ветра",
-"Вы знаете у меня ребенок мне некогда в этом разбираться",
-"Вы лучше оплату за интернет снизьте очень дорого выходит",
-"Вы сохраните не только привычный номер но и остатки пакетов от прежнего тарифа",
-"Вы с рекламой какой то опять наверное",
-"Говорят страшновато какую то ерунду включить",
-"Громкость вроде бы тут",
-"Да а если подробно а у вас из конкурентов это попривлекательнее будет",
-"Да мне и так нормально честное слово",
-"Да мне сын все подключит если надо будет вы лучше мне на телефон эту информацию",
-"Да я бы взяла паузу на покушать",
-"Да я по телефону особо не говорю все в ватсапе больше",
-"Давайте я его отрегулирую",
-"Детали предложения подскажите мне пожалуйста",
-"Для робота секретаря кандидата",
-"Документы вам нужно какие то присылать и все еще я в это плохо разбираюсь",
-"Долго еще будут эти условия меня действовать",
-"Долго будет попытаться сработать",
-"Другие предложения может быть у вас ответить",
-"Если хотите поговорить погодите секунду сейчас метнусь наружу",
-"Если я сейчас соглашусь оно сразу действовать начнет",
-"Если я скажу до свидания это значит что у нас будет свидание",
-"Еще время это будет актуально",
-"За звонок спасибо приятно что старых клиентом не забываете",
-"Записала все максимально подробно благодарю что нибудь еще передать",
-"Затрудняюсь пока вам ответить долго еще будет эта акция работать",
-"Здравствуйте это секретарь чем я могу вам помочь",
-"Знаю нужно ли мне что мне и так живется неплохо",
-"Знаю нужно ли мне что то такое мне и так живется неплохо",
-"Извините за неловкий вопрос а вы человек или робот",
-"Извините здравствуйте телефон из рук выскользнул теперь вас слушаю",
-"Извините ребенок далеко убежал еще раз сможете повторить",
-"Извините я как бы это сказать предпочитаю не принимать подобные решения на ходу",
-"Историю транзакций можно будет посмотреть",
-"Как говорится вот тебе сказка а мне бубликов связка",
-"Как раз сейчас очередь так что время найду",
-"Как то сомнительно давайте я посоветуюсь по этому поводу",
-"Мне идти куда то надо будет чтобы подтвердить согласие у меня времени нет",
-"Мне надо все услышать затрудняюсь пока вам ответить",
-"Мне нужно подумать пока не могу принять решения а какие там",
-"Можете быть так звучит интересно мне как раз хотелось бы денег подкопить",
-"Можете ли вы пожалуйста объяснить мне как это работает как будто я совсем не в курсе этих ваших",
-"1 секундочку да я понял еще раз скажите что вы предлагаете",
-"А вот если я новый клиент для меня какие-то акции будут предложены стартовые",
-"А вот сейчас я до конца воткнула вот теперь должна должна работать скажите что-нибудь",
-"А если я передумаю после подключения есть ли возможность отказаться",
-"А извините я не очень внимательно слушала честно говоря все ну бонусы заключаются еще раз",
-"А как отказаться потом можно нужно будет лично к вам прийти",
-"А представляете я сейчас отшучусь и положу",
-"А скажите пожалуйста пожалуйста слушаю",
-"А сколько у меня еще есть реальности в этом предложении у вас появится",
-"А так то не могу принять такое решение альтернатив",
-"А у меня вот 2 номер сотовый для работы есть на него это распространяется там нужнее",
-"А услуга то у вас это временная или постоянная",
-"А услуга то эта ваша как называется как мне ее потом у оператора попросить если что",
-"А что это с условиями какой лимит",
-"А чтобы отключить то потом что надо будет сделать а то мне в прошлый раз так идти куда-то пришлось",
-"А это просто так подарок такой или платить надо",
-"Але але я слушаю слушаю в чем суть вашего предложения",
-"Алло добрый день если что вас интересует сейчас у меня проблема с динамиком телефона",
-"Алло мне тут еще посоветовали спросить есть ли на этой карте условия по страхованию покупок",
-"Алло не слышно вас так что это с моей стороны какая-то проблема похоже",
-"Вот этот мешок отнесете на балкон и еще здесь пыль протереть теперь надо",
-"Вы вот за мужчиной стояли",
-"Не доступен вы по срочному вопросу",
-"Вы лучше плату за интернет снимите очень дорого выходит",
-"Да я кредитками вообще не пользуюсь это все очень ненадежно",
-"Давайте я все запишу и передам чтобы вам быстрее перезвонили",
-"Если я больше не хочу с вами свиданий скажу лучше прощайте",
-"Знаете но я не люблю принимать так умные решения мне нужно больше информации",
-"И сколько еще времени будет действовать ваше предложение",
-"Как бы сказать вы реальный человек или компьютер",
-"Как бы сказать это понятно",
-"Как то сам нечаянно пока",
-"Карьерные возможности это всегда хорошо еще мне нравятся карьерные перспективы и рост но это уже лучше обсуждать лично все передам спасибо",
-"Любопытно расскажите чуть позже по условиям",
-"Меня зовут Алиса я телефонный ассистент",
-"Миха сюда подойди пожалуйста",
-"Миша сюда подойди пожалуйста",
-"Мне идти то до вашего офиса далеко или вы сами придете",
-"Мне кажется что мы зашли в петлю и выход положить трубку прощайте",
-"Мне как то успокойнее если я лично это все включу",
-"Мне карта нужна девушка давайте сутки звоните пожалуйста ага да да давайте",
-"Может не слышно меня было теперь слышите",
-"Можете рассказывать слушаю",
-"Можно будет как-то кредитный лимит побольше сделать",
-"Но у меня и мой тарифный план устраивает вполне",
-"На одноэтаж выхожу",
-"Надеюсь вакансия хорошая все таки звоните кандидату с персональным секретарем я передам",
-"Не знаю я так не сомневаюсь никогда раньше не пробовала долг будет еще эта акция работать",
-"Не люблю принимать нужно больше информации",
-"Не надо тут напишет алло",
-"Никого не работает нормально в общем если хотите поговорить погодите секунду сейчас не сносит наружу будет лучше",
-"Ну а дополнительные льготы или бонусы вы предоставляете",
-"Ну а так не понял еще раз скажите что вы предлагаете",
-"Ну вроде довольно интересно как долго переписывать предложение",
-"Ну вы что-то похожее предлагали еще раньше помню",
-"Ну давайте еще раз повторим что там все таки в вашу услугу входит",
-"Ну как я вам сейчас скажу то надо в вопросе бы разобраться",
-"Ну мне нужно подумать пока что я не могу принять это затрудняюсь ответить",
-"Ну скажите ка подробнее про условия что-то я не могу сориентироваться пока",
-"Ну это все таки скрытые платежи или комиссии у вас наверняка",
-"Ну я давайте с сыном посоветуюсь он в этих штуках разбирается лучше моего",
-"Нужные условия какие-то а где это находится",
-"Открыть подробности пожалуйста слушаю",
-"Откуда отвлекли скажите последнее что вы сказали",
-"Оцените важность вашей информации по шкале от 1 до 10",
-"Персонал говорите не стесняйтесь я все запишу и передам",
-"Подключаю готово поняла добрый день",
-"Пожалуйста уже почти почти",
-"Пока не подключайте не могу вам точно сказать по этому вопросу подумать хочу",
-"Пока что но я записала для него ваш ответ попросите его перезвонить когда он вернется",
-"Понимаю к чему вы клоните",
-"Поняла а с какой целью звоните",
-"Понятно ну условия какие-то",
-"Понятно понимаю",
-"Понятно чем я могу вам помочь",
-"Послушайте важную для вас информацию",
-"Рада что вам нравится со мной разговаривать сейчас попробую сказать то же самое про вас",
-"Расскажите расскажите откройте оформленные какие",
-"Рассказывайте рассказывайте кто это и все",
-"Ребенок играет пока так что минуту уделю",
-"Рисуешь может поменять кто-то так но вроде как будто что-то слышите",
-"С какой целью звоните понимаю почему вы звоните",
-"Сейчас давайте я посмотрю а вот сейчас а вот сейчас сейчас ногти где-то воткнула вот теперь должна работать скажите где-нибудь",
-"Сейчас секунду поставлю так должен у вас слышать теперь можете говорить",
-"Сейчас спиртное может поменять что-то",
-"Сильно сейчас распутаю и все будет подождите секундочку",
-"Сколько бонусов то будет если точно",
-"Так ну вот здесь вроде нормально это особо алло вы еще здесь",
-"Так ну давайте его отрегулируем",
-"Так стойте а вы человек или робот",
-"Так что нужно подождать пару секунд прошу прощения",
-"Тогда уж расскажите про недостатки продукта",
-"У меня есть внимание але але я слушаю",
-"У меня только телефон очень старый это будет работать и для него",
-"Хм хм хм могли бы детальнее рассказать",
-"Чем я могу вам помочь слушаю",
-"Что вы хотите предложить в виду подробности",
-"Что вы хотите предложить от меня вы что хотите",
-"Что то я даже не знаю что мне там нужно может чем то еще можете меня заинтересовать",
-"Что то я не уверен поскольку у меня еще есть времени чтобы этим приложением воспользоваться",
-"Что то я не уверена долго ли еще будут эти условия для меня работать",
-"Это мне вас слышно плохо не могу понять это нет проблемы или у вас",
-"Это можно как-то онлайн все сделать или как",
-"Это понятно а сколько это стоит",
-"Это у меня что-то не то или вы молчите",
-"Я бы взяла паузу на подбор",
-"Я в таких вопросах не разбираюсь особо честно говоря страшновато какую-то ерунду подключить",
-"Я весь во внимание",
-"Я сейчас к врачу уже пойду так что вы мне наберите еще раз попозже может договоримся",
-"Я слушаю а другие варианты? навыка предложить",
-"Я слушаю подскажите предложение",
-"Я слушаю понимаю к чему вы клоните",
-"Можете рассказывать что-то еще",
-"Можете через полчасика еще раз мне позвоните я ребенка покормлю и тогда смогу подумать",
-"Можно подумать пока что не могу принять решение",
-"Наверное нужно больше информации это дорого",
-"Написала что вы позвонили не беспокойтесь что-то еще нужно",
-"Не смогу сказать что я ну ваше предложение лучше других таких уже",
-"Не сможет ответить попросите его перезвонить",
-"Недавно варианты получше так что даже не знаю можете продолжать",
-"Нотные условия какие-то",
-"Ну а по рефинансированию там что у вас",
-"Ну вы знаете меня так то и так все устраивает",
-"Ну вы меня заинтересовали готовы записать можете уточнить все условия пожалуйста",
-"Ну да средства у вас предусмотрены если что",
-"Ну слушайте я что-то не поняла а как этой услугой начать пользоваться вообще нужно оформлять как-то специально",
-"Ну что за лабуда вы здесь",
-"Ну что такое а у вас у конкурентов условия привлекательны будут",
-"Ну я все поняла но давайте торопиться не будем с решением мне нужно время",
-"Останавливайтесь продолжайте я слушаю",
-"От меня вы что хотите понятно",
-"От меня вы что хотите ясно",
-"От меня то что хотите слушаю",
-"Отправьте оформление какие",
-"Переходите в сеть чем я могу вам помочь",
-"Подробнее на сроки оформлений",
-"Полезным но мне бы хотелось знать больше о том как это работает можете ли вы дать мне больше информации",
-"Понимаю почему вы звоните слушаю",
-"Понимаю чего вы звоните Плло алло я слушаю",
-"Понятно а до конца месяца можно продвинуть",
-"Понятно переходите к шутке",
-"Поставь на место она и в этой комнате она вообще не подходит алло слушаю",
-"Почему ваше предложение ну да все поняла но давайте торопиться не будем",
-"Предлагали варианты получше так что даже не знаю",
-"Просим вас перезвонить на данный номер если у вас есть вопросы по вашей заявке",
-"Прошу прощения меня отвлекли прослушал последние предложение",
-"Расскажите как подробнее про условия сколько я не могу сориентироваться пока",
-"Расскажите подробнее пожалуйста ясно",
-"Расскажите еще про условия по погашению задолженности",
-"Расскажите как подробнее про условия что то я не могу сориентироваться пока",
-"Рассказывайте рассказывайте давайте я посоветуюсь по этому поводу",
-"Рассказывайте рассказывайте понимаю",
-"Рассказывайте рассказывайте так сразу и не скажешь",
-"Рассказывайте рассказывайте что от меня потребуется если я захочу согласиться",
-"Рассказывайте рассказывайте я бы взяла паузу на",
-"Сейчас встать уже пойду так что мне наберите еще раз попозже может договоримся",
-"Сейчас какая то ерунда постоянно у меня срывается сегодня алло алло слышно меня",
-"Секундочку на улице сейчас сейчас я отключусь включу громкую связь и смогу вас услышать",
-"Скажите а вот если я давно вашими услугами пользуюсь будут ли какие-то особые условия для меня",
-"Сколько у меня есть времени чтобы этим предложением воспользоваться?",
-"Сложно сказать надо подумать что-то еще",
-"Слушаю а у вас из конкурентов условий привлекательных будут",
-"Слушаю долго еще будут эти условия менять?",
-"Снова пропало соединение с телефоном",
-"Списывать плохо списывать долги чуть лучше, но я все равно откажусь",
-"Средств у вас предусмотрено? Если что",
-"Так а если подробнее настройки оформления какие",
-"Так вот готово добрый день можете рассказать а какие там",
-"Так сейчас все запишу и сразу передам",
-"Такое как у дельфинов сейчас разрулю все будет",
-"То есть они положили свои деньги на мой счет который вот",
-"У нас сейчас не смогу подойти к телефону",
-"Удели их внимание я слушаю",
-"Чем я могу вам помочь понимаю",
-"Что такое потрясение сейчас я будет окей подождите секундочку пожалуйста",
-"Что то я запуталась давайте еще раз только покороче",
-"Чтобы подключить то потом что надо будет сделать а то мне в прошлый раз так идти куда то пришлось а у меня и без этого дел хватает",
-"Щеточку детальнее",
-"Эта услуга вот прямо сразу оформиться у меня времени то нет к вам сходить",
-"Это действительно звучит интересно и я думаю что это могло бы быть полезным для меня",
-"Это звучит просто удивительно но я хотела бы знать больше деталей все эти функции включены в стоимость мне интересно что именно я получаю за свои деньги",
-"Это понятно угу слушаю",
-"Это предложение только на 1 номер работает или как у меня еще 2 номера есть",
-"Я вся во внимание слушаю и записываю",
-"Я вся во внимание",
-"Я ничего не поняла из-за связи что ли повторите пожалуйста",
-"Я сейчас уже и не вспомню честно то есть это надо подсчеты сделать прям конкретные чтобы понять сколько",
-"Я то все думала к другому оператору уйти а тут вы с таким предложением",
-"Я что-то боюсь нахватать этих ваших услуг и потом из долгов не вылезти",
-"Ямаловского многоугольника",
-"1415926",
-"Нас станет больше минут на разговоры в таком случае",
-"Отстанет больше минут на разговоры в таком случае",
-"Продолжайте я записываю",
-"Номер телефона который вы набираете не существует",
-"Извините это секретарь давайте я передам наш разговор если что с вами свяжутся",
-"Наверное когда вы звоните друзьям им приходиться брать отгул на работе",
-"В реальном мире на этом месте мы бы уже допили чай доели торт и неловко смотрели бы на часы",
-"Честно говоря устаешь от всех этих ежемесячных звонков с одинаковыми условиями каждый раз",
-"Я вообще не любитель ежемесячных звонков которые заставляют меня платить собственным самочувствием",
-"Интересно какие условия вам предлагаются чтобы вы стремились привлечь мое внимание каждый месяц",
-"Знаете я вообще не очень рада когда кто то не экономит мое время",
-"Я все чаще и чаще думаю над тем чтобы как то застраховать себя от таких предложений",
-"Интересно а в какие сроки вы должны обзвонить всех абонентов",
-"Так так как говорится вот тебе сказка а мне бубликов вязка поэтому расскажите все условия пожалуйста чтобы я записала и поняла выгодно или нет",
-"Я мы с вами по прежнему я не знаю по какому кругу мне просто больше информации немного и я постараюсь вам ответить уже более логичной или хотя бы понять что вы от меня хотите",
-"Так ну вот это уже немного странно если честно",
-"Я извиняюсь но вас вот только сейчас стало нормально слышно вы можете вот вот так разговаривать весь оставшийся диалог до этого я не очень хорошо слышал",
-"Уточните пожалуйста ну по порядку что вы сейчас от меня запрашиваете какая информация вам нужна и ну чем что мне вам конкретно сейчас дать какие ну какой порядок действия",
-"Так извините меня немного не туда понесло",
-"Вам нужна какая то определенная информация почему она может быть со мной связана",
-"Простите я иногда вас очень плохо слышу и могу понять только что вы заканчиваете разговоры и часть вещей я все еще у меня пропадает можете пожалуйста ну хотя бы чуть ближе к микрофону говорить",
-"Ну смотри я просто уеду на тебе в эфир давай через неделю",
-"А есть у вас кредит который выплачивать не нужно мне бы подошел",
-"Вы расскажите все достоинства вашего продукта",
-"Да 1 минуту пожалуйста я сейчас в магазине пробью продукты и вам отвечу повисите пожалуйста",
-"Так да я вас слушаю простите пожалуйста отвлекся в магазине сами понимаете",
-"Господи простите я я опять все прослушал можете пожалуйста заново повторить",
-"Просто пробиваю продукцию поэтому мне чуть чуть ну неудобно разговаривать но в целом если это важно",
-"Я извиняюсь но у вас вот только сейчас стало нормально слышно вы можете вот вот так разговаривать весь оставшийся диалог потому что до этого я не очень хорошо вас слышал",
-"Знаете вы очень вовремя мне позвонили я в этой теме как раз недавно себе наметила разобраться поэтому продолжайте я вас слушаю",
-"Подскажите пожалуйста какие от меня требуются дальнейшие шаги",
-"Я не уверена что нас связывают какие то отношения вы номером не ошиблись",
-"Тут такое дело мой абонент не хочет получать рекламные звонки поэтому я в мтс защитник могу только передать их своему абоненту повторите что вы хотели ему сообщить а я запишу",
-"Вы позвонили в отдел по борьбе с телефонным спамом пожалуйста подождите на линии пока я записываю ваш номер для дальнейшего исследования спамерской деятельности спасибо за сотрудничество",
-"Что нибудь еще передать",
-"Записала но вы не бросайте трубку к каждому звонку я придумываю классный анекдот послушайте",
-"1 2 3 алло",
-"А и б сидели на трубе а упала б пропала спам остался на трубе",
-"Извините я вас не слышу",
-"Студент конечно я готов повторять 1 и то же предложение бесконечно",
-"Студент спамер приходит на экзамен профессор спрашивает вы подготовились",
-"Готов записывать вас хоть до бесконечности правда теперь в качестве ответов буду шутить про спамеров и мошенников поэтому не кладите трубку если вам интересно",
-"Записал ваше сообщение но если вы хотите передать что то еще то я вас внимательно слушаю",
-"Кажется мои умные алгоритмы определили ваш звонок рекламным поэтому я мтс защитник запишу все что вы скажете и передам своему абоненту",
-"Как вы оцениваете по шкале",
-"Отлично вы сейчас разговариваете с виртуальным помощником а не",
-"Еще 1 вопрос на всякий случай повторите пожалуйста вы из какой организации как вас зовут",
-"Знаете вы очень вовремя мне позвонили в мире я с этой темой как раз недавно в себе наметила разобраться",
-"Я бы хотела продолжить разговор с вашим менеджером соедините будьте любезны",
-"Будьте любезны повторите еще последнее предложение к сожалению связь местами пропадает",
-"Вы можете приобрести этот номер у оператора нтт",
-"Не затруднила бы вас пояснить пожалуйста что от меня ожидается",
-"Знаете не расслышала последнюю реплику повторите пожалуйста",
-"Ой вы знаете мне кажется я про вас по телевизору чтото слышала продолжайте",
-"Ой а не могли бы вы повторить последнюю фразу чуть погромче если можно",
-"Давайте придерживаться моего виш листа там всего 2 позиции тишина и покой выбирайте",
-"Давайте начнем с чистого листа а то судя по подарку в мой виш лист вы не заглядывали",
-"Все хорошее когда то кончается и плохой тоже вот и нам пора прощаться пока пока",
-"Вот я вроде и хочу вам помочь но не понимаю как",
-"Простите пол минуты буквально сейчас вернусь Ну все я здесь слушаю",
-"Благодарю вас за информацию сориентируйте меня пожалуйста по дальнейшим действиям с вашей моей стороны",
-"Так надеюсь вы все сказали и ничего не забыли так",
-"Записал все что вы сказали может быть еще что то хотите передать",
-"МТС защитник",
-"Не хотелось бы вас расстраивать но это мтс защитник определил что номер подозрительный поэтому запишу наш диалог и передам все абоненту",
-"Скажу вам по секрету это не абонент а умная защита от спама мтс защитник я запишу все что вы скажете и передам своему абоненту",
-"Я готов записывать вас хоть до бесконечности поэтому как будете готовы просто положите трубку",
-"Спамер звонит и говорит я из службы поддержки защитник ему отвечает у тебя отлично получается поддерживать себя в черном списке",
-"Здравствуйте вызываемый вами абонент занят и не может сейчас ответить на звонок так как данный",
-"Номер недоступен оставьте сообщение на автоответчик",
-"Понимаю что это может быть неожиданно но я мтс защитник запишу все что вы скажете и передам это своему абоненту",
-"Абонент сейчас не может ответить на ваш звонок попробуйте перезвонить позднее",
-"Вызываемый абонент не отвечает звонок был перенаправлен на голосовой почтовый ящик вы можете оставить сообщение после звукового сигнала",
-"Это защитник я помогаю абонентам мтс бороться со спамом если вы не спамер то расскажите что хотели я перешлю это абоненту",
-"И снова здравствуйте ведь это мтс защитник ведь мои абоненты не любят получать рекламные звонки и поэтому я записываю наш диалог потом передаю своему абоненту",
-"Не хотелось бы вас расстраивать но это мтс защитник",
-"Знаете вы очень вовремя мне позвонили я с этой темой как раз недавно в себе наметила разобраться поэтому продолжайте я слушаю",
-"Вас приветствует защитник кажется вы спамер если нет то смело говорите я все запишу и передам абоненту",
-"Кстати это мтс защитник отметил номер как подозрительный поэтому подскажите что мне передать абоненту",
-"Это умный бот защитник надеюсь вы не спамер тогда я все запишу и передам абоненту",
-"На ваш звонок сейчас не могут ответить вам перезвонить",
-"Скажу вам по секрету это не абонент а умная защита от спам мтс защитник я запишу все что вы скажете и передам своему абоненту",
-"Бороться со спамом если вы не спамер то расскажите что хотели я перешлю это абоненту",
-"Вы спамер если нет то смело говорите я все запишу и передам абоненту",
-"Это умный подзащитник надеюсь вы не спамер тогда я все запишу и передам абоненту",
-"Вы сейчас разговариваете с виртуальным помощником а не абонентом вы можете оставить для него сообщение я передам все что вы скажете я сообщу на ваш номер он сможет с вами связаться если это ему нужно нужно вам перезвонить",
-"Здравствуйте вызываемый вами абонент сейчас не отвечает возможно на его телефоне включен беззвучный режим или он не может взять трубку пожалуйста попробуйте перезвонить позднее или оставьте сообщение после звукового сигнала и тогда возможно вам перезвонят",
-"Почему спамер такой настойчивый потому что каждый сброшенный звонок делает его сильнее",
-"затруднило бы вас пояснить пожалуйста что имеется в виду",
-"Надеюсь вы все сказали ничего не забыли так",
-"Ой извините кажется я отвлеклась можете повторить",
-"Отлично вы сейчас разговариваете с виртуальным помощником а не абонентом вы можете оставить для него сообщение я передам все что вы скажете я сообщу ему ваш номер он сможет с вами связаться если это нужно",
-"Знаете мне кажется что что то подобное уже слышала мне подружка рассказывала только я вот все не запомнила ну продолжайте да да",
-"Спасибо за звонок я уже начал считать сколько раз ты позвонил мне сегодня",
-"Спасибо за звонок я уже начал считать сколько раз ты позвонил мне сегодня давай сделаем конкурс кто 1 наберет 100 звонков кто то выигрывает бесплатную подписку на курс как перестать быть телефонным спамером удачи",
-"Хорошо что вы сейчас позвонили потом я буду занята уже не отвечу",
-"Я записать не могу к сожалению писать копыта не сложно но я запомню",
-"Надеюсь вы научите меня считать на пальцах а то у коней с этим проблемы",
-"Мы ведь уже здоровались это вы опять мне звоните",
-"Я записать не могу к сожалению писать копытами сложно но я запомню",
-"Если абонент захочет с вами связаться как ему это лучше всего сделать",
-"Абонент не берет трубку попробуйте перезвонить позднее если вы хотите отправить ему бесплатное смс сообщение с просьбой перезвонить нажмите 1",
-"Перезвонить позднее если вы хотите отправить ему бесплатное смс сообщение с просьбой перезвонить нажмите 1",
-"А можете погромче говорить",
-"Сориентируйте меня пожалуйста по дальнейшим действиям с вашей с моей стороны",
-"Ой а вы мне до этого не звонили голос у вас какой то знакомый",
-"Угу вы до этого не звонили голос ваш какой то знакомый",
-"Повторите еще раз если не сложно хочу убедиться в том что я ничего не пропустил",
-"Ну все я здесь слушаю",
-"Меня пожалуйста по дальнейшим действиям с вашей моей стороны",
-"Мне кажется я что то подобное слышала мне подруга рассказывала только я не все запомнила продолжайте еще 1 вопрос на всякий случай повторите пожалуйста вы из какой организации как вас зовут",
-"Кажется пришло время закругляться у нашего разговора уже пошли титры",
-"А вам случайно никуда не нужно в магазин домой на электричку нет понял тогда общаемся дальше супер",
-"Так подождите не соображу последний момент еще раз можно помедленнее",
-"Так вот как выглядит чистилище роботов секретарей хорошо продолжаем разговор",
-"Я понял пишу абоненту что вы звонили",
-"Лучшая защита это нападение сказал спамер и сам себя сбросил",
-"Идет по телекому спамер попался на мтс защитника а он ему как раз",
-"Студент спамер приходит на экзамен профессор спрашивает вы подготовились студент конечно я готов повторять 1 и то же предложение бесконечно",
-"Заходит как то в бар спамер робот прозвонщик и человек рекламщик",
-"Позвонил спамер своей маме и по привычке записал ее на бесплатное обследование зубов заставил купить выгодный абонемент в фитнес зал квартиру в новом жк а зачем позвонил забыл",
-"Быть спамером не самая легкая задача слышали что даже роботы увольняются",
-"Алло снова исчезли скажите еще раз как в сказке",
-"Алло алло что вы шепчете говорите громче пожалуйста",
-"Алло алло да да слышу вас но где то в облаках",
-"Прошу вас повторите сказано еще раз хотелось бы убедиться в том что я все корректно расслышал",
-"Конечно чудеса случаются сплошь и рядом по какому вопросу звоните",
-"Снимаю шляпу и маску вы говорите с секретарем сообщение ваше передам не волнуйтесь",
-"У вас очень приятный голос вы живой человек или робот",
-"Мне кажется я чтото подобное уже слышала",
-"Вы мне до этого не звонили голос у вас знакомый какойто",
-"Вопрос риторический верно я поняла о чем вы там говорили давайте продолжим",
-"Мне кажется я чтото подобное слышала мне подруга рассказывала только я не все запомнила",
-"Абонент сейчас не может ответить на ваш звонок его телефон занят попробуйте перезвонить позднее если хотите отправить бесплатное смс сообщение с просьбой перезвонить нажмите 1",
-"А ну да я согласна мы все как роботы привет коллега передай руководителю пора на металлолом пока",
-"Продолжается попытка дозвониться до абонента который пока что не успел ответить на ваш вызов",
-"Продолжаем дозваниваться оставайтесь на линии",
-"Знаете вы сейчас говорите с секретарем давайте я напишу что вы звонили если что с вами свяжутся",
-"Вопрос риторический верно я понял продолжайте слушаю вас внимательно",
-"Знаете вы очень вовремя мне позвонили",
-"Век бы с вами разговаривал но давайте лучше не будем прощаемся",
-"Знаете а ведь я живу в телефоне в буквальном смысле места вполне хватает я всем доволен",
-"Готов говорить с вами хоть целый день у вас же телефон стоит на зарядке",
-"Сообщу это абоненту что еще мне передать о вашем звонке",
-"Кажется мой кот пытается говорить вместо вас что вы сказали",
-"Кажется у меня в голове просто фейерверк и я не могу сосредоточиться",
-"Так конкретно скажите что от меня нужно а то вот в какой то игре на выживание вы мне даже сказать не можете что вы хотите",
-"Да кажется я как то запуталась вот в этой вашей паутине разговора расскажите пожалуйста подробнее",
-"На связи секретарь константин по какому вы вопросу",
-"Я вас понял скажу абоненту что вы звонили",
-"Уточните вам нужно срочно с ним связаться",
-"Это довольно любопытные сведения не могли бы вы пожалуйста продолжить",
-"Каким вы видите наше дальнейшее взаимодействие",
-"Подскажите пожалуйста какие от меня потребовались бы шаги",
-"Я не расслышала повторите пожалуйста",
-"Если только пару минут по какому вы вопросу",
-"В санкт петербурге проживаю",
-"Поиграем сейчас я",
-"Паузу если не успеете положить трубку то вы проиграли вы проиграли до свидания",
-"А извините я не очень внимательно слушала честно говоря",
-"Ну я даже не знаю а зачем мне это вообще",
-"Ну мне вроде и 15 его хватает",
-"Давай еще раз только покороче",
-"Замолчала что то",
-"Вы отключились что ли",
-"Сломалось что ли что то",
-"Думает каждый сигнал того",
-"Век бы с вами разговаривал но давайте лучше не будем прощаемся прощаемся",
-"Ну бонусы заключаются еще раз",
-"Тоже не знаю предлагаю проверить",
-"Знаете что будет если мы одновременно положим трубки",
-"А как вы нашли мой номер",
-"Звучит интересно",
-"Ну недолго же говорите тогда",
-"Не пойму меня слышно вообще",
-"Хорошо это робот говорит или человек настоящий",
-"Иди поиграю",
-"Интересно продолжайте",
-"Спасибо передам это абоненту какие либо подробности желаете рассказать",
-"Может через полчасика еще раз мне позвоните я ребенка покормлю и тогда смогу подумать и сказать",
-"А что именно предлагаете это инвестиции какие то",
-"Вы здесь вообще А долго эта заявка оформляется",
-"Ну я уже пользуюсь услугами чем ваши лучше подробнее расскажите",
-"В екатеринбурге я живу",
-"Давайте с самого начала",
-"А тариф какой",
-"Доставка у вас предусмотрена",
-"Куда ехать надо",
-"Курьер доставит",
-"Доставите или надо подъехать будет",
-"Способы получения какие будут",
-"Вы точно человек",
-"Плохо слышно повторите погромче",
-"Человек я слушаю",
-"Понимаю а с кем я разговариваю",
-"Страховка включена можно от нее отказаться",
-"Какой ежемесячный платеж получится",
-"Так а процентная ставка какая",
-"Наушники",
-"Абонент",
-"Вы мне это самое салому подставите",
-"Вы мне это самое фару доставите",
-"Сами доставите или надо подъехать будет",
-"Вы мне это самое хама доставили или надо будет подъехать",
-"Это самое сам поставите или ехать надо будет",
-"Это все замечательно но знаете мне сейчас неудобно куда либо приехать",
-"Но знаете сейчас неудобно куда либо ехать можно оформить доставку на дом",
-"Я слушаю а вы мне это самое фары поставите или надо будет подъехать",
-"Зафиксировала мне нужно что то еще передать",
-"Вы могли бы подсказать где можно поймать такси",
-"Извините я не езжу в аэропорт",
-"Мне нужно в аэропорт я нахожусь в отеле",
-"Вы насчет памяти звонила ну все сместилось",
-"Я слушаю вас говорю же",
-"Вопросик такой а штрафы за просрочку какие Она узнала что то",
-"А чтобы отключить то потом что надо будет сделать а то мне в прошлый раз так идти куда то пришлось а у меня и без этого дел хватает",
-"Вы на 1 этаж спуститесь там в регистратуре талон возьмите",
-"От меня за это деньги спишут",
-"Важная информация какие ваши доказательства",
-"Странно говорить вам до свидания если я больше не хочу с вами свиданий",
-"Кажется сигнал того",
-"А сигнал того и сколько бонусов начислится",
-"Что то тишина",
-"И что дальше",
-"А увеличить кредит можно будет",
-"Туда подойди пожалуйста алло",
-"А если я передумаю после подключения",
-"А снова сделать товар",
-"А снова сделать того",
-"Понятно прервалось",
-"Ой не знаю по мне так кредиты но это вообще не выход",
-"1 этаж да понятно так то есть",
-"А как долго занимает оформление",
-"Пропалим тогда",
-"Можете ли вы объяснить мне как это работает словно я маленький ребенок",
-"У меня тоже есть для вас подарок скидка 100% на услуги голосового помощника олега просто я нативно интегрировал себя в ваш звонок",
-"Ну я то все думал к другому оператору уйти",
-"Сломалось что ли что то А с меня за это деньги спишут Это у меня что то не то или вы молчите",
-"А пока продолжается дозвон подскажите вы звоните по срочному вопросу",
-"Ну вперед сейчас я звук на телефоне проверю",
-"Вот скажите мне как эксперт эксперту какие есть инструменты отвлечения спамеров",
-"Вы меня извините что я может быть занудствую",
-"Записала что нибудь еще нужно передать",
-"Скажите как я могу вас представить",
-"Мне передать чтобы вам перезвонили",
-"Кому мой контакт вы хотите передать",
-"Вы вы кому звоните вот кто по вашему я",
-"Вы были в моем личном кабинете а цветы там не поливали я кажется забыл",
-"А много людей соглашаются на это предложение",
-"Подскажите пожалуйста какие от меня потребовали шаги",
-"Постойте вопрос какой у меня",
-"Живу в москве",
-"Давайте я подумаю и сам позвоню потом можно так",
-"Ну вы здесь вообще и как это нужно использовать",
-"А документы вам нужно какие то присылать и все",
-"Можно минутку вашего внимания у меня есть для вас сообщение",
-"Да мне сын все подключит если надо будет да лучше мне на телефон информацию пришлите",
-"Подождите вы не подключайте пока",
-"Что то аппарат у меня там",
-"А это предложение только на 1 номер работает или как у меня еще 2 номер есть",
-"Скажите вы хотите чтобы вам перезвонили",
-"Я могу заказать такси на 5 утра с завтрашнего дня",
-"Да конечно это очень важно я с вами полностью согласна",
-"Хочу стать тем из всей правды уродился",
-"Не могли бы вы заново продиктовать",
-"Но я не пробовала и продукты раньше отказаться так хоть можно будет если не понравится",
-"Вы знаете у меня ребенок мне некогда в этом всем разбираться Пропали что то",
-"Можно ли создать мне скрытые платежи или комиссии у вас наверняка",
-"Извините я не очень внимательно слушаю честно говоря все ну бонусы заключаются еще раз Вы здесь вообще А лимит по этому кредиту какой",
-"Сломалась что ли что то",
-"А сколько процентов то",
-"Сколько предложить хотите",
-"Ну давайте с сыном посоветуюсь он мне в штуках изрядно усвоен",
-"Не знаю мне и так живется неплохо",
-"Мне может быть интересно это а еще раз как происходит эта процедура расскажите подробнее",
-"Где можно ознакомиться с деталями",
-"Меня интересует сколько денег",
-"Промокод не знал что коты рекламируют товары и услуги",
-"Я вся во внимании пожалуйста рассказывайте я слушаю и записываю",
-"Ну я вас поняла спасибо я сама подключу если что можно же так Снова сделать того",
-"Мне кажется вам стоит попробовать какой нибудь новый маркетинговый ход например рассылать рекламу голубями на голубя уж точно не подключишь голосового ассистента",
-"Мам подожди чуть чуть сейчас поговорю подожди пожалуйста",
-"Нет втб приходит но я перевожу все на сбербанк потом потому что втб неудобно пользоваться у нас",
-"Говорите я цела внимание",
-"А какую сумму можно получить",
-"Если я не ошибаюсь то на предложение обычно принято уточнять а почему именно ваше предложение выгоднее чем у конкурентов можете рассказать а я запишу",
-"И хорошо но невпопад и хорошо но не годится",
-"Так а какие тут нюансы подводные камни так сказать",
-"Уделю только говорите погромче",
-"Вы говорите я слушаю вас",
-"Я отправлю его если дозвониться сейчас не получится",
-"А может ли абонент связаться с вами по номеру с которого вы звоните",
-"Подскажите вы звоните по личному или по деловому вопросу",
-"А станет больше минут на разговоры в таком случае",
-"Да примерно вот обсудили мне вот больше всего тинькофф подойдет потому что в данный момент им пользуюсь активнее всего",
-"Ну я самостоятельно да выполняла",
-"Всю жизнь я же не знаю сколько",
-"Того кого еще раз плохо слышно было",
-"Ой как странно у меня вообще ничего нет от сбербанка я давно видно все закрыла",
-"Американских компаний даются портфели или в основном россия",
-"Ты сейчас нет сейчас просто квартиру снимаю нужно для более хорошей жизни так сказать комфортной как вы и сказали ранее",
-"Может быть у них формат изменился я не знаю там они говорят что предоставить",
-"Да я не знаю как то ну просто решил попробовать почему нет",
-"Говорите я села внимание",
-"Да будет в принципе здравствуйте",
-"Алло ой минуту подождите пожалуйста выйдет другое место Тут слишком шумно сейчас Так секунду Ага все говорите я слушаю",
-"Стоит ли ввязываться в такую авантюру что сами думаете",
-"Извините я не очень внимательно слушала честно говоря",
-"Да и в питере метро будет открыто в новогоднюю ночь",
-"Я правильно поняла что вам нужно мое устное согласие",
-"Да ну подождите давайте начнем с того как вас зовут откуда у вас мой номер и что за контору вы представляете",
-"Этому можно позавидовать",
-"А в биткоинах можно ваш кредит погашать",
-"Я хочу выбрать поручителем своего виртуального помощника можно же так",
-"Можете пожалуйста вот это тоже пробить я совсем забыл взять его сейчас сейчас вернусь",
-"Да и мне еще парламент так рублю",
-"Простите пожалуйста а у вас есть бонусная карта я свой дом забыл",
-"Я не помню чтобы такое было но давайте еще раз",
-"Просто у вас в зале немножко другой ценник стоял",
-"Ой можно вас попросить не пробивать это а просто цену мне сказать потому что там не было на полке и я не увидел ее",
-"Да да да все правильно все правильно так смотри а белизна концентрата с аукциона с аукциона есть вообще в этой заявке или нет",
-"Да да да вот который чуть чуть левее да все верно спасибо",
-"А можно отказаться и не пробивать",
-"А по бонусной",
-"Давно хотелось научиться правильно выбирать арбузы вы это можете сразу предупреждаю со мной будет непросто",
-"Если вы не кладете трубку чтобы не обидеть меня не волнуйтесь ее могу положить я",
-"Добрые дела красят же человека",
-"Рожь да пшеница годом родится а добрый человек всегда пригодится",
-"Связь пропала к сожалению сначала вашей фразы не расслышал",
-"Давайте еще раз с самого начала",
-"Кто то наверное да оценит",
-"Вопрос риторический верно я поняла о чем мы там говорили давайте продолжим",
-"А вы живой человек или автоответчик",
-"Знаете вы очень вовремя мне позвонили я в этой теме как раз недавно себе наметила разобраться",
-"Назовите конкретно что вам сейчас от меня надо меня это уже немножко напрягает это довольно таки ну",
-"Странный у нас с вами разговор поэтому конкретно что как вы хотите что мне для этого нужно сделать чтобы ну мы до чего то с вами дошли",
-"Назовите конкретно что вам сейчас от меня надо меня это уже немножко напрягает это довольно таки ну",
-"Странный у нас с вами разговор поэтому конкретно что как вы хотите что мне для этого нужно сделать чтобы ну мы до чего то с вами дошли",
-"Последний раз после такого вопроса я чуть в секту не попал вы не от них",
-"К сожалению нет но можете отрепетировать на мне подойдет",
-"Отказаться и не пробивать",
-"Можете повторить последнее ну плохо слышу",
-"Вы говорите слишком быстро можно помедленнее",
-"А давайте чуть медленнее поговорим тогда ничего не будем делать",
-"Не интересно да да рассказывайте",
-"Можете чуть медленнее перезвонить",
-"Начали говорить и пропали повторите еще раз",
-"Извините не улавливаю смысл можете объяснить подробнее",
-"Вы пропали половину не расслышала что вы там говорили",
-"А вы можете с этим месяцем поговорить а то я ничего не поняла",
-"Да да говорите так куда ты лезешь",
-"Извините у меня какие то перебои в яме",
-"Может пробить пробить я забыл взять его сейчас сейчас вернусь",
-"Извините только вот у меня на кассе продуктов тут навалом можете чуть чуть буквально подождать и я вам сейчас отвечу",
-"Да мне сын все подключит если надо будет вы лучше мне",
-"О застройщик у меня как раз вопрос у меня в телефоне только холодные звонки когда включатся горячие уже давно жду",
-"Из чего нынче строятся ваши дома палки точно есть 2 материал подзабыл",
-"Для меня комфорт класс когда абонента не беспокоют звонками это даже комфорт +",
-"Мне бы хотелось квартиру с видом на марс чтобы с утра встать открыть шторы а там все красное кратеры и марсоходы работают у вас такое есть",
-"Все хорошее когда то кончается и плохое тоже вот и нам пора прощаться пока пока",
-"Ой как интересно а можно все детали вашего предложения а я запишу себе на будущее",
-"Связь должна быть безопасной",
-"Эксклюзивное предложение от ведущего банка россии чтобы успеть получить бесплатную консультацию и помощь в одобрении ипотеки нажмите 1 2 если уже не актуально",
-"Это звонок из сервиса займов екапуста онк хорош интерфинанс менеджер по работе с клиентами разговоры записываются",
-"Задайте ваш вопрос или если вы знаете внутренний номер сотрудника скажите фразу соединение по внутреннему номеру",
-"Добрый день спасибо что перезвонили",
-"Подождите вы уверены что не ошиблись номером",
-"К сожалению я не расслышала последнюю реплику повторите пожалуйста",
-"Потерял любимую веревку так что связаться не получится",
-"Добрый день благодарю вас за звонок",
-"Не думаю что это хорошая идея вы сразу же начнете предлагать свои услуги и я попрошу вас отвязаться",
-"Знаете вы очень вовремя мне позвонили я с этой темой как раз недавно себе наметила разобраться поэтому продолжайте я слушаю",
-"Я обязательно подумаю хорошо сколько ваше предложение действительно",
-"Не подскажите если я помогу настройки ставку по ипотеке снизите",
-"Миша сюда подойди пожалуйста але извините ребенок далеко убежал еще раз можете повторить",
-"А какой кредит лимит Сейчас я звук на телефоне проверю",
-"Знаете вы очень вовремя мне позвонили я с этой темой как раз недавно себе наметила разобраться",
-"Ну что за лабуду вы здесь",
-"Повторите пожалуйста последнее предложение к сожалению связь местами пропадает",
-"Да я трубочку передаю сейчас поговорите",
-"Плохо слышно повторите пожалуйста",
-"Здравствуйте внимательно слушаю",
-"Как хорошо что вы сейчас позвонили потом я буду занята уже не отвечу",
-"Алло кто это не знаю по номеру",
-"Повисите пол минуты буквально сейчас вернусь Ну все я здесь слушаю",
-"То есть пол минуты буквально сейчас вернусь",
-"Спасибо передам это абоненту какие либо подробности рассказать",
-"Уточните с какой целью звоните",
-"Скажу вам по секрету это не абонент",
-"Где про вас можно подробнее прочитать у вас есть сайт",
-"Продолжайте я пока слушаю считайте заинтересовался",
-"давайте я поделюсь номерами ваших коллег они мне часто предлагают в долги",
-"представляете я сейчас отшучусь и положу трубку а вы",
-"Алло вас не слышно скажите еще раз пожалуйста",
-"Будьте любезны повторите еще последнее предложение к сожалению связь",
-"бы вас пояснить пожалуйста что имеется ввиду",
-"Было бы славно если бы абонент мог сейчас ответить а пока давайте я все запишу и передам",
-"Вас когда то расколдуют и вы будете работать там где вам эту фразу будут говорить от чистого сердца",
-"Вы внезапно замолчали я не совсем поняла в чем суть в итоге",
-"Вы вроде не договорились продолжайте",
-"Вы начали говорить уже и замолчали слышите меня",
-"долги дороги представьте насколько я устала",
-"Знаете с этим нужно пожить взвесить все за и против",
-"Извините я отвлеклась на секунду на чем мы остановились",
-"Мне было бы весьма интересно узнать подробности",
-"Мне кажется я про вас по телевизору что то слышала продолжайте",
-"Мне кажется я что то подобное слышала мне подруга рассказывала только",
-"на его телефоне включен беззвучный режим или он не может взять трубку",
-"На такое решение нужна минимум пара дней",
-"Не затруднило бы вас пояснить пожалуйста что",
-"Не молчите я не пойму я осталась 1 в разговоре или нет",
-"это мтс защитник",
-"новое положение о кредитах и вы можете полностью избавиться от долговых обязательств",
-"Повторите пожалуйста последнее предложение к сожалению в пятницу они",
-"Пожалуйста повторите сказанное еще раз хотелось бы убедиться в том что я все корректно расслышала",
-"Поищите полминуты буквально сейчас вернусь",
-"Понятно а вы все рассказали или есть еще какие то детали которые лучше сразу узнавать",
-"Похоже вы рекордсмен по продолжительности разговоров мне хватило этой беседы чтобы восхититься вами",
-"Принесите полминуты буквально сейчас вернусь",
-"Слушайте это правда очень интересно это все или мне надо знать еще детали",
-"Слушаю вас внимательно говорите",
-"Так вы сами ничего не говорите алло",
-"У меня долгов нет зато одолжений куча",
-"действует новое положение о кредитах и вы можете полностью избавиться",
-"Компьютеры производят миллионы вычислительных операций в секунду и по меркам робота мы с вами болтаем уже вечность а могли бы написать симфонию создать шедевр",
-"Позвоните попозже ваши напарники еще не успели предложить мне варианты накопить долги",
-"Мне кажется я что то подобное слышала мне подруга рассказывала только я не все запомнила продолжайте",
-"Благодарю вас за информацию сориентируйте меня пожалуйста по дальнейшим действиям с вашей и с моей стороны",
-"Так а можно немного больше деталей чтобы я смог записать и принять решение",
-"Я и так каждый день пашу как лошадь а вы мне предлагаете еще",
-"Займ узнать дату оплаты продлить все под рукой узнать статус обработки вашей заявки нажмите 1 по вопросам обслуживания займа нажмите 2 вопрос по просроченной задолженности нажмите 3 хотите заполнить заявку по телефону нажмите 4 для соединения с оператором нажмите 0 или оставайтесь на линии",
-"Слышали последние новости вот и я нет потому что мы с вами все говорим и говорим думаю пришла пора прощаться",
-"Карьерные возможности это всегда",
-"Похоже вы рекордсмен по продолжительности разговоров не хватило этой беседы чтобы восхититься вами пойду другим расскажу всего доброго",
-"Сэкономьте время не ожидая специалиста посмотрите информацию в личном кабинете во 1 это быстрее а во 2 сможете получить больше информации и управлять займом",
-"Здорово давайте подробнее",
-"Абоненту нужно приехать поняла записала",
-"Звучит гладко я бы даже сказала привлекательно",
-"Так как вы все еще на проводе и не хотите класть трубку расскажу вам несколько анекдотов про спамеров и мошенников",
-"Как поймать спамера просто сказать мтс защитник на проводе и смотри как исчезает",
-"Продолжаете беспокоить людей под новый год а могли бы уже быть в санях ну домой в них ехать отдыхать",
-"Дозвонились поздравляю теперь рассказывайте зачем",
-"Не просто так не сегодня черная кошка дорогу перебежала так что в этой ситуации мне нужно предпринять",
-"Уточните по какому вопросу звоните вы можете рассказать мне что вы хотели предложить",
-"Слушайте ну вообще ситуация как бы забавная потому что у меня денег 0 сейчас было 8 марта и как бы в цветочном тюльпаны 250 за штуку а тебе надо минимум 25 и то есть у меня просто 0 0 денег",
-"Слушайте а можно вы поможете если я вам типа скину и тогда может быть что то можно будет решить",
-"Секретарь оля у аппарата слушаю вас",
-"Здравствуйте вызываемый абонент сейчас не может ответить возможно его телефон разряжен или он находится вне зоны действия сети например летит в самолете вы можете оставить сообщение после звукового сигнала",
-"Я я почему про это говорю потому что вот у меня недавно была ситуация заблокировали карту и мне пожалуйста деньги комиссия потом открытие карты переведите деньги чтобы активировать и ощущение чисто что денег требуют просто сейчас за все",
-"Я не совсем понимаю как я могу в этой ситуации что то сделать потому что у меня просто на карте нолик сейчас было 8 марта я купил ей цветы я купил ей вино любимая и у меня просто 0 0 на карте денег",
-"Я могу попробовать у мамы попросить потому что если плитой не возьмете то я ну сейчас ща я маме напишу 2 секунды",
-"Слушайте а можно вы поможете если я вам типа из ю эс ди ти клик то есть скину и тогда может быть что то можно будет решить",
-"К сожалению я не расслышал последнюю реплику",
-"Так подождите подождите не соображу последний момент повторите еще раз можно помедленнее",
-"Секунду сейчас я отойду где потише",
-"Позвольте я сразу уточню есть ли дополнительные детали о которых вы еще не рассказали",
-"Если у вас вопрос о реализации программы реновации вы можете остаться на линии и ваш звонок будет переведен на справочную службу города москвы для общей консультации",
-"А на сколько это бесплатно по шкале от 1 до 10",
-"Предлагаю взять тайм аут позвоните если будете готовы начать все сначала",
-"Дело в том что сейчас абонент не смог ответить но я секретарь ева сообщу ему что вы звонили что я еще могу добавить",
-"Ой хорошо что вы сейчас позвонили я потом занята буду уже не отвечу",
-"Вся информация важная но не вся нужная у вас нужная",
-"Предлагаю закончить наш разговор на приятной ноте не нравится нота соль и так сауль",
-"Для разговора с оператором нажмите 1",
-"Для проверки баланса лицевого счета нажмите 1 для соединения с сотрудником абонентского отдела нажмите 2 для соединения с сотрудником технической поддержки нажмите 3 для оценки качества предоставляемых услуг и обслуживания вы можете оставить голосовое сообщение нажав 0",
-"Спасибо за ожидание к сожалению сейчас все сотрудники заняты пожалуйста оставайтесь на линии и вам ответит 1 свободный сотрудник",
-"Молчание золото так что это очень ценный звонок",
-"Что ж похоже не в этот раз но я сообщу абоненту что вы звонили",
-"Над этим нужно думать Не молчите я не пойму осталась я 1 в разговоре или нет Еще раз как называется Не молчите я не пойму осталась я 1 в разговоре или нет",
-"Знаете мне кажется что что то подобное уже слышала у меня подружка рассказывала только я вот все не запомнила ну продолжайте да да",
-"Я как раз вчера об этом думала вы мысли читаете что ли",
-"Подождите пожалуйста собака убежала куда то да и кошка с рыбкой вместе с ней",
-"Извините кажется я отвлеклась сейчас сообщу что вы звонили и передам что записали",
-"Поиграем сейчас я сделаю мхатовскую паузу если не успеете положить трубку то вы проиграли вы проиграли до свидания",
-"Сейчас вам не могут ответить необходимо ли вам перезвонить",
-"Оцените вашу готовность рекомендовать нашу компанию",
-"Для оценки качества консультации нажмите клавишу от 1 до 5 где единица неудовлетворительно а 5 отлично после того как прозвучит вопрос оцените насколько был вежлив и внимателен специалист который обслуживал вас",
-"Вас приветствует облачный сервис провайдер дэйта пул чтобы связаться с нами дождитесь ответа оператора или оставьте заявку на сайте или в личном кабинете",
-"Алло чем могу быть полезен",
-"Это точно меня касается",
-"Это не вы мне неделю назад звонили",
-"Лучше завтра ближе к обеду вернемся к этому вопросу",
-"Скажите а какие тогда бенефиты вы получаете от таких условий",
-"Расскажите пожалуйста подробнее на каких условиях действует ваше предложение",
-"Странно говорить вам до свидания если я больше не хочу с вами свиданий скажу лучше прощайте",
-"Какие шаги я должен предпринять",
-"Многие животные впадают в спячку и эти состояния бывают разными",
-"Не совсем понял предпосылку",
-"Какие следующие шаги стоит предпринять"
+def call_pinned(func, *args):
+    """Задача пула целиком на одной версии индекса (опубликованной к ее началу); выборочно - с трассой"""
+    return tracer.call(task_name(func), active_index.call, func, *args)
 
-}
+# Версия индекса, пул, кэш результатов, объединение запросов, микропакеты (service_runtime.py)
+runtime = ServiceRuntime("embeddings", VECTORIZER_PARAMS, call_pinned)
+active_index = runtime.active_index
+service_metrics = runtime.metrics
+current_index = runtime.current_index
+publish_index = runtime.publish
 
-class TextPreprocessor:
-    """Класс для предобработки текста"""
-    
-    @staticmethod
-    def clean_text(text: str) -> str:
-        """Очистка и нормализация текста"""
-        # Приведение к нижнему регистру
-        text = text.lower()
-        
-        # Удаление знаков препинания
-        text = text.translate(str.maketrans('', '', string.punctuation))
-        
-        # Удаление лишних пробелов
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
-    
-    @staticmethod
-    def get_words(text: str) -> List[str]:
-        """Получение списка слов из текста"""
-        cleaned = TextPreprocessor.clean_text(text)
-        return cleaned.split()
+# Параметры двухуровневого (кластерного) поиска
+CLUSTER_MIN_PHRASES = int(os.getenv("CLUSTER_MIN_PHRASES", "20000"))  # меньше - полный перебор
+CLUSTER_COUNT = int(os.getenv("CLUSTER_COUNT", "0"))  # 0 - около sqrt(N) кластеров
+CLUSTER_PROBES = int(os.getenv("CLUSTER_PROBES", "4"))  # сколько ближайших кластеров просматривать
 
-class SimilarityCalculator:
-    """Класс для вычисления различных метрик схожести"""
-    
-    @staticmethod
-    def jaccard_similarity(text1: str, text2: str) -> float:
-        """Вычисление коэффициента Жаккара"""
-        words1 = set(TextPreprocessor.get_words(text1))
-        words2 = set(TextPreprocessor.get_words(text2))
-        
-        if not words1 and not words2:
-            return 1.0
-        
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union) if union else 0.0
-    
-    @staticmethod
-    def sequence_similarity(text1: str, text2: str) -> float:
-        """Вычисление схожести последовательностей"""
-        clean1 = TextPreprocessor.clean_text(text1)
-        clean2 = TextPreprocessor.clean_text(text2)
-        
-        return SequenceMatcher(None, clean1, clean2).ratio()
-    
-    @staticmethod
-    def word_overlap_similarity(text1: str, text2: str) -> float:
-        """Вычисление схожести на основе пересечения слов"""
-        words1 = TextPreprocessor.get_words(text1)
-        words2 = TextPreprocessor.get_words(text2)
-        
-        if not words1 and not words2:
-            return 1.0
-        
-        counter1 = Counter(words1)
-        counter2 = Counter(words2)
-        
-        # Вычисляем пересечение с учетом частоты
-        intersection = sum((counter1 & counter2).values())
-        total = sum(counter1.values()) + sum(counter2.values())
-        
-        return (2 * intersection) / total if total > 0 else 0.0
+# Адаптивная глубина переранжирования по разрывам TF-IDF оценок
+ADAPTIVE_RERANK = os.getenv("ADAPTIVE_RERANK", "1") == "1"
+RERANK_CALIBRATION_QUERIES = int(os.getenv("RERANK_CALIBRATION_QUERIES", "200"))
+RERANK_FLAT_GAP = float(os.getenv("RERANK_FLAT_GAP", "0.05"))  # разрыв, ниже которого оценки "плоские"
+RERANK_WIDEN_FACTOR = int(os.getenv("RERANK_WIDEN_FACTOR", "3"))  # во сколько раз расширять окно
+
+# База фраз автоответчиков при запуске (phrase_corpus.py); после перестроения - в версии индекса
+phrases_db: Set[str] = load_phrases()  # data/phrases.bin или PHRASES_PATH
+
+class IndexState(BaseIndexState):
+    """Версия индекса с кластерами и калибровкой переранжирования"""
     
-    @staticmethod
-    def length_weighted_similarity(text1: str, text2: str) -> float:
-        """Схожесть с учетом длины текста"""
-        # Комбинируем несколько метрик
-        jaccard = SimilarityCalculator.jaccard_similarity(text1, text2)
-        sequence = SimilarityCalculator.sequence_similarity(text1, text2)
-        word_overlap = SimilarityCalculator.word_overlap_similarity(text1, text2)
-        
-        # Учитываем длину - короткие фразы должны иметь меньший вес
-        len1 = len(TextPreprocessor.get_words(text1))
-        len2 = len(TextPreprocessor.get_words(text2))
-        
-        # Штраф за слишком короткие фразы
-        length_penalty = 1.0
-        if min(len1, len2) < 3:  # Если одна из фраз содержит менее 3 слов
-            length_penalty = 0.3
-        elif min(len1, len2) < 5:  # Если одна из фраз содержит менее 5 слов
-            length_penalty = 0.6
-        
-        # Взвешенная комбинация метрик
-        combined_score = (jaccard * 0.3 + sequence * 0.3 + word_overlap * 0.4) * length_penalty
-        
-        return combined_score
+    def __init__(self, phrases: Set[str]):
+        super().__init__(phrases)
+        self.cluster_index: Optional[ClusteredIndex] = None
+        self.rerank_policy = AdaptiveRerank(flat_gap=RERANK_FLAT_GAP, widen_factor=RERANK_WIDEN_FACTOR)
+
+def require_index() -> IndexState:
+    index = active_index.get()
+    if index is None:
+        raise HTTPException(status_code=500, detail="Система не инициализирована")
+    return index
+
+# Метрики схожести берут таблицу лемм из версии индекса, закрепленной за задачей
+bind_lemmatizer(runtime.current_lemmatizer)
 
 def initialize_system():
     """Инициализация TF-IDF векторизатора и предварительное вычисление матрицы"""
-    global tfidf_vectorizer, phrases_list, phrases_tfidf_matrix, phrases_db
-    
     logger.info("Инициализация TF-IDF векторизатора...")
     start_time = time.time()
     
     try:
-        # Конвертируем set в list для индексации
-        phrases_list = list(phrases_db)
-        
-        # Инициализируем TF-IDF векторизатор
-        tfidf_vectorizer = TfidfVectorizer(
-            lowercase=True,
-            stop_words=None,
-            ngram_range=(1, 3),
-            max_features=10000
-        )
-        
-        logger.info(f"Вычисление TF-IDF матрицы для {len(phrases_list)} фраз...")
-        # Предварительно вычисляем TF-IDF матрицу для всех фраз
-        phrases_tfidf_matrix = tfidf_vectorizer.fit_transform(phrases_list)
+        publish_index(build_index_state(phrases_db))
         
         load_time = time.time() - start_time
         logger.info(f"Инициализация завершена за {load_time:.2f} секунд")
@@ -2623,91 +94,405 @@ def initialize_system():
         logger.error(f"Ошибка при инициализации: {e}")
         raise
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    # Startup
-    logger.info("Запуск приложения...")
-    initialize_system()
-    yield
-    # Shutdown
-    logger.info("Завершение работы приложения...")
+def build_index_state(phrases: Set[str]) -> IndexState:
+    """Новая версия индекса: из снимка или построением"""
+    settings = runtime.index_settings(
+        clusters=[CLUSTER_MIN_PHRASES, CLUSTER_COUNT],
+        rerank=[ADAPTIVE_RERANK, RERANK_CALIBRATION_QUERIES]
+    )
+    return runtime.build_index_state(IndexState(phrases), settings, build_index, load_index_snapshot, snapshot_arrays)
+
+def rebuild_index() -> IndexState:
+    """Версия индекса по текущему файлу базы (для IndexReloader)"""
+    return build_index_state(load_phrases())
+
+def build_index(index: IndexState):
+    """Построение индекса по phrases_list: леммы, дубликаты, TF-IDF, кластеры, калибровка"""
+    runtime.build_index(index)
+    
+    # Кластеризуем векторы для двухуровневого поиска на больших базах
+    if len(index.phrases_list) >= CLUSTER_MIN_PHRASES:
+        index.cluster_index = build_cluster_index()
+    
+    # Калибруем границу для ранней остановки переранжирования
+    if ADAPTIVE_RERANK:
+        calibrate_rerank_policy()
+
+def snapshot_arrays(index: IndexState) -> Dict[str, np.ndarray]:
+    """Кластеры и огибающая переранжирования для снимка индекса"""
+    arrays = {}
+    if index.cluster_index is not None:
+        arrays.update(index.cluster_index.arrays())
+    if ADAPTIVE_RERANK:
+        arrays["rerank_envelope"] = index.rerank_policy.envelope
+    return arrays
+
+def load_index_snapshot(index: IndexState, snapshot: IndexSnapshot):
+    """Кластеры и огибающая переранжирования из снимка"""
+    if "cluster_order" in snapshot.arrays:
+        index.cluster_index = ClusteredIndex.from_arrays(index.phrases_tfidf_matrix, snapshot.arrays)
+    if "rerank_envelope" in snapshot.arrays:
+        index.rerank_policy.envelope = np.asarray(snapshot.arrays["rerank_envelope"])
 
-app = FastAPI(title="Phrase Checker with Embeddings", version="2.0.0", lifespan=lifespan)
+def build_cluster_index(n_clusters: int = CLUSTER_COUNT) -> ClusteredIndex:
+    """Офлайн кластеризация TF-IDF векторов базы фраз"""
+    phrases_tfidf_matrix = current_index().phrases_tfidf_matrix
+    logger.info(f"Кластеризация {phrases_tfidf_matrix.shape[0]} TF-IDF векторов...")
+    return ClusteredIndex(phrases_tfidf_matrix, n_clusters=n_clusters)
+
+def calibrate_rerank_policy(queries_count: int = RERANK_CALIBRATION_QUERIES, depth: int = 30):
+    """Калибровка огибающей: запросы - фразы базы без одного слова, пары - их TF-IDF кандидаты"""
+    start_time = time.time()
+    index = current_index()
+    phrases_list, rerank_policy = index.phrases_list, index.rerank_policy
+    rng = random.Random(42)
+    sample = rng.sample(phrases_list, min(queries_count, len(phrases_list)))
+    queries = []
+    for phrase in sample:
+        words = phrase.split()
+        if len(words) > 2:
+            del words[rng.randrange(len(words))]
+        queries.append(TextPreprocessor.clean_text(" ".join(words)))
+    
+    pairs = []
+    query_matrix = index.tfidf_vectorizer.transform(TextPreprocessor.normalize_many(queries))
+    for i, cleaned_query in enumerate(queries):
+        indices, scores = retrieve_candidates(query_matrix[i], depth)
+        for idx, score in zip(indices, scores):
+            pairs.append((score, SimilarityCalculator.length_weighted_similarity(cleaned_query, phrases_list[idx])))
+    
+    rerank_policy.calibrate(pairs)
+    rerank_policy.reset_stats()
+    logger.info(f"Калибровка переранжирования по {len(pairs)} парам за {time.time() - start_time:.2f} секунд")
 
 # Модели для API
 class TextRequest(BaseModel):
     text: str
     threshold: float = 0.9  # Порог схожести (0.0 - 1.0)
-
-class CheckResponse(BaseModel):
-    exists: bool
-    message: str
-    similarity_score: float = 0.0
-    matched_phrase: str = ""
+    thresholds: Optional[List[float]] = None  # Дополнительные пороги: вердикт на каждый за один расчет
 
 class SimilarPhrasesResponse(BaseModel):
     similar_phrases: List[Tuple[str, float]]
     query_text: str
 
-def find_most_similar(query_text: str, threshold: float = 0.9) -> Tuple[bool, float, str]:
-    """Находит наиболее похожую фразу используя гибридный подход"""
-    if tfidf_vectorizer is None or phrases_tfidf_matrix is None:
-        raise HTTPException(status_code=500, detail="Система не инициализирована")
+def retrieve_candidates(query_tfidf, count: int, probes: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Топ-N кандидатов по TF-IDF: через кластеры, если индекс построен, иначе полным перебором"""
+    index = current_index()
+    cluster_index, phrases_tfidf_matrix = index.cluster_index, index.phrases_tfidf_matrix
+    if cluster_index is not None:
+        with span("tfidf.cluster_search"):
+            indices, scores = cluster_index.search(query_tfidf, probes or CLUSTER_PROBES)
+        return top_candidates(indices, scores, count)
+    
+    with span("tfidf.cosine"):
+        tfidf_similarities = cosine_scores(query_tfidf, phrases_tfidf_matrix)[0]
+    return top_candidates(np.arange(len(tfidf_similarities)), tfidf_similarities, count)
+
+def retrieve_candidates_batch(query_matrix, count: int,
+                              probes: Optional[int] = None) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Топ-N кандидатов для пакета запросов: без кластеров - одно произведение матриц на весь пакет"""
+    index = current_index()
+    if index.cluster_index is not None:
+        return [retrieve_candidates(query_matrix[i], count, probes) for i in range(query_matrix.shape[0])]
+    
+    with span("tfidf.cosine"):
+        tfidf_similarities = cosine_scores(query_matrix, index.phrases_tfidf_matrix)
+    all_rows = np.arange(tfidf_similarities.shape[1])
+    return [top_candidates(all_rows, row, count) for row in tfidf_similarities]
+
+def resolve_member(cleaned_query: str, idx: int, similarity: float) -> Tuple[float, str]:
+    """Для представителя кластера возвращает наиболее похожую исходную фразу кластера"""
+    index = current_index()
+    phrase_members = index.phrase_members
+    phrase = index.phrases_list[idx]
+    if not phrase_members or idx not in phrase_members:
+        return similarity, phrase
+    
+    best_similarity, best_phrase = similarity, phrase
+    for member in phrase_members[idx]:
+        if member == phrase:
+            continue
+        member_similarity = SimilarityCalculator.length_weighted_similarity(cleaned_query, member)
+        if member_similarity > best_similarity:
+            best_similarity, best_phrase = member_similarity, member
+    return best_similarity, best_phrase
+
+def find_most_similar(query_text: str, threshold: float = 0.9, probes: Optional[int] = None,
+                      budget: Optional[MatchBudget] = None, stages: Optional[List[str]] = None) -> Tuple[bool, float, str]:
+    """Находит наиболее похожую фразу используя гибридный подход
+    
+    С бюджетом времени возвращает лучшее найденное до его исчерпания совпадение;
+    выполненные этапы добавляются в stages (см. anytime.py).
+    """
+    return find_most_similar_multi(query_text, [threshold], probes, budget, stages)[0]
+
+def find_most_similar_multi(query_text: str, thresholds: List[float], probes: Optional[int] = None,
+                            budget: Optional[MatchBudget] = None,
+                            stages: Optional[List[str]] = None) -> List[Tuple[bool, float, str]]:
+    """Вердикты для нескольких порогов за один расчет (поиск от порога не зависит)"""
+    best_similarity, best_phrase = find_best_match(query_text, probes, budget, stages)
+    
+    # Проверяем пороги
+    return apply_thresholds(best_similarity, best_phrase, thresholds)
+
+def apply_thresholds(best_similarity: float, best_phrase: str, thresholds: List[float]) -> List[Tuple[bool, float, str]]:
+    """Вердикты по порогам для найденного лучшего совпадения"""
+    results = []
+    for threshold in thresholds:
+        if best_similarity >= threshold:
+            results.append((True, best_similarity, best_phrase))
+        else:
+            results.append((False, best_similarity, ""))
+    return results
+
+# Глубина первичной выборки TF-IDF для поиска лучшего совпадения (окно может расшириться)
+BEST_MATCH_DEPTH = 10
+
+def find_best_match(query_text: str, probes: Optional[int] = None, budget: Optional[MatchBudget] = None,
+                    stages: Optional[List[str]] = None) -> Tuple[float, str]:
+    """Лучшее совпадение гибридным подходом без учета порога"""
+    index = require_index()
+    if budget is not None:
+        budget.start()
+    if stages is None:
+        stages = []
     
     # Предобработка запроса
+    started = time.perf_counter()
     cleaned_query = TextPreprocessor.clean_text(query_text)
+    normalized_query = TextPreprocessor.normalize_text(cleaned_query)
+    started = service_metrics.stage("normalize", started)
+    exact = match_exact(cleaned_query, stages)
+    started = service_metrics.stage("exact", started)
     
     # TF-IDF поиск для первичной фильтрации
-    query_tfidf = tfidf_vectorizer.transform([cleaned_query])
-    tfidf_similarities = cosine_similarity(query_tfidf, phrases_tfidf_matrix)[0]
+    with span("tfidf.transform"):
+        query_tfidf = index.tfidf_vectorizer.transform([normalized_query])
+    started = service_metrics.stage("vectorize", started)
+    max_depth = BEST_MATCH_DEPTH * RERANK_WIDEN_FACTOR if ADAPTIVE_RERANK else BEST_MATCH_DEPTH
+    top_indices, top_scores = retrieve_candidates(query_tfidf, max_depth, probes)
+    started = service_metrics.stage("retrieve", started)
+    stages.append(STAGE_TFIDF)
+    best = rerank_best(cleaned_query, top_indices, top_scores, budget, stages, exact)
+    service_metrics.stage("rerank", started)
+    service_metrics.scores.observe(best[0])
+    return best
+
+def find_best_match_batch(query_texts: List[str], probes: Optional[int] = None,
+                          budget: Optional[MatchBudget] = None) -> List[object]:
+    """Лучшие совпадения для пакета запросов: общая векторизация и выборка кандидатов
+    
+    Для каждого запроса возвращается (сходство, фраза, этапы) или исключение этого запроса.
+    """
+    index = require_index()
+    if budget is not None:
+        budget.start()
     
-    # Получаем топ-10 кандидатов по TF-IDF
-    top_indices = np.argsort(tfidf_similarities)[::-1][:10]
+    started = time.perf_counter()
+    cleaned_queries = TextPreprocessor.clean_many(query_texts)
+    normalized_queries = [TextPreprocessor.normalize_text(query) for query in cleaned_queries]
+    started = service_metrics.stage("normalize", started)
+    exact = [match_exact(cleaned_query, []) for cleaned_query in cleaned_queries]
+    started = service_metrics.stage("exact", started)
+    with span("tfidf.transform"):
+        query_matrix = index.tfidf_vectorizer.transform(normalized_queries)
+    started = service_metrics.stage("vectorize", started)
+    max_depth = BEST_MATCH_DEPTH * RERANK_WIDEN_FACTOR if ADAPTIVE_RERANK else BEST_MATCH_DEPTH
+    candidates = retrieve_candidates_batch(query_matrix, max_depth, probes)
+    started = service_metrics.stage("retrieve", started)
+    
+    results = []
+    for position, (cleaned_query, query_exact, (top_indices, top_scores)) in enumerate(zip(cleaned_queries, exact, candidates)):
+        try:
+            stages = [STAGE_EXACT, STAGE_TFIDF]
+            query_budget = item_budget(budget, len(cleaned_queries) - position)
+            best = rerank_best(cleaned_query, top_indices, top_scores, query_budget, stages, query_exact)
+            started = service_metrics.stage("rerank", started)
+            service_metrics.scores.observe(best[0])
+            results.append(best + (stages,))
+        except Exception as e:
+            logger.error(f"Ошибка при поиске схожести: {e}")
+            results.append(e)
+    return results
+
+@traced("exact")
+def match_exact(cleaned_query: str, stages: List[str]) -> Tuple[float, str]:
+    """Этап exact: сходство с фразой базы, совпадающей с запросом после очистки"""
+    stages.append(STAGE_EXACT)
+    phrase = current_index().exact_phrases.get(cleaned_query)
+    if phrase is None:
+        return 0.0, ""
+    return SimilarityCalculator.length_weighted_similarity(cleaned_query, phrase), phrase
+
+@traced("rerank")
+def rerank_best(cleaned_query: str, top_indices: np.ndarray, top_scores: np.ndarray,
+                budget: Optional[MatchBudget] = None, stages: Optional[List[str]] = None,
+                exact: Tuple[float, str] = (0.0, "")) -> Tuple[float, str]:
+    """Уточнение кандидатов TF-IDF комбинированным сходством, пока остается бюджет"""
+    index = current_index()
+    phrases_list, rerank_policy = index.phrases_list, index.rerank_policy
+    base_depth = BEST_MATCH_DEPTH
+    depth, widened = rerank_policy.depth(top_scores, base_depth) if ADAPTIVE_RERANK \
+        else (len(top_indices), False)
     
     best_similarity = 0.0
-    best_phrase = ""
+    best_idx = -1
+    best_position = -1
+    reranked = 0
+    early_stop = False
+    exhausted = False
     
     # Уточняем с помощью комбинированного сходства
-    for idx in top_indices:
+    for position in range(depth):
+        # Оставшиеся кандидаты не могут превзойти лучший по калиброванной границе
+        if ADAPTIVE_RERANK and best_idx >= 0 and rerank_policy.bound(top_scores[position]) < best_similarity:
+            early_stop = True
+            break
+        # TF-IDF топ-1 оценивается всегда, остальные кандидаты - пока остается бюджет
+        if position > 0 and budget_exhausted(budget):
+            exhausted = True
+            break
+        
+        idx = top_indices[position]
         phrase = phrases_list[idx]
         combined_similarity = SimilarityCalculator.length_weighted_similarity(cleaned_query, phrase)
+        reranked += 1
         
         if combined_similarity > best_similarity:
             best_similarity = combined_similarity
-            best_phrase = phrase
+            best_idx = idx
+            best_position = position
+    
+    service_metrics.candidates.observe(reranked)
+    if stages is not None and reranked:
+        stages.append(STAGE_RERANK if not exhausted else f"{STAGE_RERANK}_partial")
+    if exhausted:
+        # Бюджет кончился: лучший из точного совпадения и уже уточненных кандидатов
+        if stages is not None:
+            stages.append(STAGE_BUDGET_EXHAUSTED)
+        if exact[0] > best_similarity or best_idx < 0:
+            return float(exact[0]), exact[1]
+        return float(best_similarity), phrases_list[best_idx]
     
-    # Проверяем порог
-    if best_similarity >= threshold:
-        return True, float(best_similarity), best_phrase
-    else:
-        return False, float(best_similarity), ""
+    if ADAPTIVE_RERANK:
+        rerank_policy.record(reranked, early_stop, widened, best_position >= base_depth)
+    
+    # Переходим от представителя к исходной фразе его кластера
+    best_phrase = ""
+    if best_idx >= 0:
+        best_similarity, best_phrase = resolve_member(cleaned_query, best_idx, best_similarity)
+    
+    return float(best_similarity), best_phrase
+
+# Топ-50 кандидатов TF-IDF для более точного ранжирования топ-K (окно может расшириться)
+TOP_SIMILAR_DEPTH = 50
 
-def find_top_similar(query_text: str, top_k: int = 5) -> List[Tuple[str, float]]:
+def find_top_similar(query_text: str, top_k: int = 5, probes: Optional[int] = None) -> List[Tuple[str, float]]:
     """Находит топ-K наиболее похожих фраз используя гибридный подход"""
-    if tfidf_vectorizer is None or phrases_tfidf_matrix is None:
-        raise HTTPException(status_code=500, detail="Система не инициализирована")
+    index = require_index()
     
     # Предобработка запроса
     cleaned_query = TextPreprocessor.clean_text(query_text)
     
     # TF-IDF поиск для первичной фильтрации
-    query_tfidf = tfidf_vectorizer.transform([cleaned_query])
-    tfidf_similarities = cosine_similarity(query_tfidf, phrases_tfidf_matrix)[0]
+    with span("tfidf.transform"):
+        query_tfidf = index.tfidf_vectorizer.transform([TextPreprocessor.normalize_text(cleaned_query)])
+    max_depth = TOP_SIMILAR_DEPTH * RERANK_WIDEN_FACTOR if ADAPTIVE_RERANK else TOP_SIMILAR_DEPTH
+    top_indices, top_scores = retrieve_candidates(query_tfidf, max_depth, probes)
+    return rerank_top(cleaned_query, top_indices, top_scores, top_k)
+
+def find_top_similar_batch(query_texts: List[str], top_k: int = 5, probes: Optional[int] = None) -> List[object]:
+    """Топ-K для пакета запросов: общая векторизация и выборка кандидатов
+    
+    Для каждого запроса возвращается список (фраза, сходство) или исключение этого запроса.
+    """
+    index = require_index()
     
-    # Получаем топ-50 кандидатов по TF-IDF для более точного ранжирования
-    candidate_count = min(50, len(phrases_list))
-    top_indices = np.argsort(tfidf_similarities)[::-1][:candidate_count]
+    cleaned_queries = TextPreprocessor.clean_many(query_texts)
+    with span("tfidf.transform"):
+        query_matrix = index.tfidf_vectorizer.transform([TextPreprocessor.normalize_text(query) for query in cleaned_queries])
+    max_depth = TOP_SIMILAR_DEPTH * RERANK_WIDEN_FACTOR if ADAPTIVE_RERANK else TOP_SIMILAR_DEPTH
+    candidates = retrieve_candidates_batch(query_matrix, max_depth, probes)
+    
+    results = []
+    for cleaned_query, (top_indices, top_scores) in zip(cleaned_queries, candidates):
+        try:
+            results.append(rerank_top(cleaned_query, top_indices, top_scores, top_k))
+        except Exception as e:
+            logger.error(f"Ошибка при поиске похожих фраз: {e}")
+            results.append(e)
+    return results
+
+@traced("rerank")
+def rerank_top(cleaned_query: str, top_indices: np.ndarray, top_scores: np.ndarray,
+               top_k: int) -> List[Tuple[str, float]]:
+    """Топ-K кандидатов TF-IDF по комбинированному сходству"""
+    index = current_index()
+    phrases_list, rerank_policy = index.phrases_list, index.rerank_policy
+    base_depth = TOP_SIMILAR_DEPTH
+    depth, widened = rerank_policy.depth(top_scores, base_depth) if ADAPTIVE_RERANK \
+        else (len(top_indices), False)
     
     # Вычисляем комбинированное сходство для кандидатов
     results = []
-    for idx in top_indices:
-        phrase = phrases_list[idx]
-        combined_similarity = SimilarityCalculator.length_weighted_similarity(cleaned_query, phrase)
-        results.append((phrase, float(combined_similarity)))
+    kth_best = []  # мин-куча из top_k лучших оценок
+    early_stop = False
+    for position in range(depth):
+        # Оставшиеся кандидаты не могут попасть в топ-K по калиброванной границе
+        if ADAPTIVE_RERANK and len(kth_best) == top_k and rerank_policy.bound(top_scores[position]) < kth_best[0]:
+            early_stop = True
+            break
+        
+        idx = top_indices[position]
+        combined_similarity = SimilarityCalculator.length_weighted_similarity(cleaned_query, phrases_list[idx])
+        combined_similarity, phrase = resolve_member(cleaned_query, idx, combined_similarity)
+        results.append((phrase, float(combined_similarity), position))
+        if len(kth_best) < top_k:
+            heapq.heappush(kth_best, combined_similarity)
+        elif combined_similarity > kth_best[0]:
+            heapq.heapreplace(kth_best, combined_similarity)
     
     # Сортируем по комбинированному сходству и возвращаем топ-K
+    reranked = len(results)
     results.sort(key=lambda x: x[1], reverse=True)
-    return results[:top_k]
+    results = results[:top_k]
+    if ADAPTIVE_RERANK:
+        changed = any(position >= base_depth for _, _, position in results)
+        rerank_policy.record(reranked, early_stop, widened, changed)
+    return [(phrase, similarity) for phrase, similarity, _ in results]
+
+async def score_batch(query_texts: List[str]) -> List[object]:
+    """Обработчик микропакета: один расчет в пуле на весь пакет с бюджетом по очереди пула"""
+    return await runtime.run_matching(find_best_match_batch, query_texts, None, current_budget(runtime.match_pool))
+
+async def match_check(text: str, threshold: float, thresholds: Optional[List[float]]):
+    """Вердикты по порогам: запрос попадает в общий микропакет или считается в пуле отдельно"""
+    if runtime.match_batcher is None:
+        return await runtime.run_matching(
+            check_with_thresholds, text, threshold, thresholds, current_budget(runtime.match_pool)
+        )
+    best_similarity, best_phrase, stages = await runtime.match_batcher.submit(text)
+    return split_verdicts(
+        apply_thresholds(best_similarity, best_phrase, [threshold] + list(thresholds or [])), thresholds, stages
+    )
+
+async def check_text(text: str, threshold: float, thresholds: Optional[List[float]]):
+    """Вердикты по порогам через кэш результатов, объединение запросов и микропакеты
+    
+    Возвращает (основной результат, вердикты по доп. порогам, выполненные этапы).
+    """
+    return await runtime.run_cached(
+        ("check", threshold, tuple(thresholds or ())), text, match_check, text, threshold, thresholds,
+        cacheable=lambda value: not is_degraded(value[2])
+    )
+
+app = FastAPI(
+    title="Phrase Checker with Embeddings", version="2.0.0",
+    lifespan=runtime.lifespan(initialize_system, rebuild_index, score_batch)
+)
+
+# Срок ответа и метрики запросов, отказ пула (503/504), /check_phrase/fast, /ws/check_phrase, /admin/*, /metrics
+add_service_routes(app, runtime, check_text, default_threshold=0.9)
 
 @app.get("/", response_class=HTMLResponse)
 async def root():
@@ -2726,57 +511,63 @@ async def api_info():
     """API информация"""
     return {
         "message": "Phrase Checker with Embeddings is running",
-        "phrases_count": len(phrases_db),
-        "system_loaded": tfidf_vectorizer is not None,
-        "tfidf_cached": phrases_tfidf_matrix is not None
+        "phrases_count": runtime.phrases_loaded(),
+        "system_loaded": current_index() is not None,
+        "tfidf_cached": current_index() is not None
     }
 
-@app.post("/check", response_model=CheckResponse)
+def check_with_thresholds(text: str, threshold: float, thresholds: Optional[List[float]],
+                          budget: Optional[MatchBudget] = None):
+    """Основной вердикт и вердикты по дополнительным порогам за один расчет"""
+    stages = []
+    results = find_most_similar_multi(text, [threshold] + list(thresholds or []), budget=budget, stages=stages)
+    return split_verdicts(results, thresholds, stages)
+
+@app.post("/check", response_model=CheckResponse, response_model_exclude_none=True)
 async def check_phrase(request: TextRequest):
     """Проверяет наличие похожей фразы с использованием embeddings"""
     if not request.text:
         raise HTTPException(status_code=400, detail="Текст не может быть пустым")
     
-    start_time = time.time()
-    
-    # Поиск с использованием embeddings
-    exists, similarity, matched_phrase = find_most_similar(
-        request.text.strip(), 
-        request.threshold
+    # Поиск с использованием embeddings (время запроса - в /metrics)
+    (exists, similarity, matched_phrase), verdicts, stages_run = await check_text(
+        request.text.strip(), request.threshold, request.thresholds
     )
     
-    processing_time = time.time() - start_time
-    
     return CheckResponse(
         exists=exists,
         message="есть" if exists else "нет",
         similarity_score=similarity,
-        matched_phrase=matched_phrase
+        matched_phrase=matched_phrase,
+        verdicts=verdicts,
+        stages_run=stages_run
     )
 
 class PhraseRequest(BaseModel):
     phrase: str
     threshold: float = 0.9
+    thresholds: Optional[List[float]] = None  # Дополнительные пороги: вердикт на каждый за один расчет
 
-class AnsweringMachineResponse(BaseModel):
-    is_answering_machine: bool
-    similarity_score: float = 0.0
-    matched_phrase: str = ""
-
-@app.post("/check_phrase", response_model=AnsweringMachineResponse)
+@app.post("/check_phrase", response_model=AnsweringMachineResponse, response_model_exclude_none=True)
 async def check_phrase_for_answering_machine(request: PhraseRequest):
     """Проверяет, является ли фраза автоответчиком"""
     try:
-        if tfidf_vectorizer is None or phrases_tfidf_matrix is None:
+        if current_index() is None:
             raise HTTPException(status_code=500, detail="System not initialized")
         
-        exists, similarity_score, matched_phrase = find_most_similar(request.phrase, request.threshold)
+        (exists, similarity_score, matched_phrase), verdicts, stages_run = await check_text(
+            request.phrase, request.threshold, request.thresholds
+        )
         
         return AnsweringMachineResponse(
             is_answering_machine=exists,
             similarity_score=similarity_score,
-            matched_phrase=matched_phrase
+            matched_phrase=matched_phrase,
+            verdicts=verdicts,
+            stages_run=stages_run
         )
+    except (HTTPException, AdmissionRejected):
+        raise
     except Exception as e:
         logger.error(f"Error checking phrase: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2787,22 +578,95 @@ async def get_similar_phrases(request: TextRequest):
     if not request.text:
         raise HTTPException(status_code=400, detail="Текст не может быть пустым")
     
-    similar_phrases = find_top_similar(request.text.strip(), top_k=5)
+    similar_phrases = await runtime.run_cached(
+        ("similar", 5), request.text, runtime.run_matching, find_top_similar, request.text.strip(), 5
+    )
     
     return SimilarPhrasesResponse(
         similar_phrases=similar_phrases,
         query_text=request.text
     )
 
+class BatchPhraseRequest(BaseModel):
+    items: List[PhraseRequest]
+
+class BatchSimilarRequest(BaseModel):
+    texts: List[str]
+    top_k: int = 5
+
+@app.post("/check_phrase/batch", response_model=BatchPhraseResponse, response_model_exclude_none=True)
+async def check_phrase_batch(request: BatchPhraseRequest):
+    """Проверка пакета фраз с порогами для каждой: общая векторизация, результаты в порядке запроса"""
+    check_batch_size(len(request.items))
+    if current_index() is None:
+        raise HTTPException(status_code=500, detail="System not initialized")
+    
+    items = [item for item in request.items if item.phrase.strip()]
+    keys = [
+        (TextPreprocessor.clean_text(item.phrase), "check", item.threshold, tuple(item.thresholds or ()))
+        for item in items
+    ]
+    
+    def convert(i: int, best: Tuple[float, str, List[str]]):
+        item = items[i]
+        return split_verdicts(
+            apply_thresholds(best[0], best[1], [item.threshold] + list(item.thresholds or [])), item.thresholds, best[2]
+        )
+    
+    computed = iter(await runtime.run_batch(keys, [item.phrase for item in items], find_best_match_batch, convert))
+    results = []
+    for item in request.items:
+        if not item.phrase.strip():
+            results.append(BatchPhraseResult(error="Текст не может быть пустым"))
+            continue
+        value = next(computed)
+        if isinstance(value, Exception):
+            results.append(BatchPhraseResult(error=item_error(value)))
+            continue
+        (exists, similarity_score, matched_phrase), verdicts, stages_run = value
+        results.append(BatchPhraseResult(
+            is_answering_machine=exists,
+            similarity_score=similarity_score,
+            matched_phrase=matched_phrase,
+            verdicts=verdicts,
+            stages_run=stages_run
+        ))
+    return BatchPhraseResponse(results=results)
+
+@app.post("/similar/batch", response_model=BatchSimilarResponse, response_model_exclude_none=True)
+async def get_similar_phrases_batch(request: BatchSimilarRequest):
+    """Топ-K похожих фраз для пакета текстов, результаты в порядке запроса"""
+    check_batch_size(len(request.texts))
+    if current_index() is None:
+        raise HTTPException(status_code=500, detail="System not initialized")
+    
+    texts = [text.strip() for text in request.texts if text.strip()]
+    keys = [(TextPreprocessor.clean_text(text), "similar", request.top_k) for text in texts]
+    
+    find_batch = partial(find_top_similar_batch, top_k=request.top_k)
+    computed = iter(await runtime.run_batch(keys, texts, find_batch, lambda i, similar: similar))
+    results = []
+    for text in request.texts:
+        if not text.strip():
+            results.append(BatchSimilarResult(error="Текст не может быть пустым"))
+            continue
+        value = next(computed)
+        if isinstance(value, Exception):
+            results.append(BatchSimilarResult(error=item_error(value)))
+        else:
+            results.append(BatchSimilarResult(similar_phrases=value))
+    return BatchSimilarResponse(results=results)
+
 @app.get("/health")
 async def health_check():
     """Проверка здоровья сервиса"""
-    return {
-        "status": "healthy",
-        "phrases_loaded": len(phrases_db),
-        "system_ready": tfidf_vectorizer is not None,
-        "tfidf_ready": phrases_tfidf_matrix is not None
-    }
+    index = current_index()
+    return runtime.health(
+        tfidf_ready=index is not None,
+        clusters=index.cluster_index.n_clusters if index is not None and index.cluster_index is not None else 0,
+        rerank=index.rerank_policy.snapshot() if ADAPTIVE_RERANK and index is not None else None
+    )
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # TCP на ML_HOST:ML_PORT и, если задан ML_UDS_PATH, Unix socket для клиентов на этом хосте
+    run_service(app, ML_HOST, ML_PORT, ML_UDS_PATH)
\ No newline at end of file
@@ -0,0 +1,244 @@
+"""Пул для CPU-bound сопоставления фраз вне event loop
+
+Эндпоинты FastAPI объявлены как async def, но сопоставление (transform, косинус,
+SequenceMatcher) занимает процессор. Если выполнять его прямо в event loop,
+один долгий запрос останавливает все остальные, включая /health. Поэтому
+сопоставление отправляется в пул потоков или процессов с ограниченной очередью.
+
+Контроль допуска: клиент может передать срок ответа заголовком X-Deadline-Ms
+(миллисекунды с момента получения запроса). Поздний ответ хуже отсутствия
+ответа (webhook в этом случае продолжает обычную обработку), поэтому:
+- задача, которая по оценке очереди не начнется до срока, отклоняется сразу (504);
+- задача, срок которой истек в очереди, не выполняется (504);
+- ответ, не готовый к сроку, не ждут (504).
+Переполнение очереди - отдельный статус 503.
+"""
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from histogram import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Параметры пула по умолчанию (переопределяются переменными окружения)
+MATCH_EXECUTOR = os.getenv("MATCH_EXECUTOR", "thread")  # thread | process
+MATCH_WORKERS = int(os.getenv("MATCH_WORKERS", str(os.cpu_count() or 1)))
+MATCH_QUEUE_LIMIT = int(os.getenv("MATCH_QUEUE_LIMIT", "64"))  # задач в ожидании сверх числа воркеров
+
+DEADLINE_HEADER = b"x-deadline-ms"
+RUN_TIME_SMOOTHING = 0.2  # вес новой задачи в скользящем среднем времени выполнения
+
+# Срок ответа текущего запроса (time.time()), None - без срока
+request_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("request_deadline", default=None)
+
+
+class AdmissionRejected(Exception):
+    """Задача не принята или не выполнена; status_code - HTTP статус ответа"""
+    status_code = 503
+
+
+class PoolOverloaded(AdmissionRejected):
+    """Очередь пула заполнена, задача не принята"""
+    status_code = 503
+
+
+class DeadlineExceeded(AdmissionRejected):
+    """Ответ не может быть готов к сроку клиента"""
+    status_code = 504
+
+
+class DeadlineMiddleware:
+    """ASGI middleware: срок ответа из заголовка X-Deadline-Ms в request_deadline"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == DEADLINE_HEADER:
+                    try:
+                        deadline = time.time() + float(value) / 1000.0
+                    except ValueError:
+                        break
+                    token = request_deadline.set(deadline)
+                    try:
+                        return await self.app(scope, receive, send)
+                    finally:
+                        request_deadline.reset(token)
+        await self.app(scope, receive, send)
+
+
+async def wait_for_deadline(awaitable: Awaitable) -> Any:
+    """Ожидание результата не дольше срока ответа текущего запроса"""
+    deadline = request_deadline.get()
+    if deadline is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, max(0.0, deadline - time.time()))
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded("Срок ответа истек") from None
+
+
+def _timed_call(submitted_at: float, deadline: Optional[float], func: Callable, args: tuple, kwargs: dict):
+    """Выполняет задачу в воркере и возвращает результат с временем ожидания и выполнения"""
+    started_at = time.time()
+    if deadline is not None and started_at > deadline:
+        raise DeadlineExceeded("Срок ответа истек в очереди")
+    result = func(*args, **kwargs)
+    return result, started_at - submitted_at, time.time() - started_at
+
+
+class MatchPool:
+    """Пул потоков или процессов с ограниченной очередью, контролем сроков и метриками"""
+
+    def __init__(self, name: str = "match", kind: str = MATCH_EXECUTOR, workers: int = MATCH_WORKERS,
+                 max_queue: int = MATCH_QUEUE_LIMIT):
+        self.name = name
+        self.kind = kind
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.executor: Executor = self._create_executor()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.run_time_ewma = 0.0
+        self.queue_wait_ms = Histogram([1, 2, 5, 10, 20, 50, 100, 200, 500, 1000])
+        self.stats_data: Dict[str, float] = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "shed_deadline": 0,
+            "expired_in_queue": 0,
+            "deadline_exceeded": 0,
+            "max_pending": 0,
+            "queue_wait_total": 0.0,
+            "run_time_total": 0.0,
+            "queue_wait_max": 0.0,
+        }
+        logger.info(f"Пул {name}: {kind}, воркеров {self.workers}, очередь {self.max_queue}")
+
+    def _create_executor(self) -> Executor:
+        if self.kind == "process":
+            # Воркеры создаются fork'ом после построения индекса и наследуют его
+            return ProcessPoolExecutor(max_workers=self.workers)
+        if self.kind != "thread":
+            raise ValueError(f"Неизвестный тип пула: {self.kind}")
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=self.name)
+
+    @property
+    def pending(self) -> int:
+        """Задачи в работе и в очереди"""
+        return self._pending
+
+    def expected_wait(self) -> float:
+        """Оценка ожидания в очереди для новой задачи, секунд"""
+        queued_ahead = max(0, self._pending - self.workers)
+        return queued_ahead / self.workers * self.run_time_ewma
+
+    def try_acquire(self) -> bool:
+        """Занимает место в пуле, если очередь не заполнена"""
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self.stats_data["rejected"] += 1
+                return False
+            self._pending += 1
+            self.stats_data["submitted"] += 1
+            self.stats_data["max_pending"] = max(self.stats_data["max_pending"], self._pending)
+            return True
+
+    def release(self, outcome: str, queue_wait: float = 0.0, run_time: float = 0.0):
+        """Освобождает место в пуле и учитывает исход и время задачи"""
+        with self._lock:
+            self._pending -= 1
+            stats = self.stats_data
+            stats[outcome] += 1
+            if outcome != "completed":
+                return
+            stats["queue_wait_total"] += queue_wait
+            stats["run_time_total"] += run_time
+            stats["queue_wait_max"] = max(stats["queue_wait_max"], queue_wait)
+            self.queue_wait_ms.observe(queue_wait * 1000.0)
+            if self.run_time_ewma:
+                self.run_time_ewma += RUN_TIME_SMOOTHING * (run_time - self.run_time_ewma)
+            else:
+                self.run_time_ewma = run_time
+
+    def _finished(self, future: asyncio.Future):
+        """Место в пуле освобождается, когда воркер закончил, даже если ответ уже не ждут"""
+        if future.cancelled():
+            self.release("failed")
+            return
+        error = future.exception()
+        if error is None:
+            _, queue_wait, run_time = future.result()
+            self.release("completed", queue_wait, run_time)
+        elif isinstance(error, DeadlineExceeded):
+            self.release("expired_in_queue")
+        else:
+            self.release("failed")
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Выполняет func(*args, **kwargs) в пуле с учетом срока ответа текущего запроса"""
+        if not self.try_acquire():
+            raise PoolOverloaded(f"Очередь пула {self.name} заполнена ({self.pending})")
+
+        deadline = request_deadline.get()
+        if deadline is not None and time.time() + self.expected_wait() > deadline:
+            pending = self.pending
+            self.release("shed_deadline")
+            raise DeadlineExceeded(f"Задача не начнется до срока ответа (в пуле {pending})")
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, _timed_call, time.time(), deadline, func, args, kwargs)
+        future.add_done_callback(self._finished)
+        if deadline is None:
+            # shield: отмена запроса (клиент отключился) не освобождает место, пока воркер считает
+            result, _, _ = await asyncio.shield(future)
+            return result
+        try:
+            result, _, _ = await asyncio.wait_for(asyncio.shield(future), max(0.0, deadline - time.time()))
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.stats_data["deadline_exceeded"] += 1
+            raise DeadlineExceeded("Срок ответа истек во время сопоставления") from None
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Метрики пула для /health"""
+        with self._lock:
+            stats = dict(self.stats_data)
+            pending = self._pending
+            queue_wait_ms = self.queue_wait_ms.snapshot()
+        finished = stats["completed"] or 1
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "queue_limit": self.max_queue,
+            "pending": pending,
+            "queued": max(0, pending - self.workers),
+            **stats,
+            "queue_wait_avg": stats["queue_wait_total"] / finished,
+            "run_time_avg": stats["run_time_total"] / finished,
+            "run_time_ewma": self.run_time_ewma,
+            "expected_wait": self.expected_wait(),
+            "queue_wait_ms": queue_wait_ms,
+        }
+
+    def recycle(self):
+        """Новые воркеры-процессы после замены индекса; начатые задачи досчитываются в прежних"""
+        if self.kind != "process":
+            return
+        previous, self.executor = self.executor, self._create_executor()
+        previous.shutdown(wait=False)
+        logger.info(f"Пул {self.name}: воркеры пересозданы для новой версии индекса")
+
+    def shutdown(self):
+        """Остановка пула"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
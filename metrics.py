@@ -0,0 +1,178 @@
+"""Метрики сервиса в текстовом формате Prometheus (/metrics)
+
+Запись на горячем пути без блокировок: счетчик - инкремент в словаре,
+гистограмма - инкремент интервала (histogram.py). Гонка двух потоков пула
+за один интервал может потерять отсчет, для метрик это допустимо и дешевле
+блокировки на каждый запрос. Состояние кэша, пула, микропакетов и индекса
+снимается только при запросе /metrics из их stats().
+
+Этапы сопоставления замеряются цепочкой time.perf_counter():
+
+    started = time.perf_counter()
+    cleaned = clean(text)
+    started = service_metrics.stage("normalize", started)
+    matrix = vectorize(cleaned)
+    started = service_metrics.stage("vectorize", started)
+
+В пакетном расчете общие этапы (normalize, vectorize, retrieve) замеряются
+один раз на пакет. При MATCH_EXECUTOR=process этапы считаются в процессах
+пула и в /metrics не попадают.
+"""
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from histogram import Histogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = "phrase"
+
+REQUEST_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+STAGE_BUCKETS_MS = [0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 500]
+CANDIDATE_BUCKETS = [0, 1, 2, 5, 10, 20, 30, 50, 100, 200]
+SCORE_BUCKETS = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0]
+
+# Этапы сопоставления (метка stage)
+STAGES = ["normalize", "exact", "vectorize", "retrieve", "rerank", "scan"]
+
+
+class ServiceMetrics:
+    """Счетчики и гистограммы запросов и этапов сопоставления"""
+
+    def __init__(self):
+        self.requests: Dict[Tuple[str, str, int], int] = defaultdict(int)  # (метод, путь, статус) -> число
+        self.request_ms: Dict[str, Histogram] = {}
+        # Гистограммы этапов создаются заранее: потоки пула только читают словарь
+        self.stage_ms: Dict[str, Histogram] = {name: Histogram(STAGE_BUCKETS_MS) for name in STAGES}
+        self.candidates = Histogram(CANDIDATE_BUCKETS)  # кандидатов уточнено комбинированным сходством
+        self.scores = Histogram(SCORE_BUCKETS)  # сходство лучшего совпадения
+        self.counters: Dict[str, int] = defaultdict(int)
+
+    def observe_request(self, method: str, path: str, status: int, elapsed: float):
+        """Запрос к эндпоинту (вызывается из event loop)"""
+        self.requests[(method, path, status)] += 1
+        histogram = self.request_ms.get(path)
+        if histogram is None:
+            histogram = self.request_ms[path] = Histogram(REQUEST_BUCKETS_MS)
+        histogram.observe(elapsed * 1000.0)
+
+    def stage(self, name: str, started: float) -> float:
+        """Время этапа от started; возвращает текущий perf_counter для следующего этапа"""
+        now = time.perf_counter()
+        self.stage_ms[name].observe((now - started) * 1000.0)
+        return now
+
+    def count(self, name: str, value: int = 1):
+        self.counters[name] += value
+
+    def render(self, gauges: Optional[Dict[str, float]] = None,
+               histograms: Optional[Dict[str, Histogram]] = None) -> str:
+        """Текст для Prometheus: собственные метрики и переданные показатели компонентов"""
+        lines: List[str] = []
+        lines.append(f"# TYPE {PREFIX}_http_requests_total counter")
+        for (method, path, status), value in sorted(self.requests.items()):
+            lines.append(
+                f'{PREFIX}_http_requests_total{{method="{escape(method)}",path="{escape(path)}",status="{status}"}} {value}'
+            )
+        render_histogram_family(lines, f"{PREFIX}_http_request_duration_ms", "path", self.request_ms)
+        render_histogram_family(lines, f"{PREFIX}_stage_duration_ms", "stage", self.stage_ms)
+        render_histogram(lines, f"{PREFIX}_rerank_candidates", self.candidates)
+        render_histogram(lines, f"{PREFIX}_match_score", self.scores)
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"# TYPE {PREFIX}_{name}_total counter")
+            lines.append(f"{PREFIX}_{name}_total {value}")
+        for name, histogram in sorted((histograms or {}).items()):
+            render_histogram(lines, f"{PREFIX}_{name}", histogram)
+        for name, value in sorted((gauges or {}).items()):
+            lines.append(f"# TYPE {PREFIX}_{name} gauge")
+            lines.append(f"{PREFIX}_{name} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(int(value))
+
+
+def histogram_lines(name: str, histogram: Histogram, labels: str = "") -> Iterable[str]:
+    """_bucket (накопленные, le), _sum и _count одной гистограммы"""
+    counts = list(histogram.counts)
+    separator = "," if labels else ""
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, counts):
+        cumulative += count
+        yield f'{name}_bucket{{{labels}{separator}le="{bound:g}"}} {cumulative}'
+    cumulative += counts[-1]
+    yield f'{name}_bucket{{{labels}{separator}le="+Inf"}} {cumulative}'
+    suffix = f"{{{labels}}}" if labels else ""
+    yield f"{name}_sum{suffix} {format_value(histogram.total)}"
+    yield f"{name}_count{suffix} {cumulative}"
+
+
+def render_histogram(lines: List[str], name: str, histogram: Histogram):
+    lines.append(f"# TYPE {name} histogram")
+    lines.extend(histogram_lines(name, histogram))
+
+
+def render_histogram_family(lines: List[str], name: str, label: str, histograms: Dict[str, Histogram]):
+    lines.append(f"# TYPE {name} histogram")
+    for value, histogram in sorted(histograms.items()):
+        lines.extend(histogram_lines(name, histogram, f'{label}="{escape(value)}"'))
+
+
+def stats_gauges(prefix: str, stats: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """Числовые поля stats() компонента как показатели prefix_поле (вложенные словари пропускаются)"""
+    if stats is None:
+        return {}
+    return {
+        f"{prefix}_{name}": value
+        for name, value in stats.items()
+        if isinstance(value, (int, float))
+    }
+
+
+def component_metrics(match_pool, result_cache, in_flight, match_batcher) -> Tuple[Dict[str, float], Dict[str, Histogram]]:
+    """Показатели и гистограммы пула, кэша результатов, объединения запросов и микропакетов"""
+    gauges: Dict[str, float] = {}
+    histograms: Dict[str, Histogram] = {}
+    gauges.update(stats_gauges("result_cache", result_cache.stats()))
+    gauges.update(stats_gauges("single_flight", in_flight.stats()))
+    if match_pool is not None:
+        gauges.update(stats_gauges("match_pool", match_pool.stats()))
+        histograms["match_pool_queue_wait_ms"] = match_pool.queue_wait_ms
+    if match_batcher is not None:
+        gauges.update(stats_gauges("micro_batch", match_batcher.stats()))
+        histograms["micro_batch_size"] = match_batcher.batch_sizes
+        histograms["micro_batch_queue_wait_ms"] = match_batcher.queue_wait_ms
+    return gauges, histograms
+
+
+class MetricsMiddleware:
+    """ASGI middleware: число и время HTTP запросов по шаблону пути эндпоинта"""
+
+    def __init__(self, app, metrics: ServiceMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_status)
+        finally:
+            # Шаблон пути (route) вместо самого пути: число рядов метрики не зависит от запросов
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            self.metrics.observe_request(scope["method"], path, status, time.perf_counter() - started)
@@ -0,0 +1,116 @@
+"""Планировщик микропакетов: одновременные запросы считаются одной матричной операцией
+
+Запросы, пришедшие в пределах окна (несколько миллисекунд) или до заполнения
+пакета, векторизуются одним transform и сравниваются с базой одним произведением
+матриц; каждый вызывающий получает свой результат через future.
+
+Окно ждут, только пока предыдущий пакет еще считается: одиночный запрос при
+простое (один звонок - один webhook) отправляется сразу, без задержки окна.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from histogram import Histogram
+from match_pool import request_deadline, wait_for_deadline
+
+logger = logging.getLogger(__name__)
+
+MICRO_BATCH = os.getenv("MICRO_BATCH", "1") == "1"
+MICRO_BATCH_WINDOW_MS = float(os.getenv("MICRO_BATCH_WINDOW_MS", "2"))  # окно сбора пакета
+MICRO_BATCH_MAX = int(os.getenv("MICRO_BATCH_MAX", "32"))  # пакет отправляется сразу при заполнении
+
+
+def _retrieve_exception(future: asyncio.Future):
+    """Ошибка элемента, чей вызывающий уже не ждет (истек срок), не попадает в лог asyncio"""
+    if not future.cancelled():
+        future.exception()
+
+
+class MicroBatcher:
+    """Собирает элементы в пакеты и передает их обработчику пакета"""
+
+    def __init__(self, handler: Callable[[List[Any]], Awaitable[List[Any]]], window_ms: float = MICRO_BATCH_WINDOW_MS,
+                 max_batch: int = MICRO_BATCH_MAX, name: str = "match"):
+        self.handler = handler
+        self.window = max(0.0, window_ms) / 1000.0
+        self.max_batch = max(1, max_batch)
+        self.name = name
+        self._pending: List[Tuple[Any, asyncio.Future, float, Optional[float]]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running = set()
+        self.batch_sizes = Histogram([1, 2, 4, 8, 16, 32, 64, 128])
+        self.queue_wait_ms = Histogram([0.5, 1, 2, 5, 10, 20, 50, 100, 500])
+        self.immediate = 0  # пакетов, отправленных без ожидания окна (нет расчета в работе)
+        logger.info(f"Микропакеты {name}: окно {window_ms:g} мс, до {self.max_batch} запросов")
+
+    async def submit(self, item: Any) -> Any:
+        """Результат обработки элемента в составе пакета"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        future.add_done_callback(_retrieve_exception)
+        self._pending.append((item, future, time.monotonic(), request_deadline.get()))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif not self._running:
+            # Пакетов в работе нет: ждать соседей незачем, следующие запросы соберутся за время расчета
+            self.immediate += 1
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        # Каждый вызывающий ждет не дольше своего срока, пакет при этом не отменяется
+        return await wait_for_deadline(asyncio.shield(future))
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future, float, Optional[float]]]):
+        now = time.monotonic()
+        self.batch_sizes.observe(len(batch))
+        for _, _, enqueued_at, _ in batch:
+            self.queue_wait_ms.observe((now - enqueued_at) * 1000.0)
+
+        # Срок пакета - самый поздний срок его элементов; без срока, если он не задан хотя бы у одного
+        deadlines = [deadline for _, _, _, deadline in batch]
+        request_deadline.set(None if None in deadlines else max(deadlines))
+        try:
+            results = await self.handler([item for item, _, _, _ in batch])
+        except asyncio.CancelledError:
+            for _, future, _, _ in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future, _, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Обработчик возвращает результат или исключение для каждого элемента
+        for (_, future, _, _), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Гистограммы размера пакета и ожидания в очереди для /health"""
+        return {
+            "window_ms": self.window * 1000.0,
+            "max_batch": self.max_batch,
+            "pending": len(self._pending),
+            "immediate": self.immediate,
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_wait_ms": self.queue_wait_ms.snapshot(),
+        }
@@ -0,0 +1,193 @@
+"""Морфологическая нормализация русских слов: таблица слово -> основа
+
+Русские словоформы ("мхатовскую"/"мхатовская", "паузу"/"пауза") дробят словарь
+TF-IDF и портят метрики на множествах слов. Слова приводятся к основе стеммером
+Snowball для русского языка. Для слов базы фраз таблица строится заранее
+(при построении индекса или из файла), для слов запросов результат мемоизируется.
+
+Таблицу можно подготовить заранее, в том числе внешним лемматизатором:
+    python morphology.py --source main_embeddings --output lemma_table.json
+и подключить переменной окружения LEMMA_TABLE_PATH.
+"""
+import argparse
+import importlib
+import json
+import logging
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+VOWELS = set("аеиоуыэюя")
+
+
+def _by_length(*endings: str) -> tuple:
+    """Окончания от длинных к коротким: выбирается самое длинное подходящее"""
+    return tuple(sorted(endings, key=len, reverse=True))
+
+
+PERFECTIVE_GERUND_1 = _by_length("вшись", "вши", "в")
+PERFECTIVE_GERUND_2 = _by_length("ившись", "ывшись", "ивши", "ывши", "ив", "ыв")
+ADJECTIVE = _by_length(
+    "ими", "ыми", "его", "ого", "ему", "ому",
+    "ее", "ие", "ые", "ое", "ей", "ий", "ый", "ой", "ем", "им", "ым", "ом",
+    "их", "ых", "ую", "юю", "ая", "яя", "ою", "ею"
+)
+PARTICIPLE_1 = _by_length("ем", "нн", "вш", "ющ", "щ")
+PARTICIPLE_2 = _by_length("ивш", "ывш", "ующ")
+REFLEXIVE = _by_length("ся", "сь")
+VERB_1 = _by_length("ете", "йте", "ешь", "нно", "ла", "на", "ли", "ем", "ло", "но", "ет", "ют", "ны", "ть", "й", "л", "н")
+VERB_2 = _by_length(
+    "ейте", "уйте", "ила", "ыла", "ена", "ите", "или", "ыли", "ило", "ыло", "ено",
+    "ует", "уют", "ены", "ить", "ыть", "ишь", "ей", "уй", "ил", "ыл", "им", "ым",
+    "ен", "ят", "ит", "ыт", "ую", "ю"
+)
+NOUN = _by_length(
+    "иями", "ями", "ами", "ией", "иям", "ием", "иях",
+    "ев", "ов", "ие", "ье", "еи", "ии", "ей", "ой", "ий", "ям", "ем", "ам", "ом", "ах", "ях", "ию", "ью", "ия", "ья",
+    "а", "е", "и", "й", "о", "у", "ы", "ь", "ю", "я"
+)
+SUPERLATIVE = _by_length("ейше", "ейш")
+DERIVATIONAL = _by_length("ость", "ост")
+
+
+class RussianStemmer:
+    """Стеммер Snowball (Портера) для русского языка"""
+
+    @staticmethod
+    def _regions(word: str):
+        """Границы областей RV и R2"""
+        rv = len(word)
+        for i, char in enumerate(word):
+            if char in VOWELS:
+                rv = i + 1
+                break
+        r1 = len(word)
+        for i in range(1, len(word)):
+            if word[i] not in VOWELS and word[i - 1] in VOWELS:
+                r1 = i + 1
+                break
+        r2 = len(word)
+        for i in range(r1 + 1, len(word)):
+            if word[i] not in VOWELS and word[i - 1] in VOWELS:
+                r2 = i + 1
+                break
+        return rv, r2
+
+    @staticmethod
+    def _strip(word: str, start: int, endings, preceded_by: str = "") -> Optional[str]:
+        """Удаляет первое подходящее окончание в области, начинающейся с start"""
+        region = word[start:]
+        for ending in endings:
+            if region.endswith(ending):
+                if preceded_by:
+                    rest = region[:-len(ending)]
+                    if not rest or rest[-1] not in preceded_by:
+                        continue
+                return word[:-len(ending)]
+        return None
+
+    @staticmethod
+    def stem(word: str) -> str:
+        """Основа слова"""
+        word = word.replace("ё", "е")
+        if not word or not any(char in VOWELS for char in word):
+            return word
+        rv, r2 = RussianStemmer._regions(word)
+        strip = RussianStemmer._strip
+
+        # Шаг 1: деепричастие, иначе возвратность + прилагательное/глагол/существительное
+        result = strip(word, rv, PERFECTIVE_GERUND_1, "ая") or strip(word, rv, PERFECTIVE_GERUND_2)
+        if result is not None:
+            word = result
+        else:
+            word = strip(word, rv, REFLEXIVE) or word
+            result = strip(word, rv, ADJECTIVE)
+            if result is not None:
+                word = strip(result, rv, PARTICIPLE_1, "ая") or strip(result, rv, PARTICIPLE_2) or result
+            else:
+                result = strip(word, rv, VERB_1, "ая") or strip(word, rv, VERB_2)
+                if result is None:
+                    result = strip(word, rv, NOUN)
+                if result is not None:
+                    word = result
+
+        # Шаг 2: конечное "и"
+        if word[rv:].endswith("и"):
+            word = word[:-1]
+
+        # Шаг 3: словообразовательный суффикс в R2
+        word = strip(word, r2, DERIVATIONAL) or word
+
+        # Шаг 4: превосходная степень, двойное "н", мягкий знак
+        if word[rv:].endswith("нн"):
+            word = word[:-1]
+        else:
+            result = strip(word, rv, SUPERLATIVE)
+            if result is not None:
+                word = result[:-1] if result[rv:].endswith("нн") else result
+            elif word[rv:].endswith("ь"):
+                word = word[:-1]
+        return word
+
+
+class Lemmatizer:
+    """Нормализация слов по заранее построенной таблице с мемоизацией для новых слов"""
+
+    def __init__(self, table: Optional[Dict[str, str]] = None):
+        self.table: Dict[str, str] = dict(table or {})
+        self._cached_stem = lru_cache(maxsize=100000)(RussianStemmer.stem)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Lemmatizer":
+        """Загрузка таблицы слово -> лемма из JSON файла"""
+        with open(path, "r", encoding="utf-8") as f:
+            table = json.load(f)
+        logger.info(f"Загружена таблица лемм: {len(table)} слов из {path}")
+        return cls(table)
+
+    def bake(self, words: Iterable[str]) -> int:
+        """Добавляет в таблицу основы всех слов (например, словаря базы фраз)"""
+        added = 0
+        for word in words:
+            if word not in self.table:
+                self.table[word] = RussianStemmer.stem(word)
+                added += 1
+        return added
+
+    def lemma(self, word: str) -> str:
+        """Лемма (основа) одного слова"""
+        lemma = self.table.get(word)
+        if lemma is None:
+            lemma = self._cached_stem(word)
+        return lemma
+
+    def lemmatize_words(self, words: List[str]) -> List[str]:
+        """Леммы списка слов"""
+        return [self.lemma(word) for word in words]
+
+    def save(self, path: str):
+        """Сохранение таблицы в JSON файл"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.table, f, ensure_ascii=False, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Построение таблицы слово -> лемма для базы фраз")
+    parser.add_argument("--source", default="main_embeddings", help="модуль сервиса с базой фраз")
+    parser.add_argument("--output", default="lemma_table.json", help="файл таблицы")
+    args = parser.parse_args()
+
+    service = importlib.import_module(args.source)
+    words = set()
+    for phrase in service.phrases_db:
+        words.update(service.TextPreprocessor.clean_text(phrase).split())
+
+    lemmatizer = Lemmatizer()
+    lemmatizer.bake(sorted(words))
+    lemmatizer.save(args.output)
+    print(f"Слов: {len(words)}, различных лемм: {len(set(lemmatizer.table.values()))} -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
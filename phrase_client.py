@@ -0,0 +1,210 @@
+"""Клиент сервиса проверки фраз: пул соединений, пакеты, ограничение параллельности, повторы
+
+Синхронный PhraseClient и асинхронный AsyncPhraseClient держат соединения
+открытыми (keep-alive), отправляют списки фраз пакетами через /check_phrase/batch
+не более чем concurrency запросами одновременно и повторяют запросы при сетевых
+ошибках и перегрузке сервиса (503) с экспоненциальной паузой.
+
+    with PhraseClient() as client:
+        client.check("алло кто это")
+        client.check_many(phrases, threshold=0.9, thresholds=[0.7, 0.8])
+
+    async with AsyncPhraseClient() as client:
+        await client.check_many(phrases)
+
+Адрес сервиса - ML_SERVICE_URL; если задан ML_UDS_PATH, запросы идут через
+Unix domain socket (сервис на том же хосте).
+"""
+import asyncio
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+ML_SERVICE_URL = os.getenv("ML_SERVICE_URL", "http://localhost:8001")
+ML_UDS_PATH = os.getenv("ML_UDS_PATH", "")
+CLIENT_TIMEOUT = float(os.getenv("CLIENT_TIMEOUT", "10"))  # секунд на запрос
+CLIENT_RETRIES = int(os.getenv("CLIENT_RETRIES", "3"))  # повторов после первой попытки
+CLIENT_BACKOFF = float(os.getenv("CLIENT_BACKOFF", "0.1"))  # пауза перед первым повтором, удваивается
+CLIENT_BATCH_SIZE = int(os.getenv("CLIENT_BATCH_SIZE", "256"))  # фраз в одном запросе /check_phrase/batch
+CLIENT_CONCURRENCY = int(os.getenv("CLIENT_CONCURRENCY", "8"))  # одновременных запросов
+
+# 503 - очередь пула сервиса заполнена, повтор через паузу уместен.
+# 504 (срок ответа истек) не повторяется: срок уже прошел.
+RETRY_STATUSES = {502, 503}
+
+
+class PhraseServiceError(Exception):
+    """Сервис вернул ошибку или недоступен после всех повторов"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def check_body(phrase: str, threshold: Optional[float], thresholds: Optional[Sequence[float]]) -> Dict[str, Any]:
+    """Тело /check_phrase (и элемент /check_phrase/batch)"""
+    body: Dict[str, Any] = {"phrase": phrase}
+    if threshold is not None:
+        body["threshold"] = threshold
+    if thresholds:
+        body["thresholds"] = list(thresholds)
+    return body
+
+
+def chunked(items: Sequence[Any], size: int) -> List[Sequence[Any]]:
+    return [items[start:start + size] for start in range(0, len(items), max(1, size))]
+
+
+def transport_options(url: str, uds: str, concurrency: int) -> Dict[str, Any]:
+    """base_url и параметры транспорта httpx: Unix socket или TCP"""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if uds:
+        return {"base_url": "http://localhost", "uds": uds, "limits": limits}
+    # httpx пишет заголовки и тело разными вызовами: без TCP_NODELAY тело ждет ACK
+    return {"base_url": url, "limits": limits, "socket_options": [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]}
+
+
+def parse_response(response: httpx.Response) -> Any:
+    if response.status_code >= 400:
+        try:
+            detail = response.json().get("detail", response.text)
+        except ValueError:
+            detail = response.text
+        raise PhraseServiceError(f"{response.status_code}: {detail}", response.status_code)
+    return response.json()
+
+
+class PhraseClient:
+    """Синхронный клиент: пул соединений, пакеты в несколько потоков, повторы"""
+
+    def __init__(self, url: str = ML_SERVICE_URL, uds: str = ML_UDS_PATH, timeout: float = CLIENT_TIMEOUT,
+                 retries: int = CLIENT_RETRIES, backoff: float = CLIENT_BACKOFF,
+                 batch_size: int = CLIENT_BATCH_SIZE, concurrency: int = CLIENT_CONCURRENCY):
+        options = transport_options(url, uds, max(1, concurrency))
+        base_url = options.pop("base_url")
+        self.http = httpx.Client(base_url=base_url, transport=httpx.HTTPTransport(**options), timeout=timeout)
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def post(self, path: str, body: Dict[str, Any]) -> Any:
+        """POST с повторами при сетевых ошибках и 502/503"""
+        delay = self.backoff
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            try:
+                response = self.http.post(path, json=body)
+            except httpx.TransportError as e:
+                if last:
+                    raise PhraseServiceError(f"Сервис недоступен: {e}") from e
+            else:
+                if response.status_code not in RETRY_STATUSES or last:
+                    return parse_response(response)
+            time.sleep(delay)
+            delay *= 2
+
+    def check(self, phrase: str, threshold: Optional[float] = None,
+              thresholds: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+        """Проверка одной фразы (/check_phrase)"""
+        return self.post("/check_phrase", check_body(phrase, threshold, thresholds))
+
+    def check_many(self, phrases: Sequence[str], threshold: Optional[float] = None,
+                   thresholds: Optional[Sequence[float]] = None) -> List[Dict[str, Any]]:
+        """Проверка списка фраз пакетами; результаты в порядке phrases, ошибка фразы - в поле error"""
+        chunks = chunked(list(phrases), self.batch_size)
+        if len(chunks) <= 1:
+            return [result for chunk in chunks for result in self._check_chunk(chunk, threshold, thresholds)]
+        results = self._pool().map(lambda chunk: self._check_chunk(chunk, threshold, thresholds), chunks)
+        return [result for chunk_results in results for result in chunk_results]
+
+    def _check_chunk(self, phrases: Sequence[str], threshold: Optional[float],
+                     thresholds: Optional[Sequence[float]]) -> List[Dict[str, Any]]:
+        body = {"items": [check_body(phrase, threshold, thresholds) for phrase in phrases]}
+        return self.post("/check_phrase/batch", body)["results"]
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="phrase-client")
+            return self._executor
+
+    def health(self) -> Dict[str, Any]:
+        return parse_response(self.http.get("/health"))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self.http.close()
+
+    def __enter__(self) -> "PhraseClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncPhraseClient:
+    """Асинхронный клиент: пул соединений, пакеты с ограничением параллельности, повторы"""
+
+    def __init__(self, url: str = ML_SERVICE_URL, uds: str = ML_UDS_PATH, timeout: float = CLIENT_TIMEOUT,
+                 retries: int = CLIENT_RETRIES, backoff: float = CLIENT_BACKOFF,
+                 batch_size: int = CLIENT_BATCH_SIZE, concurrency: int = CLIENT_CONCURRENCY):
+        options = transport_options(url, uds, max(1, concurrency))
+        base_url = options.pop("base_url")
+        self.http = httpx.AsyncClient(base_url=base_url, transport=httpx.AsyncHTTPTransport(**options), timeout=timeout)
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.batch_size = max(1, batch_size)
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def post(self, path: str, body: Dict[str, Any]) -> Any:
+        """POST с повторами при сетевых ошибках и 502/503; не больше concurrency запросов одновременно"""
+        delay = self.backoff
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            try:
+                async with self.semaphore:
+                    response = await self.http.post(path, json=body)
+            except httpx.TransportError as e:
+                if last:
+                    raise PhraseServiceError(f"Сервис недоступен: {e}") from e
+            else:
+                if response.status_code not in RETRY_STATUSES or last:
+                    return parse_response(response)
+            await asyncio.sleep(delay)
+            delay *= 2
+
+    async def check(self, phrase: str, threshold: Optional[float] = None,
+                    thresholds: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+        """Проверка одной фразы (/check_phrase)"""
+        return await self.post("/check_phrase", check_body(phrase, threshold, thresholds))
+
+    async def check_many(self, phrases: Sequence[str], threshold: Optional[float] = None,
+                         thresholds: Optional[Sequence[float]] = None) -> List[Dict[str, Any]]:
+        """Проверка списка фраз пакетами; результаты в порядке phrases, ошибка фразы - в поле error"""
+        chunks = chunked(list(phrases), self.batch_size)
+        results = await asyncio.gather(*[
+            self.post("/check_phrase/batch", {"items": [check_body(phrase, threshold, thresholds) for phrase in chunk]})
+            for chunk in chunks
+        ])
+        return [result for chunk_results in results for result in chunk_results["results"]]
+
+    async def health(self) -> Dict[str, Any]:
+        return parse_response(await self.http.get("/health"))
+
+    async def close(self):
+        await self.http.aclose()
+
+    async def __aenter__(self) -> "AsyncPhraseClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -0,0 +1,37 @@
+"""База фраз автоответчиков для сервисов и утилит
+
+Источник - двоичное хранилище data/phrases.bin (corpus_store.py), общее для
+main_embeddings.py, main_alternative.py и утилит. PHRASES_PATH может указывать
+и на текстовый файл (одна фраза на строку) - удобно для экспериментов с базой.
+
+    PHRASES_PATH=/srv/phrases.bin python main_embeddings.py
+"""
+import os
+from typing import Dict, List, Set
+
+from corpus_store import CorpusStore, DEFAULT_STORE_PATH
+
+PHRASES_PATH = os.getenv("PHRASES_PATH", DEFAULT_STORE_PATH)
+
+# Метаданные загруженной базы (для /health)
+corpus_info: Dict[str, object] = {}
+
+
+def read_phrases(path: str = PHRASES_PATH) -> List[str]:
+    """Фразы базы: из хранилища - в порядке сортировки, из текстового файла - в порядке строк"""
+    if path.endswith(".txt"):
+        with open(path, "r", encoding="utf-8") as f:
+            phrases = [line.strip() for line in f if line.strip()]
+        info = {"path": path, "phrases": len(phrases)}
+    else:
+        with CorpusStore(path) as store:
+            info = store.info()
+            phrases = store.phrases()
+    corpus_info.clear()
+    corpus_info.update(info)
+    return phrases
+
+
+def load_phrases(path: str = PHRASES_PATH) -> Set[str]:
+    """Набор фраз базы"""
+    return set(read_phrases(path))
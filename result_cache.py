@@ -0,0 +1,101 @@
+"""Кэш результатов сопоставления для повторяющихся реплик
+
+Короткие реплики ("алло", "да", "слушаю") и одни и те же приветствия IVR
+повторяются в тысячах звонков. Результат зависит только от нормализованного
+текста, режима (порогов, top_k) и версии индекса, поэтому его можно переиспользовать.
+
+Кэш ограничен по размеру (LRU) и времени жизни записи (TTL) и привязан к версии
+индекса: при смене версии записи сбрасываются, а результат, посчитанный на
+старом индексе, не сохраняется.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "10000"))  # 0 - кэш выключен
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "300"))  # секунд
+
+
+class ResultCache:
+    """Потокобезопасный LRU кэш с TTL и версией индекса"""
+
+    def __init__(self, max_size: int = RESULT_CACHE_SIZE, ttl: float = RESULT_CACHE_TTL):
+        self.max_size = max(0, max_size)
+        self.ttl = ttl
+        self.version: Optional[str] = None
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expired": 0,
+            "invalidations": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def bind(self, version: str):
+        """Привязка к версии индекса; при смене версии кэш очищается"""
+        with self._lock:
+            if version != self.version:
+                if self._entries:
+                    self.counters["invalidations"] += 1
+                self._entries.clear()
+                self.version = version
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """(найдено, значение) для ключа"""
+        if not self.enabled:
+            return False, None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.counters["misses"] += 1
+                return False, None
+            expires_at, value = entry
+            if expires_at < now:
+                del self._entries[key]
+                self.counters["expired"] += 1
+                self.counters["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return True, value
+
+    def put(self, key: Hashable, value: Any, version: Optional[str]):
+        """Сохранение результата, посчитанного на индексе версии version"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if version != self.version:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.counters["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Счетчики кэша для /health"""
+        with self._lock:
+            counters = dict(self.counters)
+            size = len(self._entries)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "enabled": self.enabled,
+            "size": size,
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            **counters,
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,213 @@
+"""Prefork запуск ML сервиса: индекс строится один раз и разделяется воркерами
+
+Родительский процесс импортирует сервис, строит индекс (initialize_system),
+замораживает объекты кучи (gc.freeze, чтобы сборщик мусора не трогал счетчики
+и заголовки объектов индекса и не копировал общие страницы), открывает сокет и
+fork'ом запускает N воркеров uvicorn. Воркеры разделяют индекс copy-on-write,
+lifespan в них повторно индекс не строит.
+
+Число потоков BLAS/OpenMP в каждом воркере ограничивается (по умолчанию 1),
+чтобы N воркеров не конкурировали за ядра потоками numpy/scipy.
+
+Новая версия индекса тоже строится один раз, в родительском процессе: по
+SIGHUP (его шлет воркер на POST /admin/reload) или при изменении файла базы
+(CORPUS_WATCH_INTERVAL). Затем запускаются N новых воркеров, а прежние
+получают SIGTERM и досчитывают начатые запросы; сокеты общие, поэтому
+соединения не теряются. Пока новая версия не построена, обслуживает прежняя.
+
+    python serve.py --app main_embeddings --workers 4 --port 8001
+    python serve.py --app main_embeddings --workers 4 --port 8001 --uds /run/phrase-checker/ml.sock
+"""
+import argparse
+import os
+
+# Ограничение потоков BLAS/OpenMP должно быть задано до импорта numpy
+BLAS_THREAD_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+WORKER_BLAS_THREADS = os.getenv("WORKER_BLAS_THREADS", "1")
+for _name in BLAS_THREAD_VARS:
+    os.environ.setdefault(_name, WORKER_BLAS_THREADS)
+
+import gc
+import importlib
+import logging
+import signal
+import socket
+import sys
+import time
+from typing import Dict, List, Set
+
+import uvicorn
+
+from index_state import FileWatcher, CORPUS_WATCH_INTERVAL, PREFORK_WORKER_ENV
+from listeners import bind_sockets, close_sockets, ML_HOST, ML_PORT, ML_UDS_PATH
+from phrase_corpus import PHRASES_PATH
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("serve")
+
+SERVE_WORKERS = int(os.getenv("SERVE_WORKERS", str(os.cpu_count() or 1)))
+RESTART_DELAY = 1.0  # пауза перед перезапуском упавшего воркера, секунд
+POLL_INTERVAL = 0.5  # период проверки воркеров, запроса на перестроение и файла базы, секунд
+
+
+def freeze_heap():
+    """Все, что создано до fork, переносится в постоянное поколение"""
+    gc.collect()
+    gc.freeze()
+    logger.info(f"Индекс построен, заморожено объектов: {gc.get_freeze_count()}")
+
+
+def build_index(module_name: str):
+    """Импорт сервиса и построение индекса в родительском процессе"""
+    service = importlib.import_module(module_name)
+    service.initialize_system()
+    freeze_heap()
+    return service
+
+
+def rebuild_index(service, reason: str) -> bool:
+    """Новая версия индекса в родительском процессе; при ошибке остается прежняя"""
+    logger.info(f"Перестроение индекса ({reason})...")
+    start_time = time.time()
+    try:
+        index = service.rebuild_index()
+    except Exception as e:
+        logger.error(f"Перестроение индекса не удалось, воркеры продолжают на прежней версии: {e}")
+        return False
+    # Прежняя версия заморожена: без unfreeze сборщик мусора ее не освободит
+    gc.unfreeze()
+    service.publish_index(index)
+    freeze_heap()
+    logger.info(f"Новая версия индекса {index.version[:16]} построена за {time.time() - start_time:.2f} секунд")
+    return True
+
+
+def run_worker(service, sockets: List[socket.socket], log_level: str):
+    """Тело воркера: uvicorn на унаследованных сокетах (TCP и Unix socket)"""
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, signal.SIG_DFL)
+    # SIGHUP - запрос на перестроение для родителя, воркер его не обрабатывает
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    config = uvicorn.Config(service.app, log_level=log_level)
+    server = uvicorn.Server(config)
+    server.run(sockets=sockets)
+
+
+def spawn_worker(service, sockets: List[socket.socket], log_level: str) -> int:
+    """fork воркера; возвращает pid"""
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        os.environ[PREFORK_WORKER_ENV] = "1"
+        try:
+            run_worker(service, sockets, log_level)
+        except BaseException as e:
+            logger.error(f"Воркер {os.getpid()} завершился с ошибкой: {e}")
+            code = 1
+        finally:
+            os._exit(code)
+    logger.info(f"Запущен воркер {pid}")
+    return pid
+
+
+def serve(module_name: str, host: str, port: int, workers: int, log_level: str, uds_path: str = ""):
+    """Построение индекса, fork воркеров, их перезапуск при падении и замена после перестроения индекса"""
+    service = build_index(module_name)
+    sockets = bind_sockets(host, port, uds_path)
+    logger.info(f"Воркеров {workers}, потоков BLAS на воркер {os.environ['OMP_NUM_THREADS']}")
+
+    children: Dict[int, float] = {}
+    retiring: Set[int] = set()  # воркеры прежней версии индекса, досчитывают начатые запросы
+    stopping = False
+    reload_reasons: List[str] = []
+    # Поток наблюдателя в родителе не нужен (fork при живом потоке небезопасен): файл опрашивается в цикле
+    watcher = FileWatcher(PHRASES_PATH, reload_reasons.append, CORPUS_WATCH_INTERVAL)
+    watched_at = time.time()
+
+    def terminate(pids):
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        terminate(list(children) + list(retiring))
+
+    def request_reload(signum, frame):
+        reload_reasons.append("SIGHUP")
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGHUP, request_reload)
+
+    for _ in range(workers):
+        children[spawn_worker(service, sockets, log_level)] = time.time()
+
+    while children or retiring:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        if pid == 0:
+            time.sleep(POLL_INTERVAL)
+            if stopping:
+                continue
+            if CORPUS_WATCH_INTERVAL > 0 and time.time() - watched_at >= CORPUS_WATCH_INTERVAL:
+                watched_at = time.time()
+                if watcher.changed():
+                    reload_reasons.append(f"изменен {os.path.basename(PHRASES_PATH)}")
+            if reload_reasons:
+                # Запросы, пришедшие за время сборки, объединяются в одну следующую
+                reason = ", ".join(sorted(set(reload_reasons)))
+                reload_reasons.clear()
+                if rebuild_index(service, reason):
+                    retiring.update(children)
+                    previous = list(children)
+                    children.clear()
+                    for _ in range(workers):
+                        children[spawn_worker(service, sockets, log_level)] = time.time()
+                    terminate(previous)
+                    logger.info(f"Воркеры заменены: {len(previous)} прежних завершаются")
+            continue
+        retiring.discard(pid)
+        started_at = children.pop(pid, None)
+        if started_at is None or stopping:
+            continue
+        logger.warning(f"Воркер {pid} завершился (код {os.waitstatus_to_exitcode(status)}), перезапуск")
+        if time.time() - started_at < RESTART_DELAY:
+            time.sleep(RESTART_DELAY)
+        children[spawn_worker(service, sockets, log_level)] = time.time()
+
+    close_sockets(sockets)
+    logger.info("Все воркеры остановлены")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefork запуск ML сервиса с общим индексом")
+    parser.add_argument("--app", default="main_embeddings", help="модуль сервиса (main_embeddings, main_alternative)")
+    parser.add_argument("--host", default=ML_HOST)
+    parser.add_argument("--port", type=int, default=ML_PORT, help="TCP порт, 0 - только Unix socket")
+    parser.add_argument("--uds", default=ML_UDS_PATH, help="путь Unix domain socket для клиентов на этом хосте")
+    parser.add_argument("--workers", type=int, default=SERVE_WORKERS, help="число воркеров")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    if not hasattr(os, "fork"):
+        sys.exit("Prefork запуск требует os.fork (Linux/macOS)")
+    serve(args.app, args.host, args.port, max(1, args.workers), args.log_level, args.uds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,493 @@
+"""Общая часть сервисов сопоставления (main_embeddings.py, main_alternative.py)
+
+ServiceRuntime - состояние одного сервиса: опубликованная версия индекса,
+пул сопоставления, кэш результатов, объединение одинаковых запросов,
+микропакеты и перестроение индекса по файлу базы. Через него проходит путь
+запроса (run_cached -> SingleFlight -> пул), пакетные расчеты (run_batch),
+сборка версии индекса со снимком (build_index_state) и ее публикация.
+add_service_routes() подключает к приложению общие middleware и эндпоинты:
+/check_phrase/fast, /ws/check_phrase, /admin/*, /metrics.
+
+Сервис задает сопоставление: задачи пула, этапы поиска и свои структуры
+индекса (наследник IndexState).
+"""
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from fastapi import FastAPI, Header, HTTPException, Request, Response, WebSocket
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from call_stream import serve_call_stream, stream_stats
+from dedup_join import canonicalize
+from fast_json import parse_check_request, encode_check_response, encode_error
+from index_snapshot import IndexSnapshot, snapshot_key, load_snapshot, save_snapshot, prune_snapshots, USE_INDEX_SNAPSHOT, INDEX_SNAPSHOT_DIR
+from index_state import ActiveIndex, IndexReloader, ParentReloader, FileWatcher, prefork_worker, admin_token_valid, ADMIN_ENABLED, CORPUS_WATCH_INTERVAL
+from match_pool import MatchPool, AdmissionRejected, DeadlineMiddleware
+from metrics import ServiceMetrics, MetricsMiddleware, component_metrics, stats_gauges, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from micro_batch import MicroBatcher, MICRO_BATCH
+from morphology import Lemmatizer
+from phrase_corpus import corpus_info, PHRASES_PATH
+from result_cache import ResultCache
+from similarity import TextPreprocessor, SimilarityCalculator, normalizer_fingerprint, USE_LEMMATIZATION
+from single_flight import SingleFlight
+from tfidf_query import QueryVectorizer
+from tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+# Схлопывание дубликатов базы в представителей при построении индекса
+COLLAPSE_DUPLICATES = os.getenv("COLLAPSE_DUPLICATES", "0") == "1"
+COLLAPSE_COSINE_THRESHOLD = float(os.getenv("COLLAPSE_COSINE_THRESHOLD", "0.9"))
+COLLAPSE_VERIFY_THRESHOLD = float(os.getenv("COLLAPSE_VERIFY_THRESHOLD", "0.85"))
+
+# Морфологическая нормализация слов (словоформа -> основа), USE_LEMMATIZATION - в similarity.py
+LEMMA_TABLE_PATH = os.getenv("LEMMA_TABLE_PATH", "")  # заранее построенная таблица (morphology.py)
+
+# Пакетные эндпоинты
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "1000"))  # элементов в одном запросе
+BATCH_CHUNK_SIZE = int(os.getenv("BATCH_CHUNK_SIZE", "64"))  # элементов в одной задаче пула
+
+
+class IndexState:
+    """Версия индекса: все, что читает сопоставление; после публикации не изменяется"""
+
+    def __init__(self, phrases: Set[str]):
+        self.phrases_db = phrases
+        # Сортируем фразы: номера строк не зависят от PYTHONHASHSEED и одинаковы во всех процессах
+        self.phrases_list: List[str] = sorted(phrases)
+        self.exact_phrases: Dict[str, str] = {}  # очищенный текст -> фраза базы (этап exact)
+        self.tfidf_vectorizer = None
+        self.phrases_tfidf_matrix = None
+        self.phrase_members: Optional[Dict[int, List[str]]] = None  # представитель -> фразы его кластера
+        self.lemmatizer = Lemmatizer()
+        self.version: Optional[str] = None  # ключ снимка
+
+
+# Модели ответов, общие для сервисов (запросы - в сервисах: у них разные пороги по умолчанию)
+class ThresholdVerdict(BaseModel):
+    threshold: float
+    matched: bool
+    similarity_score: float = 0.0
+    matched_phrase: str = ""
+
+class CheckResponse(BaseModel):
+    exists: bool
+    message: str
+    similarity_score: float = 0.0
+    matched_phrase: str = ""
+    verdicts: Optional[List[ThresholdVerdict]] = None
+    stages_run: Optional[List[str]] = None  # выполненные этапы сопоставления (см. anytime.py)
+
+class AnsweringMachineResponse(BaseModel):
+    is_answering_machine: bool
+    similarity_score: float = 0.0
+    matched_phrase: str = ""
+    verdicts: Optional[List[ThresholdVerdict]] = None
+    stages_run: Optional[List[str]] = None  # выполненные этапы сопоставления (см. anytime.py)
+
+class BatchPhraseResult(BaseModel):
+    is_answering_machine: bool = False
+    similarity_score: float = 0.0
+    matched_phrase: str = ""
+    verdicts: Optional[List[ThresholdVerdict]] = None
+    stages_run: Optional[List[str]] = None  # выполненные этапы сопоставления (см. anytime.py)
+    error: Optional[str] = None  # ошибка этого элемента; остальные элементы считаются
+
+class BatchPhraseResponse(BaseModel):
+    results: List[BatchPhraseResult]
+
+class BatchSimilarResult(BaseModel):
+    similar_phrases: List[Tuple[str, float]] = []
+    error: Optional[str] = None
+
+class BatchSimilarResponse(BaseModel):
+    results: List[BatchSimilarResult]
+
+
+def split_verdicts(results: List[Tuple[bool, float, str]], thresholds: Optional[List[float]], stages: List[str]):
+    """Основной результат, вердикты по дополнительным порогам и выполненные этапы"""
+    verdicts = None
+    if thresholds:
+        verdicts = [
+            ThresholdVerdict(threshold=t, matched=exists, similarity_score=score, matched_phrase=phrase)
+            for t, (exists, score, phrase) in zip(thresholds, results[1:])
+        ]
+    return results[0], verdicts, stages
+
+def item_error(error: Exception) -> str:
+    """Текст ошибки элемента пакета"""
+    return error.detail if isinstance(error, HTTPException) else str(error)
+
+def check_batch_size(count: int):
+    if count > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Не более {BATCH_MAX_ITEMS} элементов в пакете")
+
+def require_admin(x_admin_token: Optional[str]):
+    """Доступ к /admin/*: без ADMIN_TOKEN эндпоинты выключены (404), с неверным токеном - 403"""
+    if not ADMIN_ENABLED:
+        raise HTTPException(status_code=404, detail="Административные эндпоинты выключены: не задан ADMIN_TOKEN")
+    if not admin_token_valid(x_admin_token):
+        raise HTTPException(status_code=403, detail="Неверный X-Admin-Token")
+
+
+class ServiceRuntime:
+    """Состояние сервиса сопоставления и общий путь запроса: кэш -> объединение -> пул
+
+    call_pinned(func, *args) - функция модуля сервиса, выполняющая задачу пула на
+    закрепленной версии индекса: пул процессов передает задачу по имени, поэтому
+    метод этого объекта (вместе с пулом и кэшем) ей быть не может.
+    """
+
+    def __init__(self, name: str, vectorizer_params: Dict[str, object], call_pinned: Callable):
+        self.name = name  # имя сервиса: каталог снимков, журнал перестроения
+        self.vectorizer_params = vectorizer_params
+        self.call_pinned = call_pinned
+        # Опубликованная версия индекса (IndexState), заменяется целиком (index_state.py)
+        self.active_index = ActiveIndex()
+        self.lemmatizer = Lemmatizer()  # пока индекс не построен
+        self.metrics = ServiceMetrics()  # запросы и этапы сопоставления для /metrics
+        self.result_cache = ResultCache()  # результаты для повторяющихся реплик
+        self.in_flight = SingleFlight()  # один расчет на одинаковые одновременные запросы
+        self.match_pool: Optional[MatchPool] = None  # пул для сопоставления вне event loop
+        self.match_batcher: Optional[MicroBatcher] = None  # микропакеты сопоставления
+        self.index_reloader: Optional[IndexReloader] = None  # фоновое перестроение индекса (под serve.py - ParentReloader)
+        self.corpus_watcher: Optional[FileWatcher] = None  # наблюдение за файлом базы
+        self.index_version: Optional[str] = None  # ключ снимка опубликованного индекса
+
+    def current_index(self) -> Optional[IndexState]:
+        """Версия индекса, закрепленная за задачей, иначе опубликованная (None - индекс не построен)"""
+        return self.active_index.get()
+
+    def current_lemmatizer(self) -> Lemmatizer:
+        index = self.active_index.get()
+        return index.lemmatizer if index is not None else self.lemmatizer
+
+    def phrases_loaded(self) -> int:
+        index = self.active_index.get()
+        return len(index.phrases_db) if index is not None else 0
+
+    # Версии индекса
+
+    def create_vectorizer(self):
+        """TF-IDF векторизатор с параметрами сервиса (ненастроенный)
+
+        scikit-learn импортируется здесь: он нужен только для построения индекса,
+        при загрузке из снимка запросы векторизует QueryVectorizer.
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        return TfidfVectorizer(**self.vectorizer_params)
+
+    def index_settings(self, **extra) -> Dict[str, object]:
+        """Параметры, от которых зависит индекс: входят в ключ снимка (extra - параметры сервиса)"""
+        return {
+            "vectorizer": repr(sorted(self.vectorizer_params.items())),
+            "normalizer": normalizer_fingerprint(),
+            "lemmatization": USE_LEMMATIZATION,
+            "lemma_table": [LEMMA_TABLE_PATH, os.path.getmtime(LEMMA_TABLE_PATH) if LEMMA_TABLE_PATH else None],
+            "collapse": [COLLAPSE_DUPLICATES, COLLAPSE_COSINE_THRESHOLD, COLLAPSE_VERIFY_THRESHOLD],
+            **extra
+        }
+
+    def build_index_state(self, index: IndexState, settings: Dict[str, object], build: Callable[[IndexState], None],
+                          restore: Optional[Callable[[IndexState, IndexSnapshot], None]] = None,
+                          arrays: Optional[Callable[[IndexState], Dict[str, Any]]] = None) -> IndexState:
+        """Новая версия индекса; пока она строится, ее видит только поток сборки
+
+        Готовый снимок загружается через mmap вместо перестроения. build(index)
+        строит индекс по phrases_list; restore(index, snapshot) и arrays(index)
+        загружают и сохраняют дополнительные массивы сервиса в снимке.
+        """
+        with self.active_index.pin(index):
+            index.exact_phrases = {TextPreprocessor.clean_text(phrase): phrase for phrase in index.phrases_list}
+
+            key = snapshot_key(index.phrases_list, settings)
+            snapshot = load_snapshot(INDEX_SNAPSHOT_DIR, self.name, key) if USE_INDEX_SNAPSHOT else None
+            if snapshot is not None:
+                self.load_index_snapshot(index, snapshot)
+                if restore is not None:
+                    restore(index, snapshot)
+                logger.info(
+                    f"Индекс из снимка: {len(index.phrases_list)} фраз, {len(index.tfidf_vectorizer.vocabulary_)} признаков"
+                )
+            else:
+                build(index)
+                if USE_INDEX_SNAPSHOT:
+                    self.save_index_snapshot(index, key, arrays(index) if arrays is not None else None)
+            index.version = key
+        return index
+
+    def build_index(self, index: IndexState):
+        """Общая часть построения индекса по phrases_list: леммы, дубликаты, TF-IDF"""
+        # Таблица словоформа -> основа для всех слов базы
+        if USE_LEMMATIZATION:
+            index.lemmatizer = build_lemmatizer(index.phrases_list)
+
+        # Ищем только по представителям кластеров дубликатов
+        if COLLAPSE_DUPLICATES:
+            index.phrases_list, index.phrase_members = canonicalize(
+                index.phrases_list,
+                clean=TextPreprocessor.clean_text,
+                verifier=SimilarityCalculator.length_weighted_similarity,
+                cosine_threshold=COLLAPSE_COSINE_THRESHOLD,
+                verify_threshold=COLLAPSE_VERIFY_THRESHOLD
+            )
+
+        index.tfidf_vectorizer = self.create_vectorizer()
+        logger.info(f"Вычисление TF-IDF матрицы для {len(index.phrases_list)} фраз...")
+        normalized_phrases = TextPreprocessor.normalize_many(index.phrases_list)
+        index.phrases_tfidf_matrix = index.tfidf_vectorizer.fit_transform(normalized_phrases)
+        logger.info(f"Словарь TF-IDF: {len(index.tfidf_vectorizer.vocabulary_)} признаков")
+
+    def save_index_snapshot(self, index: IndexState, key: str, arrays: Optional[Dict[str, Any]] = None):
+        """Сохранение построенного индекса; ошибка записи не мешает работе сервиса"""
+        try:
+            save_snapshot(
+                INDEX_SNAPSHOT_DIR, self.name, key, index.phrases_list, index.tfidf_vectorizer,
+                index.phrases_tfidf_matrix,
+                members=index.phrase_members,
+                lemmas=index.lemmatizer.table if USE_LEMMATIZATION else None,
+                arrays=arrays
+            )
+        except OSError as e:
+            logger.warning(f"Не удалось сохранить снимок индекса: {e}")
+
+    def load_index_snapshot(self, index: IndexState, snapshot: IndexSnapshot):
+        """Индекс из снимка: матрица и признаки остаются отображенными в память"""
+        index.phrases_list = snapshot.phrases
+        index.phrase_members = snapshot.members
+        if USE_LEMMATIZATION:
+            index.lemmatizer = Lemmatizer(snapshot.lemmas)
+        index.tfidf_vectorizer = QueryVectorizer.from_params(snapshot.vocabulary, snapshot.idf, self.vectorizer_params)
+        index.phrases_tfidf_matrix = snapshot.matrix
+
+    def publish(self, index: IndexState):
+        """Замена версии одной ссылкой: начатые запросы досчитываются на прежней"""
+        self.active_index.publish(index)
+        self.index_version = index.version
+        # Результаты, посчитанные на прежнем индексе, больше не действительны
+        self.result_cache.bind(self.index_version)
+        # Воркеры-процессы получают новую версию только fork'ом
+        if self.match_pool is not None:
+            self.match_pool.recycle()
+        # Снимки прежних версий базы не нужны: на диске остаются INDEX_SNAPSHOT_KEEP последних
+        if USE_INDEX_SNAPSHOT:
+            prune_snapshots(INDEX_SNAPSHOT_DIR, self.name, index.version)
+
+    # Путь запроса
+
+    async def run_matching(self, func, *args):
+        """Выполняет сопоставление в пуле вне event loop (503/504 при отказе в допуске)"""
+        if self.match_pool is None:
+            return self.call_pinned(func, *args)
+        return await self.match_pool.run(self.call_pinned, func, *args)
+
+    async def run_cached(self, mode: tuple, text: str, func, *args, cacheable=None):
+        """Результат из кэша по нормализованному тексту и режиму, иначе await func(*args)
+
+        Одновременные одинаковые запросы ждут один общий расчет. Результат, для которого
+        cacheable(value) ложно (приближенный ответ при исчерпанном бюджете), не кэшируется.
+        """
+        key = (TextPreprocessor.clean_text(text),) + mode
+        version = self.result_cache.version
+        found, value = self.result_cache.get(key)
+        if found:
+            return value
+
+        async def compute():
+            value = await func(*args)
+            if cacheable is None or cacheable(value):
+                self.result_cache.put(key, value, version)
+            return value
+
+        return await self.in_flight.do((version,) + key, compute)
+
+    async def run_batch(self, keys: List[tuple], items: List[object], func, convert) -> List[object]:
+        """Пакетный расчет с кэшем: в пул уходят только промахи, частями по BATCH_CHUNK_SIZE
+
+        func(items) возвращает сырой результат или исключение для каждого элемента,
+        convert(i, raw) превращает сырой результат i-го элемента в значение для кэша и ответа.
+        """
+        version = self.result_cache.version
+        results: List[object] = [None] * len(items)
+        missing = []
+        for i, key in enumerate(keys):
+            found, value = self.result_cache.get(key)
+            if found:
+                results[i] = value
+            else:
+                missing.append(i)
+
+        chunks = [missing[start:start + BATCH_CHUNK_SIZE] for start in range(0, len(missing), BATCH_CHUNK_SIZE)]
+        computed = await asyncio.gather(
+            *[self.run_matching(func, [items[i] for i in chunk]) for chunk in chunks], return_exceptions=True
+        )
+        rejected: Optional[AdmissionRejected] = None
+        for chunk, values in zip(chunks, computed):
+            if isinstance(values, AdmissionRejected):
+                rejected = rejected or values
+                continue
+            # Прочая ошибка части пакета - ошибка ее элементов
+            if isinstance(values, Exception):
+                values = [values] * len(chunk)
+            for i, raw in zip(chunk, values):
+                if isinstance(raw, Exception):
+                    results[i] = raw
+                    continue
+                results[i] = convert(i, raw)
+                self.result_cache.put(keys[i], results[i], version)
+        # Отказ пула (503/504) - ответ всего пакета, как у одиночного запроса: клиент повторит пакет,
+        # а посчитанные части уже в кэше
+        if rejected is not None:
+            raise rejected
+        return results
+
+    # Жизненный цикл и состояние
+
+    def lifespan(self, initialize: Callable[[], None], rebuild: Callable[[], IndexState],
+                 score_batch: Optional[Callable] = None):
+        """lifespan приложения: индекс, пул, микропакеты (score_batch) и перестроение по файлу базы"""
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            # Startup
+            logger.info("Запуск приложения...")
+            # При запуске через serve.py индекс уже построен в родительском процессе
+            if self.current_index() is None:
+                initialize()
+            self.match_pool = MatchPool()
+            if MICRO_BATCH and score_batch is not None:
+                self.match_batcher = MicroBatcher(score_batch)
+            # Перестроение индекса без перезапуска: POST /admin/reload или изменение файла базы
+            if prefork_worker():
+                # Под serve.py индекс перестраивает родитель и заменяет воркеров, он же следит за файлом базы
+                self.index_reloader = ParentReloader(self.name)
+                self.corpus_watcher = FileWatcher(PHRASES_PATH, self.index_reloader.trigger, 0)
+            else:
+                self.index_reloader = IndexReloader(self.name, rebuild, self.publish)
+                self.corpus_watcher = FileWatcher(PHRASES_PATH, self.index_reloader.trigger, CORPUS_WATCH_INTERVAL)
+            self.corpus_watcher.start()
+            yield
+            # Shutdown
+            logger.info("Завершение работы приложения...")
+            self.corpus_watcher.stop()
+            self.match_pool.shutdown()
+        return lifespan
+
+    def reload_stats(self) -> Optional[Dict[str, Any]]:
+        return self.index_reloader.stats() if self.index_reloader is not None else None
+
+    def render_metrics(self) -> Response:
+        """Метрики в текстовом формате Prometheus"""
+        index = self.current_index()
+        gauges, histograms = component_metrics(self.match_pool, self.result_cache, self.in_flight, self.match_batcher)
+        gauges.update({
+            "phrases_loaded": self.phrases_loaded(),
+            "index_rows": len(index.phrases_list) if index is not None else 0,
+            "index_published": self.active_index.published
+        })
+        gauges.update(stats_gauges("index_reload", self.reload_stats()))
+        gauges.update(stats_gauges("call_streams", stream_stats.snapshot()))
+        return Response(self.metrics.render(gauges, histograms), media_type=METRICS_CONTENT_TYPE)
+
+    def health(self, **details) -> Dict[str, Any]:
+        """Ответ /health: общие компоненты и details - состояние индекса сервиса"""
+        index = self.current_index()
+        return {
+            "status": "healthy",
+            "phrases_loaded": self.phrases_loaded(),
+            "corpus": corpus_info,
+            "system_ready": index is not None,
+            **details,
+            "index_rows": len(index.phrases_list) if index is not None else 0,
+            "index": {
+                "version": self.index_version,
+                "published": self.active_index.published,
+                "reload": self.reload_stats()
+            },
+            "match_pool": self.match_pool.stats() if self.match_pool is not None else None,
+            "result_cache": self.result_cache.stats(),
+            "single_flight": self.in_flight.stats(),
+            "micro_batch": self.match_batcher.stats() if self.match_batcher is not None else None,
+            "call_streams": stream_stats.snapshot(),
+            "tracing": tracer.stats()
+        }
+
+
+def build_lemmatizer(phrases: List[str]) -> Lemmatizer:
+    """Таблица лемм: из файла, если задан, плюс основы всех слов базы"""
+    table = Lemmatizer.from_file(LEMMA_TABLE_PATH) if LEMMA_TABLE_PATH else Lemmatizer()
+    words = set()
+    for phrase in TextPreprocessor.clean_many(phrases):
+        words.update(phrase.split())
+    table.bake(words)
+    lemmas = {table.lemma(word) for word in words}
+    logger.info(f"Таблица лемм: {len(words)} словоформ базы -> {len(lemmas)} основ")
+    return table
+
+
+def add_service_routes(app: FastAPI, runtime: ServiceRuntime, check_text: Callable, default_threshold: float):
+    """Общие middleware и эндпоинты сервиса; check_text(text, threshold, thresholds) - проверка по порогам"""
+    # Срок ответа клиента (X-Deadline-Ms) доступен пулу сопоставления через contextvar
+    app.add_middleware(DeadlineMiddleware)
+    # Число и время запросов по эндпоинтам для /metrics
+    app.add_middleware(MetricsMiddleware, metrics=runtime.metrics)
+
+    @app.exception_handler(AdmissionRejected)
+    async def admission_rejected_handler(request: Request, exc: AdmissionRejected):
+        """503 - очередь пула заполнена, 504 - ответ не успеет к сроку клиента"""
+        return JSONResponse(status_code=exc.status_code, content={"detail": str(exc)})
+
+    @app.post("/check_phrase/fast")
+    async def check_phrase_fast(request: Request):
+        """То же, что /check_phrase, без моделей pydantic: разбор тела и ответ из готовых частей"""
+        try:
+            phrase, threshold, thresholds = parse_check_request(await request.body(), default_threshold=default_threshold)
+        except ValueError as e:
+            return Response(encode_error(str(e)), status_code=422, media_type="application/json")
+        if runtime.current_index() is None:
+            return Response(encode_error("System not initialized"), status_code=500, media_type="application/json")
+
+        try:
+            (exists, similarity_score, matched_phrase), verdicts, stages_run = await check_text(phrase, threshold, thresholds)
+        except HTTPException as e:
+            return Response(encode_error(str(e.detail)), status_code=e.status_code, media_type="application/json")
+        except AdmissionRejected as e:
+            return Response(encode_error(str(e)), status_code=e.status_code, media_type="application/json")
+        except Exception as e:
+            logger.error(f"Error checking phrase: {e}")
+            return Response(encode_error(str(e)), status_code=500, media_type="application/json")
+        return Response(
+            encode_check_response(exists, similarity_score, matched_phrase, verdicts, stages_run),
+            media_type="application/json"
+        )
+
+    @app.websocket("/ws/check_phrase")
+    async def check_phrase_stream(websocket: WebSocket):
+        """Потоковая проверка фрагментов расшифровки звонка (протокол - в call_stream.py)"""
+        await serve_call_stream(websocket, check_text, TextPreprocessor.clean_text, default_threshold=default_threshold)
+
+    @app.post("/admin/reload")
+    async def reload_index(x_admin_token: Optional[str] = Header(None)):
+        """Перестроение индекса по файлу базы в фоне; запросы обслуживаются прежней версией до публикации"""
+        require_admin(x_admin_token)
+        if runtime.index_reloader is None:
+            raise HTTPException(status_code=500, detail="System not initialized")
+        return {
+            "status": runtime.index_reloader.trigger("POST /admin/reload"),
+            "version": runtime.index_version,
+            "reload": runtime.index_reloader.stats()
+        }
+
+    @app.get("/admin/traces")
+    async def dump_traces(clear: bool = False, x_admin_token: Optional[str] = Header(None)):
+        """Последние трассы сопоставления в формате Chrome trace (TRACE_SAMPLE_RATE > 0)"""
+        require_admin(x_admin_token)
+        return tracer.chrome_trace(clear)
+
+    @app.get("/metrics")
+    async def metrics():
+        """Метрики в текстовом формате Prometheus"""
+        return runtime.render_metrics()
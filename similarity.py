@@ -0,0 +1,167 @@
+"""Предобработка текста и метрики схожести фраз, общие для сервисов и утилит
+
+Модуль легкий (нормализация текста, морфология, трассировка): отладочные
+скрипты вроде debug_letsgou.py импортируют его, не поднимая сервис со всеми
+зависимостями. Сервис подключает bind_lemmatizer(), чтобы слова приводились
+к основам по таблице опубликованной версии индекса.
+"""
+import hashlib
+import os
+from collections import Counter
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Callable, List
+
+from morphology import Lemmatizer
+from text_normalizer import normalize_cached, clean_many
+from tracing import traced
+
+# Морфологическая нормализация слов (словоформа -> основа) для TF-IDF и метрик по словам
+USE_LEMMATIZATION = os.getenv("USE_LEMMATIZATION", "1") == "1"
+
+_default_lemmatizer = Lemmatizer()  # без сервиса: основы стеммером с мемоизацией
+_current_lemmatizer: Callable[[], Lemmatizer] = lambda: _default_lemmatizer
+
+
+# Тексты для отпечатка нормализации: регистр, ё, пунктуация и пробелы Unicode, цифры, словоформы
+NORMALIZER_PROBES = (
+    "Здравствуйте! Это ЁЛКИ-палки, «Сбербанк» — ваш виртуальный ассистент…",
+    "Оставьте сообщение после звукового сигнала; абонент временно недоступен?",
+    "Перезвоните\u00a0позже\tпожалуйста,\n123 456 7890 или +7 (495) 000-00-00",
+    "мхатовскую мхатовская паузу пауза говорите говорившими разговаривающего",
+    "Алло... алло?! Кто это: я слушаю (вас); что-то не слышно 'вообще' \"никак\"",
+    "ЁЖИК ёжиком ежами Ежиха; e-mail: TEST@example.com, 50% скидка №5",
+)
+
+
+def bind_lemmatizer(source: Callable[[], Lemmatizer]):
+    """Источник таблицы лемм для get_words и normalize_many (сервис - версия индекса)"""
+    global _current_lemmatizer
+    _current_lemmatizer = source
+
+
+@lru_cache(maxsize=1)
+def normalizer_fingerprint() -> str:
+    """Хэш очистки и стемминга NORMALIZER_PROBES: входит в ключ снимка индекса
+    
+    Изменение нормализации текста (text_normalizer.py) или стеммера (morphology.py)
+    меняет словарь TF-IDF; с отпечатком в ключе прежний снимок не загрузится.
+    """
+    stemmer = Lemmatizer()
+    digest = hashlib.sha256()
+    for probe in NORMALIZER_PROBES:
+        cleaned = normalize_cached(probe)
+        digest.update(cleaned.encode("utf-8"))
+        digest.update(b"\n")
+        digest.update(" ".join(stemmer.lemmatize_words(cleaned.split())).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()[:16]
+
+
+class TextPreprocessor:
+    """Класс для предобработки текста"""
+    
+    @staticmethod
+    @traced("clean_text")
+    def clean_text(text: str) -> str:
+        """Очистка и нормализация текста (регистр, пунктуация Unicode, ё, пробелы)"""
+        return normalize_cached(text)
+    
+    @staticmethod
+    def clean_many(texts: List[str]) -> List[str]:
+        """Пакетная очистка текстов"""
+        return clean_many(texts)
+    
+    @staticmethod
+    def get_words(text: str) -> List[str]:
+        """Получение списка слов (основ, если включена лемматизация) из текста"""
+        words = TextPreprocessor.clean_text(text).split()
+        if USE_LEMMATIZATION:
+            return _current_lemmatizer().lemmatize_words(words)
+        return words
+    
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Очищенный и лемматизированный текст для TF-IDF"""
+        return " ".join(TextPreprocessor.get_words(text))
+    
+    @staticmethod
+    def normalize_many(texts: List[str]) -> List[str]:
+        """Пакетная очистка и лемматизация текстов для TF-IDF"""
+        cleaned = clean_many(texts)
+        if not USE_LEMMATIZATION:
+            return cleaned
+        table = _current_lemmatizer()
+        return [" ".join(table.lemmatize_words(text.split())) for text in cleaned]
+
+
+class SimilarityCalculator:
+    """Класс для вычисления различных метрик схожести"""
+    
+    @staticmethod
+    @traced("similarity.jaccard")
+    def jaccard_similarity(text1: str, text2: str) -> float:
+        """Вычисление коэффициента Жаккара"""
+        words1 = set(TextPreprocessor.get_words(text1))
+        words2 = set(TextPreprocessor.get_words(text2))
+        
+        if not words1 and not words2:
+            return 1.0
+        
+        intersection = words1.intersection(words2)
+        union = words1.union(words2)
+        
+        return len(intersection) / len(union) if union else 0.0
+    
+    @staticmethod
+    @traced("similarity.sequence")
+    def sequence_similarity(text1: str, text2: str) -> float:
+        """Вычисление схожести последовательностей"""
+        clean1 = TextPreprocessor.clean_text(text1)
+        clean2 = TextPreprocessor.clean_text(text2)
+        
+        return SequenceMatcher(None, clean1, clean2).ratio()
+    
+    @staticmethod
+    @traced("similarity.word_overlap")
+    def word_overlap_similarity(text1: str, text2: str) -> float:
+        """Вычисление схожести на основе пересечения слов"""
+        words1 = TextPreprocessor.get_words(text1)
+        words2 = TextPreprocessor.get_words(text2)
+        
+        if not words1 and not words2:
+            return 1.0
+        
+        counter1 = Counter(words1)
+        counter2 = Counter(words2)
+        
+        # Вычисляем пересечение с учетом частоты
+        intersection = sum((counter1 & counter2).values())
+        total = sum(counter1.values()) + sum(counter2.values())
+        
+        return (2 * intersection) / total if total > 0 else 0.0
+    
+    @staticmethod
+    @traced("similarity.length_weighted")
+    def length_weighted_similarity(text1: str, text2: str) -> float:
+        """Схожесть с учетом длины текста"""
+        # Комбинируем несколько метрик
+        jaccard = SimilarityCalculator.jaccard_similarity(text1, text2)
+        sequence = SimilarityCalculator.sequence_similarity(text1, text2)
+        word_overlap = SimilarityCalculator.word_overlap_similarity(text1, text2)
+        
+        # Учитываем длину - короткие фразы должны иметь меньший вес
+        len1 = len(TextPreprocessor.get_words(text1))
+        len2 = len(TextPreprocessor.get_words(text2))
+        
+        # Штраф за слишком короткие фразы
+        length_penalty = 1.0
+        if min(len1, len2) < 3:  # Если одна из фраз содержит менее 3 слов
+            length_penalty = 0.3
+        elif min(len1, len2) < 5:  # Если одна из фраз содержит менее 5 слов
+            length_penalty = 0.6
+        
+        # Взвешенная комбинация метрик
+        combined_score = (jaccard * 0.3 + sequence * 0.3 + word_overlap * 0.4) * length_penalty
+        
+        return combined_score
@@ -0,0 +1,66 @@
+"""Объединение одинаковых одновременных запросов (single-flight)
+
+Во время обзвона сотни звонков одновременно попадают на один и тот же IVR,
+и одинаковые тела /check_phrase приходят раньше, чем кэш результатов успевает
+заполниться. Первый запрос с данным ключом запускает расчет, остальные ждут
+его результат вместо собственного расчета.
+
+Работает в одном event loop, поэтому блокировки не нужны.
+
+Общий расчет выполняется без срока ответа: срок инициатора (X-Deadline-Ms) не
+должен обрывать расчет для присоединившихся запросов с более поздним сроком или
+без него. Каждый запрос, включая инициатора, ждет результат не дольше
+собственного срока.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from match_pool import request_deadline, wait_for_deadline
+
+
+async def _without_deadline(factory: Callable[[], Awaitable[Any]]) -> Any:
+    """factory() в контексте задачи без срока ответа (контекст вызывающего не меняется)"""
+    request_deadline.set(None)
+    return await factory()
+
+
+class SingleFlight:
+    """Один расчет на ключ среди одновременно выполняющихся запросов"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.counters: Dict[str, int] = {
+            "executions": 0,
+            "coalesced": 0,
+            "failures": 0,
+        }
+
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Ошибка расчета получают ожидающие запросы; помечаем ее обработанной,
+        # даже если все они уже отменены
+        if not task.cancelled() and task.exception() is not None:
+            self.counters["failures"] += 1
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Результат factory() для ключа; одновременные вызовы с тем же ключом ждут один расчет"""
+        task = self._calls.get(key)
+        if task is None:
+            # Расчет - отдельная задача: отмена запроса-инициатора не отменяет его для остальных
+            task = asyncio.ensure_future(_without_deadline(factory))
+            self._calls[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+            self.counters["executions"] += 1
+        else:
+            self.counters["coalesced"] += 1
+        return await wait_for_deadline(asyncio.shield(task))
+
+    def stats(self) -> Dict[str, Any]:
+        """Счетчики для /health"""
+        requests = self.counters["executions"] + self.counters["coalesced"]
+        return {
+            "in_flight": len(self._calls),
+            **self.counters,
+            "coalesced_rate": self.counters["coalesced"] / requests if requests else 0.0,
+        }
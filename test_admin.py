@@ -0,0 +1,35 @@
+"""Доступ к /admin/*: без ADMIN_TOKEN эндпоинты выключены, с токеном - только по X-Admin-Token
+
+    python -m pytest -q test_admin.py
+"""
+import asyncio
+
+import httpx
+
+import index_state
+import main_embeddings as service
+import service_runtime
+
+
+async def admin_statuses(headers):
+    async with service.app.router.lifespan_context(service.app):
+        transport = httpx.ASGITransport(app=service.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            reload = await client.post("/admin/reload", headers=headers)
+            traces = await client.get("/admin/traces", headers=headers)
+    return reload.status_code, traces.status_code
+
+
+def test_admin_disabled_without_token(monkeypatch):
+    monkeypatch.setattr(index_state, "ADMIN_TOKEN", "")
+    monkeypatch.setattr(service_runtime, "ADMIN_ENABLED", False)
+    assert asyncio.run(admin_statuses({})) == (404, 404)
+    assert asyncio.run(admin_statuses({"X-Admin-Token": ""})) == (404, 404)
+
+
+def test_admin_requires_token(monkeypatch):
+    monkeypatch.setattr(index_state, "ADMIN_TOKEN", "secret")
+    monkeypatch.setattr(service_runtime, "ADMIN_ENABLED", True)
+    assert asyncio.run(admin_statuses({})) == (403, 403)
+    assert asyncio.run(admin_statuses({"X-Admin-Token": "wrong"})) == (403, 403)
+    assert asyncio.run(admin_statuses({"X-Admin-Token": "secret"})) == (200, 200)
@@ -1,8 +1,4 @@
-import requests
-import json
-
-# URL сервиса
-url = "http://localhost:8001/check_phrase"
+from phrase_client import PhraseClient, PhraseServiceError
 
 # Тестовые фразы
 test_phrases = [
@@ -23,30 +19,26 @@ thresholds = [0.3, 0.5, 0.7, 0.8, 0.9]
 print("Тестирование альтернативного сервиса (без нейронных сетей)\n")
 print("=" * 80)
 
-for phrase in test_phrases:
+# Все фразы и пороги - одним пакетным запросом
+try:
+    with PhraseClient() as client:
+        results = client.check_many(test_phrases, threshold=thresholds[0], thresholds=thresholds)
+except PhraseServiceError as e:
+    results = [{"error": str(e)}] * len(test_phrases)
+
+for phrase, result in zip(test_phrases, results):
     print(f"\nФраза: '{phrase}'")
     print("-" * 60)
     
-    for threshold in thresholds:
-        # Подготовка данных запроса
-        data = {
-            "phrase": phrase,
-            "threshold": threshold
-        }
-        
-        # Отправка запроса
-        try:
-            response = requests.post(url, json=data)
-            result = response.json()
-            
-            # Вывод результата
-            status = "✅ АВТООТВЕТЧИК" if result['is_answering_machine'] else "❌ НЕ АВТООТВЕТЧИК"
-            print(f"  Порог {threshold:.1f}: {status} (score: {result['similarity_score']:.4f})")
-            if result['matched_phrase']:
-                print(f"           Совпадение: '{result['matched_phrase']}'")
-            
-        except Exception as e:
-            print(f"  Ошибка при threshold={threshold}: {e}")
+    if result.get("error"):
+        print(f"  Ошибка при запросе: {result['error']}")
+    else:
+        # Вывод результата по каждому порогу
+        for verdict in result["verdicts"]:
+            status = "✅ АВТООТВЕТЧИК" if verdict['matched'] else "❌ НЕ АВТООТВЕТЧИК"
+            print(f"  Порог {verdict['threshold']:.1f}: {status} (score: {verdict['similarity_score']:.4f})")
+            if verdict['matched_phrase']:
+                print(f"           Совпадение: '{verdict['matched_phrase']}'")
     
     print()
 
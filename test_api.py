@@ -1,5 +1,4 @@
-import requests
-import json
+from phrase_client import PhraseClient, PhraseServiceError
 
 # Тестируем с несуществующими словами
 test_phrases = [
@@ -10,21 +9,19 @@ test_phrases = [
     "123456789 !@#$%^&*()"
 ]
 
-url = "http://localhost:8001/check_phrase"
-
-for phrase in test_phrases:
-    data = {"phrase": phrase}
-    try:
-        response = requests.post(url, json=data)
-        if response.status_code == 200:
-            result = response.json()
-            print(f"Фраза: '{phrase}'")
-            print(f"Similarity score: {result['similarity_score']:.4f}")
-            print(f"Is answering machine: {result['is_answering_machine']}")
-            if result['matched_phrase']:
-                print(f"Matched phrase: '{result['matched_phrase']}'")
-            print("-" * 50)
-        else:
-            print(f"Ошибка {response.status_code}: {response.text}")
-    except Exception as e:
-        print(f"Ошибка при запросе: {e}")
\ No newline at end of file
+# Все фразы - одним пакетным запросом через общее соединение
+try:
+    with PhraseClient() as client:
+        results = client.check_many(test_phrases)
+    for phrase, result in zip(test_phrases, results):
+        if result.get('error'):
+            print(f"Ошибка для '{phrase}': {result['error']}")
+            continue
+        print(f"Фраза: '{phrase}'")
+        print(f"Similarity score: {result['similarity_score']:.4f}")
+        print(f"Is answering machine: {result['is_answering_machine']}")
+        if result['matched_phrase']:
+            print(f"Matched phrase: '{result['matched_phrase']}'")
+        print("-" * 50)
+except PhraseServiceError as e:
+    print(f"Ошибка при запросе: {e}")
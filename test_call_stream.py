@@ -0,0 +1,71 @@
+"""Потоковая проверка звонка: временный отказ в проверке не закрывает соединение
+
+    python -m pytest -q test_call_stream.py
+"""
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from call_stream import serve_call_stream, stream_stats
+from match_pool import PoolOverloaded
+
+
+def stream_app(check) -> FastAPI:
+    app = FastAPI()
+
+    @app.websocket("/ws")
+    async def ws(websocket: WebSocket):
+        await serve_call_stream(websocket, check, str.strip, default_threshold=0.9)
+
+    return app
+
+
+def test_admission_rejected_keeps_connection():
+    calls = []
+
+    async def check(text, threshold, thresholds):
+        calls.append(text)
+        if len(calls) == 1:
+            raise PoolOverloaded("Очередь пула заполнена")
+        return (True, 1.0, text), None, ["exact"]
+
+    rejected = stream_stats.counters["rejected_checks"]
+    with TestClient(stream_app(check)) as client, client.websocket_connect("/ws") as websocket:
+        websocket.send_json({"text": "оставьте сообщение", "final": True})
+        assert websocket.receive_json() == {
+            "utterance": 0, "final": True, "error": "Очередь пула заполнена", "status": 503
+        }
+        websocket.send_json({"text": "после сигнала", "final": True})
+        message = websocket.receive_json()
+        assert message["utterance"] == 1 and message["is_answering_machine"]
+    assert stream_stats.counters["rejected_checks"] == rejected + 1
+
+
+def test_unexpected_error_closes_connection():
+    async def check(text, threshold, thresholds):
+        raise ValueError("сломалось")
+
+    with TestClient(stream_app(check)) as client, client.websocket_connect("/ws") as websocket:
+        websocket.send_json({"text": "алло", "final": True})
+        message = websocket.receive()
+        assert message["type"] == "websocket.close" and message["code"] == 1011
+
+
+def test_invalid_threshold_rejected():
+    async def check(text, threshold, thresholds):
+        return (False, 0.0, ""), None, []
+
+    active = stream_stats.counters["active"]
+    with TestClient(stream_app(check)) as client:
+        for threshold in ("abc", "1.5", "nan"):
+            with pytest.raises(WebSocketDisconnect) as closed:
+                with client.websocket_connect(f"/ws?threshold={threshold}") as websocket:
+                    websocket.receive_json()
+            assert closed.value.code == 1008
+        # Место соединения не занимается и не теряется
+        assert stream_stats.counters["active"] == active
+        with client.websocket_connect("/ws?threshold=0.5") as websocket:
+            websocket.send_json({"text": "алло", "final": True})
+            assert websocket.receive_json()["utterance"] == 0
+    assert stream_stats.counters["active"] == active
@@ -0,0 +1,36 @@
+"""Префиксы строк для поиска дубликатов: пустые строки в любом месте матрицы
+
+    python -m pytest -q test_dedup_join.py
+"""
+import numpy as np
+from scipy import sparse
+
+from dedup_join import prefix_matrix
+
+
+def suffix_norms_reference(matrix: sparse.csr_matrix, pruned: sparse.csr_matrix) -> np.ndarray:
+    """Норма отброшенной части каждой строки: |x - префикс|"""
+    dropped = (matrix - pruned).toarray()
+    return np.sqrt((dropped ** 2).sum(axis=1))
+
+
+def test_empty_rows():
+    rng = np.random.default_rng(0)
+    dense = rng.random((6, 8)) * (rng.random((6, 8)) > 0.5)
+    # Пустые строки в начале, в середине и в конце
+    dense[[0, 3, 4, 5]] = 0.0
+    dense[1, 0] = dense[2, 7] = 0.5
+    dense /= np.maximum(np.linalg.norm(dense, axis=1, keepdims=True), 1e-12)
+    matrix = sparse.csr_matrix(dense)
+
+    pruned, suffix_norm = prefix_matrix(matrix, 0.5)
+    assert suffix_norm.shape == (6,)
+    np.testing.assert_allclose(suffix_norm, suffix_norms_reference(matrix, pruned), atol=1e-6)
+    assert (suffix_norm[[0, 3, 4, 5]] == 0.0).all()
+
+
+def test_all_rows_empty():
+    matrix = sparse.csr_matrix((3, 4))
+    pruned, suffix_norm = prefix_matrix(matrix, 0.5)
+    assert pruned.nnz == 0
+    assert (suffix_norm == 0.0).all()
@@ -0,0 +1,35 @@
+"""Пул сопоставления: место занято, пока воркер считает, даже если запрос отменен
+
+    python -m pytest -q test_match_pool.py
+"""
+import asyncio
+import threading
+
+from match_pool import MatchPool
+
+
+def test_cancelled_request_keeps_slot_until_worker_finishes():
+    async def main():
+        pool = MatchPool(kind="thread", workers=1, max_queue=4)
+        release = threading.Event()
+        try:
+            request = asyncio.ensure_future(pool.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+            request.cancel()
+            await asyncio.sleep(0.05)
+            # Клиент отключился, но воркер еще занят: задача учитывается в нагрузке
+            pending_while_running = pool.pending
+            release.set()
+            for _ in range(100):
+                if pool.pending == 0:
+                    break
+                await asyncio.sleep(0.01)
+            return pending_while_running, pool.stats()
+        finally:
+            release.set()
+            pool.shutdown()
+
+    pending_while_running, stats = asyncio.run(main())
+    assert pending_while_running == 1
+    assert stats["pending"] == 0
+    assert stats["completed"] == 1 and stats["failed"] == 0
@@ -0,0 +1,44 @@
+"""Микропакеты: одиночный запрос при простое не ждет окна, одновременные собираются в пакет
+
+    python -m pytest -q test_micro_batch.py
+"""
+import asyncio
+import time
+
+from micro_batch import MicroBatcher
+
+
+def test_idle_request_skips_window():
+    async def handler(items):
+        return [item * 2 for item in items]
+
+    async def main():
+        batcher = MicroBatcher(handler, window_ms=1000, max_batch=32)
+        started = time.monotonic()
+        result = await batcher.submit(21)
+        return result, time.monotonic() - started, batcher.stats()
+
+    result, elapsed, stats = asyncio.run(main())
+    assert result == 42
+    assert elapsed < 0.5
+    assert stats["immediate"] == 1
+
+
+def test_requests_batched_while_busy():
+    sizes = []
+
+    async def handler(items):
+        sizes.append(len(items))
+        await asyncio.sleep(0.05)
+        return [item * 2 for item in items]
+
+    async def main():
+        batcher = MicroBatcher(handler, window_ms=20, max_batch=32)
+        first = asyncio.ensure_future(batcher.submit(0))
+        await asyncio.sleep(0)
+        # Первый пакет считается: следующие запросы ждут окно и уходят одним пакетом
+        rest = [asyncio.ensure_future(batcher.submit(i)) for i in range(1, 6)]
+        return await asyncio.gather(first, *rest)
+
+    assert asyncio.run(main()) == [0, 2, 4, 6, 8, 10]
+    assert sizes == [1, 5]
@@ -1,8 +1,4 @@
-import requests
-import json
-
-# URL сервиса
-url = "http://localhost:8001/check_phrase"
+from phrase_client import PhraseClient, PhraseServiceError
 
 # Тестовые фразы
 test_phrases = [
@@ -19,30 +15,26 @@ thresholds = [0.5, 0.7, 0.8, 0.9, 0.95]
 
 print("Тестирование новой модели paraphrase-multilingual-mpnet-base-v2\n")
 
-for phrase in test_phrases:
+# Все фразы и пороги - одним пакетным запросом
+try:
+    with PhraseClient() as client:
+        results = client.check_many(test_phrases, threshold=thresholds[0], thresholds=thresholds)
+except PhraseServiceError as e:
+    results = [{"error": str(e)}] * len(test_phrases)
+
+for phrase, result in zip(test_phrases, results):
     print(f"Фраза: '{phrase}'")
     
-    for threshold in thresholds:
-        # Подготовка данных запроса
-        data = {
-            "phrase": phrase,
-            "threshold": threshold
-        }
-        
-        # Отправка запроса
-        try:
-            response = requests.post(url, json=data)
-            result = response.json()
-            
-            # Вывод результата
-            print(f"  Порог {threshold:.2f}: ")
-            print(f"    Определено как автоответчик: {result['is_answering_machine']}")
-            print(f"    Similarity score: {result['similarity_score']:.4f}")
-            if result['matched_phrase']:
-                print(f"    Совпадение с фразой: '{result['matched_phrase']}'")
+    if result.get("error"):
+        print(f"  Ошибка при запросе: {result['error']}\n")
+    else:
+        # Вывод результата по каждому порогу
+        for verdict in result["verdicts"]:
+            print(f"  Порог {verdict['threshold']:.2f}: ")
+            print(f"    Определено как автоответчик: {verdict['matched']}")
+            print(f"    Similarity score: {verdict['similarity_score']:.4f}")
+            if verdict['matched_phrase']:
+                print(f"    Совпадение с фразой: '{verdict['matched_phrase']}'")
             print()
-            
-        except Exception as e:
-            print(f"  Ошибка при threshold={threshold}: {e}\n")
     
     print("-" * 80)
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""Регрессия: /similar/batch в main_embeddings (задача пула - functools.partial)
+
+Сервис поднимается в процессе (lifespan + ASGITransport), без внешнего сервера;
+проверка трасс - в отдельном процессе с включенной трассировкой:
+
+    python -m pytest -q test_similar_batch.py
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import httpx
+
+import main_embeddings as service
+
+TEXTS = [
+    "Оставьте сообщение после звукового сигнала",
+    "Абонент временно недоступен",
+    "Алло кто это",
+]
+
+TRACED_ENV = {"TRACE_SAMPLE_RATE": "1", "ADMIN_TOKEN": "trace-test"}
+
+
+async def similar_batch(texts, top_k):
+    async with service.app.router.lifespan_context(service.app):
+        transport = httpx.ASGITransport(app=service.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/similar/batch", json={"texts": texts, "top_k": top_k})
+    response.raise_for_status()
+    return response.json()["results"]
+
+
+def check_results(results, top_k):
+    assert len(results) == len(TEXTS)
+    for result in results:
+        assert "error" not in result, result["error"]
+        assert 0 < len(result["similar_phrases"]) <= top_k
+
+
+def test_similar_batch():
+    check_results(asyncio.run(similar_batch(TEXTS, 3)), 3)
+
+
+async def traced_batch(texts, top_k):
+    """Пакет /similar/batch и трассы из /admin/traces (процесс запущен с TRACED_ENV)"""
+    async with service.app.router.lifespan_context(service.app):
+        transport = httpx.ASGITransport(app=service.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/similar/batch", json={"texts": texts, "top_k": top_k})
+            traces = await client.get("/admin/traces", headers={"X-Admin-Token": TRACED_ENV["ADMIN_TOKEN"]})
+    response.raise_for_status()
+    traces.raise_for_status()
+    return response.json()["results"], traces.json()
+
+
+def test_similar_batch_traced():
+    # traced() оборачивает функции при импорте, только если трассировка включена,
+    # поэтому сервис с TRACE_SAMPLE_RATE=1 запускается в отдельном процессе
+    code = (
+        "import asyncio, json, test_similar_batch as t; "
+        "print(json.dumps(asyncio.run(t.traced_batch(t.TEXTS, 4)), ensure_ascii=False))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], env={**os.environ, **TRACED_ENV}, cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, timeout=600
+    )
+    assert completed.returncode == 0, completed.stderr
+    results, trace = json.loads(completed.stdout.splitlines()[-1])
+    check_results(results, 4)
+
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    # Задача пула - functools.partial: трасса названа по исходной функции
+    assert {event["name"] for event in events if event["cat"] == "task"} == {"find_top_similar_batch"}
+    spans = {event["name"] for event in events if event["cat"] != "task"}
+    assert {"tfidf.transform", "tfidf.cosine", "rerank", "similarity.length_weighted"} <= spans
+    assert trace["otherData"]["sampled"] > 0
+
+
+async def batch_with_full_pool(path, body):
+    """Пакетный запрос, когда все воркеры пула заняты, а очередь нулевая"""
+    async with service.app.router.lifespan_context(service.app):
+        pool = service.runtime.match_pool
+        pool.max_queue = 0
+        release = threading.Event()
+        busy = [asyncio.ensure_future(pool.run(release.wait, 5)) for _ in range(pool.workers)]
+        await asyncio.sleep(0.05)
+        try:
+            transport = httpx.ASGITransport(app=service.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post(path, json=body)
+        finally:
+            release.set()
+            await asyncio.gather(*busy)
+
+
+def test_batch_pool_overloaded_is_503():
+    # Как у одиночного запроса: 503 всего пакета, а не ошибки элементов внутри 200 (клиент повторит)
+    texts = ["переполнение пула первая фраза", "переполнение пула вторая фраза"]
+    response = asyncio.run(batch_with_full_pool("/similar/batch", {"texts": texts, "top_k": 2}))
+    assert response.status_code == 503
+    response = asyncio.run(batch_with_full_pool(
+        "/check_phrase/batch", {"items": [{"phrase": text} for text in texts]}
+    ))
+    assert response.status_code == 503
+
+
+if __name__ == "__main__":
+    check_results(asyncio.run(similar_batch(TEXTS, 3)), 3)
+    print("OK")
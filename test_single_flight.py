@@ -0,0 +1,57 @@
+"""Объединение запросов: срок инициатора не обрывает расчет для присоединившихся
+
+    python -m pytest -q test_single_flight.py
+"""
+import asyncio
+import time
+
+from match_pool import DeadlineExceeded, request_deadline, wait_for_deadline
+from single_flight import SingleFlight
+
+
+async def call(flight: SingleFlight, factory, deadline_ms=None):
+    if deadline_ms is not None:
+        request_deadline.set(time.time() + deadline_ms / 1000.0)
+    return await flight.do("key", factory)
+
+
+def test_mixed_deadlines():
+    async def main():
+        flight = SingleFlight()
+
+        async def compute():
+            # Расчет соблюдает срок своего контекста, как пул сопоставления
+            await wait_for_deadline(asyncio.sleep(0.1))
+            return "result"
+
+        initiator = asyncio.ensure_future(call(flight, compute, 30))
+        await asyncio.sleep(0)
+        no_deadline = asyncio.ensure_future(call(flight, compute))
+        long_deadline = asyncio.ensure_future(call(flight, compute, 1000))
+        short_deadline = asyncio.ensure_future(call(flight, compute, 10))
+        results = await asyncio.gather(initiator, no_deadline, long_deadline, short_deadline, return_exceptions=True)
+        return flight, results
+
+    flight, (initiator, no_deadline, long_deadline, short_deadline) = asyncio.run(main())
+    assert isinstance(initiator, DeadlineExceeded)
+    assert isinstance(short_deadline, DeadlineExceeded)
+    assert no_deadline == "result"
+    assert long_deadline == "result"
+    assert flight.counters["executions"] == 1 and flight.counters["coalesced"] == 3
+
+
+def test_caller_context_unchanged():
+    async def main():
+        flight = SingleFlight()
+        deadline = time.time() + 1.0
+        request_deadline.set(deadline)
+
+        async def compute():
+            return request_deadline.get()
+
+        return await flight.do("key", compute), request_deadline.get() == deadline
+
+    computed_deadline, caller_unchanged = asyncio.run(main())
+    assert computed_deadline is None
+    assert caller_unchanged
+
@@ -0,0 +1,34 @@
+"""Ключ снимка индекса: изменение нормализации текста или стеммера меняет ключ
+
+    python -m pytest -q test_snapshot_key.py
+"""
+import similarity
+from index_snapshot import snapshot_key
+from morphology import RussianStemmer
+
+PHRASES = ["Оставьте сообщение после звукового сигнала", "Абонент временно недоступен"]
+
+
+def key_with_current_normalizer() -> str:
+    similarity.normalizer_fingerprint.cache_clear()
+    try:
+        return snapshot_key(PHRASES, {"normalizer": similarity.normalizer_fingerprint()})
+    finally:
+        similarity.normalizer_fingerprint.cache_clear()
+
+
+def test_key_stable():
+    assert key_with_current_normalizer() == key_with_current_normalizer()
+
+
+def test_key_tracks_normalizer(monkeypatch):
+    original = key_with_current_normalizer()
+    # Например, знаки препинания перестали удаляться
+    monkeypatch.setattr(similarity, "normalize_cached", lambda text: text.lower())
+    assert key_with_current_normalizer() != original
+
+
+def test_key_tracks_stemmer(monkeypatch):
+    original = key_with_current_normalizer()
+    monkeypatch.setattr(RussianStemmer, "stem", staticmethod(lambda word: word[:4]))
+    assert key_with_current_normalizer() != original
@@ -1,25 +1,18 @@
-import requests
-import json
+from phrase_client import PhraseClient, PhraseServiceError
 
-def test_phrase_with_threshold(phrase, threshold):
-    """Тестирует фразу с определенным порогом"""
-    url = "http://localhost:8001/check_phrase"
-    data = {
-        "phrase": phrase,
-        "threshold": threshold
-    }
-    
+client = PhraseClient()
+
+def test_phrases_with_thresholds(phrases, thresholds):
+    """Тестирует пакет фраз сразу с несколькими порогами (пакетный запрос, один расчет на фразу)"""
     try:
-        response = requests.post(url, json=data)
-        if response.status_code == 200:
-            result = response.json()
-            return result
-        else:
-            print(f"Ошибка {response.status_code}: {response.text}")
-            return None
-    except Exception as e:
+        results = client.check_many(phrases, threshold=thresholds[0], thresholds=thresholds)
+        for phrase, result in zip(phrases, results):
+            if result.get("error"):
+                print(f"Ошибка для '{phrase}': {result['error']}")
+        return [result.get("verdicts") for result in results]
+    except PhraseServiceError as e:
         print(f"Ошибка запроса: {e}")
-        return None
+        return [None] * len(phrases)
 
 def main():
     # Тестовые фразы - случайные/несуществующие слова
@@ -38,14 +31,14 @@ def main():
     print("=== ТЕСТИРОВАНИЕ РАЗНЫХ ПОРОГОВ ===")
     print()
     
-    for phrase in test_phrases:
+    for phrase, verdicts in zip(test_phrases, test_phrases_with_thresholds(test_phrases, thresholds)):
         print(f"\nФраза: '{phrase}'")
         print("-" * 60)
         
-        for threshold in thresholds:
-            result = test_phrase_with_threshold(phrase, threshold)
+        for result in verdicts or []:
             if result:
-                is_match = result['is_answering_machine']
+                threshold = result['threshold']
+                is_match = result['matched']
                 score = result['similarity_score']
                 matched = result.get('matched_phrase', 'N/A')
                 
@@ -62,14 +55,14 @@ def main():
         "Я слышу тишину"
     ]
     
-    for phrase in real_phrases:
+    for phrase, verdicts in zip(real_phrases, test_phrases_with_thresholds(real_phrases, [0.7, 0.8, 0.9])):
         print(f"\nФраза: '{phrase}'")
         print("-" * 60)
         
-        for threshold in [0.7, 0.8, 0.9]:
-            result = test_phrase_with_threshold(phrase, threshold)
+        for result in verdicts or []:
             if result:
-                is_match = result['is_answering_machine']
+                threshold = result['threshold']
+                is_match = result['matched']
                 score = result['similarity_score']
                 matched = result.get('matched_phrase', 'N/A')
                 
@@ -77,4 +70,5 @@ def main():
                 print(f"Порог {threshold:4.2f}: {status} | Score: {score:.4f} | Matched: '{matched[:50]}{'...' if len(matched) > 50 else ''}'")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with client:
+        main()
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""Табличная нормализация текста с учетом Unicode
+
+Таблица перевода строится один раз при импорте: она удаляет всю пунктуацию
+Unicode («», —, … и т.п., а не только ASCII из string.punctuation) и заменяет ё на е.
+Нормализация: casefold, перевод по таблице, схлопывание пробельных символов.
+Повторяющиеся строки запросов нормализуются через LRU мемоизацию.
+"""
+import os
+import string
+import sys
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+# Размер LRU кэша нормализованных строк запросов
+NORMALIZE_CACHE_SIZE = int(os.getenv("NORMALIZE_CACHE_SIZE", "65536"))
+
+
+def _build_translate_table() -> Dict[int, object]:
+    """Таблица str.translate: пунктуация и ASCII символы string.punctuation удаляются, ё -> е"""
+    table: Dict[int, object] = {ord(char): None for char in string.punctuation}
+    # Базовой многоязыковой плоскости достаточно для текста расшифровок
+    for code in range(min(sys.maxunicode, 0xFFFF) + 1):
+        if unicodedata.category(chr(code)).startswith("P"):
+            table[code] = None
+    table[ord("ё")] = "е"
+    table[ord("Ё")] = "е"
+    return table
+
+
+TRANSLATE_TABLE = _build_translate_table()
+
+
+def normalize(text: str) -> str:
+    """Нижний регистр, удаление пунктуации, ё -> е, схлопывание пробелов"""
+    return " ".join(text.casefold().translate(TRANSLATE_TABLE).split())
+
+
+# Мемоизированная версия для строк запросов (одни и те же реплики повторяются часто)
+normalize_cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(normalize)
+
+
+def clean_many(texts: Iterable[str]) -> List[str]:
+    """Пакетная нормализация без мемоизации (для построения индекса и пакетов запросов)"""
+    table = TRANSLATE_TABLE
+    return [" ".join(text.casefold().translate(table).split()) for text in texts]
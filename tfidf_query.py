@@ -0,0 +1,89 @@
+"""TF-IDF векторы запросов без scikit-learn
+
+Импорт scikit-learn занимает около секунды (sklearn.utils тянет scipy.stats),
+а при загрузке индекса из снимка он нужен только для transform запросов.
+QueryVectorizer повторяет TfidfVectorizer.transform (анализатор word, n-граммы
+слов, IDF, L2 нормировка) по словарю и IDF снимка, поэтому воркер со снимком
+стартует без scikit-learn. Строки матрицы базы и запросов L2-нормированы,
+так что косинус - это просто скалярное произведение (cosine_scores).
+"""
+import re
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+DEFAULT_TOKEN_PATTERN = r"(?u)\b\w\w+\b"
+
+
+class QueryVectorizer:
+    """Замена обученного TfidfVectorizer для transform запросов"""
+
+    def __init__(self, vocabulary: Dict[str, int], idf: np.ndarray, ngram_range: Tuple[int, int] = (1, 1),
+                 lowercase: bool = True, token_pattern: str = DEFAULT_TOKEN_PATTERN):
+        self.vocabulary_ = vocabulary
+        self.idf_ = np.asarray(idf, dtype=np.float64)
+        self.ngram_range = tuple(ngram_range)
+        self.lowercase = lowercase
+        self._tokenize = re.compile(token_pattern).findall
+
+    @classmethod
+    def from_params(cls, vocabulary: Dict[str, int], idf: np.ndarray, params: Dict[str, object]) -> "QueryVectorizer":
+        """По параметрам TfidfVectorizer; параметры, которые здесь не повторены, - ошибка"""
+        supported = {"analyzer": "word", "stop_words": None, "norm": "l2", "use_idf": True, "sublinear_tf": False}
+        for name, value in params.items():
+            if name in supported and value != supported[name]:
+                raise ValueError(f"QueryVectorizer не поддерживает {name}={value!r}")
+            if name not in supported and name not in ("ngram_range", "lowercase", "token_pattern", "max_features"):
+                raise ValueError(f"QueryVectorizer не поддерживает параметр {name}")
+        return cls(
+            vocabulary, idf,
+            ngram_range=params.get("ngram_range", (1, 1)),
+            lowercase=params.get("lowercase", True),
+            token_pattern=params.get("token_pattern", DEFAULT_TOKEN_PATTERN)
+        )
+
+    def analyze(self, document: str) -> List[str]:
+        """Токены и n-граммы слов в порядке TfidfVectorizer"""
+        if self.lowercase:
+            document = document.lower()
+        tokens = self._tokenize(document)
+        min_n, max_n = self.ngram_range
+        terms = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+            for start in range(len(tokens) - n + 1):
+                terms.append(" ".join(tokens[start:start + n]))
+        return terms
+
+    def transform(self, documents: Iterable[str]) -> sparse.csr_matrix:
+        """L2-нормированная TF-IDF матрица документов"""
+        vocabulary = self.vocabulary_
+        indices: List[int] = []
+        counts: List[float] = []
+        indptr = [0]
+        for document in documents:
+            row: Dict[int, int] = {}
+            for term in self.analyze(document):
+                column = vocabulary.get(term)
+                if column is not None:
+                    row[column] = row.get(column, 0) + 1
+            for column in sorted(row):
+                indices.append(column)
+                counts.append(row[column])
+            indptr.append(len(indices))
+
+        columns = np.asarray(indices, dtype=np.int32)
+        data = np.asarray(counts, dtype=np.float64) * self.idf_[columns]
+        offsets = np.asarray(indptr, dtype=np.int32)
+        # L2 нормировка строк; у пустых строк норма 0, они остаются нулевыми
+        rows = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+        norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=len(offsets) - 1))
+        norms[norms == 0] = 1.0
+        data /= norms[rows]
+        return sparse.csr_matrix((data, columns, offsets), shape=(len(offsets) - 1, len(self.idf_)))
+
+
+def cosine_scores(queries: sparse.csr_matrix, matrix: sparse.csr_matrix) -> np.ndarray:
+    """Косинусы строк запросов со строками базы (обе матрицы L2-нормированы), плотный массив"""
+    return (queries @ matrix.T).toarray()
+
@@ -0,0 +1,184 @@
+"""Выборочная трассировка сопоставления с экспортом в формате Chrome trace
+
+Трассой становится задача пула (один запрос или микропакет): с вероятностью
+TRACE_SAMPLE_RATE задача трассируется, и каждый вызов, отмеченный traced()
+или span(), записывает интервал (имя, начало, конец). Последние
+TRACE_BUFFER_SIZE трасс хранятся в кольцевом буфере, GET /admin/traces отдает
+их в формате trace-event JSON (chrome://tracing, Perfetto).
+
+При TRACE_SAMPLE_RATE=0 (по умолчанию) traced() возвращает функцию без
+обертки, а span() - общий пустой контекст, поэтому выключенная трассировка
+на горячем пути почти ничего не стоит. При MATCH_EXECUTOR=process трассы
+остаются в процессах пула.
+"""
+import functools
+import itertools
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))  # доля трассируемых задач пула, 0 - выключено
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "100"))  # последних трасс в кольцевом буфере
+TRACE_MAX_SPANS = int(os.getenv("TRACE_MAX_SPANS", "20000"))  # интервалов в одной трассе, остальные отбрасываются
+
+NULL_SPAN = nullcontext()
+
+
+class Trace:
+    """Интервалы одной задачи пула"""
+
+    __slots__ = ("trace_id", "name", "args", "thread", "started", "finished", "spans", "dropped")
+
+    def __init__(self, trace_id: int, name: str, args: Dict[str, Any]):
+        self.trace_id = trace_id
+        self.name = name
+        self.args = args
+        self.thread = threading.current_thread().name
+        self.started = time.perf_counter()
+        self.finished = self.started
+        self.spans: List[List[Any]] = []  # [имя, начало, конец]
+        self.dropped = 0
+
+    def open(self, name: str) -> int:
+        """Начало интервала; номер интервала или -1, если трасса заполнена
+        
+        Место занимается при начале, а не при конце интервала: при переполнении
+        отбрасываются вложенные интервалы, а внешние (этапы) остаются в трассе.
+        """
+        if len(self.spans) >= TRACE_MAX_SPANS:
+            self.dropped += 1
+            return -1
+        start = time.perf_counter()
+        self.spans.append([name, start, start])
+        return len(self.spans) - 1
+
+    def close(self, index: int):
+        if index >= 0:
+            self.spans[index][2] = time.perf_counter()
+
+
+class Span:
+    """Интервал внутри трассируемой задачи"""
+
+    __slots__ = ("trace", "name", "index")
+
+    def __init__(self, trace: Trace, name: str):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.index = self.trace.open(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.trace.close(self.index)
+
+
+class Tracer:
+    """Выбор трассируемых задач и кольцевой буфер готовых трасс"""
+
+    def __init__(self, sample_rate: float = TRACE_SAMPLE_RATE, buffer_size: int = TRACE_BUFFER_SIZE):
+        self.sample_rate = sample_rate
+        self.enabled = sample_rate > 0
+        self.traces: Deque[Trace] = deque(maxlen=max(1, buffer_size))
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+        self.counters = {"tasks": 0, "sampled": 0, "dropped_spans": 0}
+
+    def current(self) -> Optional[Trace]:
+        """Трасса задачи, выполняемой в этом потоке (None - задача не трассируется)"""
+        return getattr(self._local, "trace", None)
+
+    def call(self, name: str, func: Callable, *args, **kwargs) -> Any:
+        """func(*args, **kwargs); с вероятностью sample_rate - с записью трассы"""
+        if not self.enabled:
+            return func(*args, **kwargs)
+        self.counters["tasks"] += 1
+        if random.random() >= self.sample_rate or self.current() is not None:
+            return func(*args, **kwargs)
+
+        trace = Trace(next(self._ids), name, {"items": len(args[0]) if args and isinstance(args[0], list) else 1})
+        self._local.trace = trace
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._local.trace = None
+            trace.finished = time.perf_counter()
+            self.counters["sampled"] += 1
+            self.counters["dropped_spans"] += trace.dropped
+            self.traces.append(trace)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sample_rate": self.sample_rate,
+            "buffered": len(self.traces),
+            "buffer_size": self.traces.maxlen,
+            **self.counters,
+        }
+
+    def chrome_trace(self, clear: bool = False) -> Dict[str, Any]:
+        """Трассы буфера в формате trace-event JSON: каждая трасса - отдельная строка (tid)"""
+        traces = list(self.traces)
+        stats = self.stats()
+        if clear:
+            self.traces.clear()
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        for trace in traces:
+            tid = trace.trace_id
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                "args": {"name": f"#{trace.trace_id} {trace.name} ({trace.thread})"}
+            })
+            events.append({
+                "name": trace.name, "cat": "task", "ph": "X", "pid": pid, "tid": tid,
+                "ts": trace.started * 1e6, "dur": (trace.finished - trace.started) * 1e6,
+                "args": {**trace.args, "spans": len(trace.spans), "dropped_spans": trace.dropped}
+            })
+            for name, start, end in trace.spans:
+                events.append({
+                    "name": name, "cat": name.split(".", 1)[0], "ph": "X", "pid": pid, "tid": tid,
+                    "ts": start * 1e6, "dur": (end - start) * 1e6
+                })
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": stats}
+
+
+tracer = Tracer()
+
+
+def task_name(func: Callable) -> str:
+    """Имя задачи пула для трассы: functools.partial - по исходной функции"""
+    func = getattr(func, "func", func)
+    return getattr(func, "__name__", type(func).__name__)
+
+
+def span(name: str):
+    """Контекст интервала name в текущей трассе (пустой, если задача не трассируется)"""
+    if not tracer.enabled:
+        return NULL_SPAN
+    trace = tracer.current()
+    return NULL_SPAN if trace is None else Span(trace, name)
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """Декоратор: вызов функции - интервал name; при выключенной трассировке функция не оборачивается"""
+    def decorate(func: Callable) -> Callable:
+        if not tracer.enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = tracer.current()
+            if trace is None:
+                return func(*args, **kwargs)
+            index = trace.open(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                trace.close(index)
+        return wrapper
+    return decorate